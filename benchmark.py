@@ -0,0 +1,231 @@
+"""
+CS305 Operating Systems - Process Scheduling Simulator
+Benchmark script for the simulator's command-line entry point.
+
+Measures cold-start time of the CLI by launching fresh interpreter
+processes, so import cost is paid on every run exactly as it is for
+batch scripts that call main.py thousands of times.
+
+Also measures memory (peak, retained, top allocation sites) of parsing,
+each algorithm and the CSV export on a generated workload, so memory
+regressions show up in the JSON results.
+
+Also measures parse_input() throughput (rows per second, Process objects
+included) on plain, gzip and xz files.
+
+Usage:
+    python benchmark.py [--runs N] [--memory-processes N] [--parse-rows N] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Cold-start budget for one complete quiet CLI run (interpreter start,
+# imports, argument parsing, logging setup and the four algorithms on the
+# bundled sample input), as batch scripts launch it
+STARTUP_TARGET_MS = 90.0
+
+# Input of the timed CLI run
+STARTUP_INPUT = os.path.join("data", "processes.txt")
+
+# Directory containing main.py
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_command(command, runs=20):
+    """
+    Measure wall-clock time of a command launched as a fresh process.
+    
+    Args:
+        command (list): Command and arguments for subprocess
+        runs (int): Number of timed launches
+    
+    Returns:
+        list: Elapsed times in milliseconds, one per run
+    """
+    # Bytecode caches are always allowed, as on a normal install; with
+    # PYTHONDONTWRITEBYTECODE set every run would recompile main.py and src
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    
+    # Untimed warm-up run so bytecode caches are written before measuring
+    subprocess.run(command, cwd=PROJECT_DIR, env=env, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=False)
+    
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=PROJECT_DIR, env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def benchmark_startup(runs=20):
+    """
+    Measure the wall-clock time of a real CLI run, with a bare interpreter
+    start as the baseline.
+    
+    Args:
+        runs (int): Number of timed launches per command
+    
+    Returns:
+        dict: Median and best timings in milliseconds and whether the best
+            CLI run is within the target
+    """
+    interpreter = measure_command([sys.executable, "-c", "pass"], runs)
+    
+    # A quiet run without export, logging to a scratch file, so the
+    # benchmark does not touch results.csv or simulation.log
+    with tempfile.TemporaryDirectory() as directory:
+        cli = measure_command([sys.executable, "main.py", STARTUP_INPUT, "-q", "--no-export",
+                               "--log-file", os.path.join(directory, "startup.log")], runs)
+    
+    # The target is checked on the fastest launch: scheduler noise only
+    # ever adds time, so best-of-N is the stable figure (as with timeit)
+    best = min(cli)
+    return {
+        "runs": runs,
+        "interpreter_ms": round(statistics.median(interpreter), 2),
+        "cli_run_ms": round(statistics.median(cli), 2),
+        "cli_run_best_ms": round(best, 2),
+        "startup_target_ms": STARTUP_TARGET_MS,
+        "within_target": best <= STARTUP_TARGET_MS,
+    }
+
+
+def benchmark_memory(num_processes=2000, time_quantum=3, seed=0):
+    """
+    Profile memory of each simulator phase on a generated workload.
+    
+    Args:
+        num_processes (int): Processes in the generated workload
+        time_quantum (int): Time Quantum for Round Robin
+        seed (int): Workload seed (fixed, so runs are comparable)
+    
+    Returns:
+        dict: Workload size and per-phase measurements (see MemoryProfiler.report)
+    """
+    from src.experiment import WorkloadParams, generate_workload
+    from src.memory_profile import MemoryProfiler
+    from src.parser import parse_input
+    from src.cli_view import export_to_csv, get_average_waiting_time
+    from src.simulator import ALGORITHM_NAMES, run_algorithm
+    
+    workload = generate_workload(WorkloadParams(num_processes=num_processes), seed)
+    profiler = MemoryProfiler()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "workload.txt")
+        with open(input_path, "w", encoding="utf-8") as file:
+            for p in workload:
+                file.write(f"{p.process_id},{p.arrival_time},{p.burst_time},{p.priority}\n")
+        
+        with profiler.phase("parse_input"):
+            processes = parse_input(input_path)
+        
+        results = {}
+        for algorithm in ALGORITHM_NAMES:
+            phase = "run_" + {"Round Robin": "rr"}.get(algorithm, algorithm.lower())
+            with profiler.phase(phase):
+                gantt_chart, completed = run_algorithm(algorithm, processes, time_quantum)
+            results[algorithm] = (completed, get_average_waiting_time(completed))
+            del gantt_chart
+        
+        with profiler.phase("export_to_csv"):
+            export_to_csv(results, filename=os.path.join(directory, "results.csv"), quiet=True)
+    
+    profiler.stop()
+    return {"processes": num_processes, "time_quantum": time_quantum, "phases": profiler.report()}
+
+
+def benchmark_parse(num_rows=1000000, seed=0):
+    """
+    Measure parsing throughput of a generated input file, plain and compressed.
+    
+    Args:
+        num_rows (int): Rows in the generated file
+        seed (int): Random seed (fixed, so runs are comparable)
+    
+    Returns:
+        dict: Rows and, per format ('txt', 'gz', 'xz'), seconds and rows per second
+    """
+    import gzip
+    import lzma
+    import random
+    from src.parser import parse_input
+    
+    rng = random.Random(seed)
+    lines = [f"P{i},{rng.randint(0, num_rows)},{rng.randint(1, 20)},{rng.randint(1, 5)}\n"
+             for i in range(num_rows)]
+    text = "".join(lines)
+    del lines
+    
+    results = {"rows": num_rows}
+    with tempfile.TemporaryDirectory() as directory:
+        for extension, opener in (("txt", open), ("gz", gzip.open), ("xz", lzma.open)):
+            input_path = os.path.join(directory, f"workload.{extension}")
+            with opener(input_path, "wt", encoding="utf-8") as file:
+                file.write(text)
+            
+            start = time.perf_counter()
+            processes = parse_input(input_path)
+            elapsed = time.perf_counter() - start
+            assert len(processes) == num_rows
+            del processes
+            results[extension] = {"seconds": elapsed, "rows_per_second": num_rows / elapsed}
+    return results
+
+
+def main():
+    """Run the benchmarks and print (and optionally save) the results."""
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling simulator CLI.")
+    parser.add_argument("--runs", type=int, default=20, help="Timed launches per command (default: 20)")
+    parser.add_argument("--memory-processes", type=int, default=2000,
+                        help="Workload size for the memory profile; 0 skips it (default: 2000)")
+    parser.add_argument("--parse-rows", type=int, default=1000000,
+                        help="Rows in the parse throughput test; 0 skips it (default: 1000000)")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    args = parser.parse_args()
+    
+    results = {"startup": benchmark_startup(args.runs)}
+    if args.memory_processes > 0:
+        results["memory"] = benchmark_memory(args.memory_processes)
+    if args.parse_rows > 0:
+        results["parse"] = benchmark_parse(args.parse_rows)
+    
+    startup = results["startup"]
+    status = "OK" if startup["within_target"] else "OVER TARGET"
+    print(f"Interpreter baseline : {startup['interpreter_ms']:.2f} ms")
+    print(f"CLI run (median)     : {startup['cli_run_ms']:.2f} ms")
+    print(f"CLI run (best)       : {startup['cli_run_best_ms']:.2f} ms "
+          f"(target {STARTUP_TARGET_MS:.0f} ms) {status}")
+    
+    if "memory" in results:
+        from src.memory_profile import print_memory_report
+        print(f"\nMemory profile ({results['memory']['processes']} processes):")
+        print_memory_report(results["memory"]["phases"])
+    
+    if "parse" in results:
+        print(f"\nParse throughput ({results['parse']['rows']} rows):")
+        for extension in ("txt", "gz", "xz"):
+            run = results["parse"][extension]
+            print(f"  {extension:<4} {run['seconds']:>8.2f} s  {run['rows_per_second'] / 1e6:>6.2f} M rows/s")
+    
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results written to {args.json_path}")
+    
+    # Non-zero exit code lets CI flag startup regressions
+    return 0 if startup["within_target"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
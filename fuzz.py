@@ -0,0 +1,533 @@
+"""
+CS305 Operating Systems - Process Scheduling Simulator
+Differential fuzz harness for the optimized scheduling engines.
+
+The original run_fcfs, run_sjf, run_priority and run_rr are the reference
+oracles; Lottery, Stride and EDF are checked against plain O(n)-per-decision
+versions (a linear ticket walk, a linear scan for the lowest pass, a linear
+scan for the earliest deadline). Every optimized engine is run on the same randomized and
+adversarial workloads (ties, idle gaps, zero-length bursts, huge bursts)
+and must produce the same Gantt chart and per-process metrics, including
+the FCFS-by-arrival tie-breaking. A failing case is shrunk to a minimal
+counterexample and printed in the input file format.
+
+Usage:
+    python fuzz.py [--cases N] [--seed S] [--engines NAME,...] [--json results.json]
+"""
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+
+from src.model import Process
+from src.scheduler import (run_fcfs, run_sjf, run_priority, run_rr, run_rr_fast, run_lottery, run_stride,
+                           run_edf, priority_tickets, ROUND_SUMMARY_ID, STRIDE1)
+from src.incremental import IncrementalScheduler
+from src.priority_buckets import run_priority_buckets
+from src.metrics_only import run_metrics_only
+from src.io_scheduler import run_io_bursts
+from src.simulator import summarize_run
+
+def _reference_share(processes, quantum, pick):
+    """
+    Proportional-share reference: one slice per quantum, the next process
+    chosen by `pick` from a plain ready list in arrival order.
+    
+    Args:
+        processes (list): Process objects
+        quantum (int): Time Quantum
+        pick (callable): (ready list of [position, pass], tickets) -> index in the ready list
+    
+    Returns:
+        tuple: (gantt_chart, completed)
+    """
+    processes = sorted(copy.deepcopy(processes), key=lambda p: p.arrival_time)
+    tickets = priority_tickets([p.priority for p in processes])
+    strides = [max(1, STRIDE1 // count) for count in tickets]
+    gantt_chart, completed, ready = [], [], []
+    current_time, cursor, global_pass = 0, 0, 0
+    while cursor < len(processes) or ready:
+        while cursor < len(processes) and processes[cursor].arrival_time <= current_time:
+            ready.append([cursor, global_pass + strides[cursor]])
+            cursor += 1
+        if not ready:
+            gantt_chart.append(('IDLE', current_time, processes[cursor].arrival_time))
+            current_time = processes[cursor].arrival_time
+            continue
+        index = pick(ready, tickets)
+        position, global_pass = ready[index]
+        process = processes[position]
+        if process.start_time is None:
+            process.start_time = current_time
+        start = current_time
+        current_time += min(quantum, process.remaining_time)
+        process.remaining_time -= current_time - start
+        gantt_chart.append((process.process_id, start, current_time))
+        if process.remaining_time == 0:
+            ready.pop(index)
+            process.finish_time = current_time
+            process.turnaround_time = current_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+            completed.append(process)
+        else:
+            ready[index][1] += strides[position]
+    return gantt_chart, completed
+
+
+def _reference_lottery(processes, quantum):
+    """Lottery with a linear walk over the ready list for each draw."""
+    draw = random.Random(0).randrange
+    
+    def pick(ready, tickets):
+        # The ready list stays in arrival order, like the Fenwick tree positions
+        ticket = draw(sum(tickets[position] for position, _ in ready))
+        for index, (position, _) in enumerate(ready):
+            if ticket < tickets[position]:
+                return index
+            ticket -= tickets[position]
+    return _reference_share(processes, quantum, pick)
+
+
+def _reference_stride(processes, quantum):
+    """Stride with a linear scan for the lowest pass (ties: earliest arrival)."""
+    def pick(ready, tickets):
+        return min(range(len(ready)), key=lambda index: (ready[index][1], ready[index][0]))
+    return _reference_share(processes, quantum, pick)
+
+
+def _with_deadlines(processes):
+    """
+    Give processes deterministic deadlines derived from their ID, so the
+    reference and the engine (and a shrunk case) see the same ones: tight
+    and often tied, and every fifth process has none.
+    """
+    for process in processes:
+        number = int(process.process_id[1:])
+        process.deadline = None if number % 5 == 0 else \
+            process.arrival_time + process.burst_time + number % 4 * 3
+    return processes
+
+
+def _reference_edf(processes, quantum):
+    """EDF with a linear scan for the earliest deadline at every arrival and completion."""
+    processes = sorted(copy.deepcopy(_with_deadlines(processes)), key=lambda p: p.arrival_time)
+    gantt_chart, completed, ready = [], [], []
+    current_time, cursor = 0, 0
+    while cursor < len(processes) or ready:
+        while cursor < len(processes) and processes[cursor].arrival_time <= current_time:
+            ready.append(cursor)
+            cursor += 1
+        if not ready:
+            gantt_chart.append(('IDLE', current_time, processes[cursor].arrival_time))
+            current_time = processes[cursor].arrival_time
+            continue
+        position = min(ready, key=lambda index: (float('inf') if processes[index].deadline is None
+                                                 else processes[index].deadline, index))
+        process = processes[position]
+        if process.start_time is None:
+            process.start_time = current_time
+        start = current_time
+        current_time += process.remaining_time
+        if cursor < len(processes):
+            current_time = min(current_time, processes[cursor].arrival_time)
+        process.remaining_time -= current_time - start
+        # A process that keeps the CPU across an arrival continues its slice
+        if gantt_chart and gantt_chart[-1][0] == process.process_id and gantt_chart[-1][2] == start:
+            gantt_chart[-1] = (process.process_id, gantt_chart[-1][1], current_time)
+        else:
+            gantt_chart.append((process.process_id, start, current_time))
+        if process.remaining_time == 0:
+            ready.remove(position)
+            process.finish_time = current_time
+            process.turnaround_time = current_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+            completed.append(process)
+    return gantt_chart, completed
+
+
+# Reference oracle per algorithm
+REFERENCES = {
+    'FCFS': lambda processes, quantum: run_fcfs(processes),
+    'SJF': lambda processes, quantum: run_sjf(processes),
+    'Priority': lambda processes, quantum: run_priority(processes),
+    'Round Robin': lambda processes, quantum: run_rr(processes, quantum),
+    'Lottery': _reference_lottery,
+    'Stride': _reference_stride,
+    'EDF': _reference_edf,
+}
+
+# Workload generators, picked round-robin so every shape is covered
+WORKLOAD_KINDS = ('random', 'ties', 'idle_gaps', 'zero_length', 'huge_bursts')
+
+# Upper bound on reference Round Robin slices per case (keeps run_rr fast)
+MAX_REFERENCE_SLICES = 20000
+
+
+def _incremental(algorithm):
+    """Runner for IncrementalScheduler, applying the case's edit (if any)."""
+    def run(processes, quantum, edit):
+        engine = IncrementalScheduler(processes, algorithm)
+        if edit:
+            arrival_time, burst_time, priority = edit
+            return engine.edit(processes[-1].process_id, arrival_time, burst_time, priority)
+        return engine.result()
+    return run
+
+
+def _io_bursts(algorithm):
+    """Runner for the event-driven I/O engine (workloads without I/O bursts)."""
+    def run(processes, quantum, edit):
+        return run_io_bursts(processes, algorithm, quantum)
+    return run
+
+
+def _metrics_only(algorithm):
+    """Runner for the metrics-only engines (input streamed in arrival order)."""
+    def run(processes, quantum, edit):
+        rows = sorted(((p.process_id, p.arrival_time, p.burst_time, p.priority) for p in processes),
+                      key=lambda row: row[1])
+        return run_metrics_only(algorithm, rows, quantum).summary()
+    return run
+
+
+# Optimized engines: name -> (reference algorithm, runner, comparison, applies edits)
+#   exact     - identical Gantt chart and per-process metrics
+#   coalesced - per-process metrics identical; Gantt slices may merge whole
+#               rounds (see run_rr_fast) but must tile the reference exactly
+#   metrics   - summary metrics identical to summarize_run() of the reference
+# Engines that apply edits get the original workload plus the edit; the
+# others get the already edited workload, like the reference.
+ENGINES = {
+    'incremental-fcfs': ('FCFS', _incremental('FCFS'), 'exact', True),
+    'incremental-sjf': ('SJF', _incremental('SJF'), 'exact', True),
+    'incremental-priority': ('Priority', _incremental('Priority'), 'exact', True),
+    'priority-buckets': ('Priority', lambda processes, quantum, edit: run_priority_buckets(processes),
+                         'exact', False),
+    'rr-fast': ('Round Robin', lambda processes, quantum, edit: run_rr_fast(processes, quantum),
+                'coalesced', False),
+    'io-fcfs': ('FCFS', _io_bursts('FCFS'), 'exact', False),
+    'io-sjf': ('SJF', _io_bursts('SJF'), 'exact', False),
+    'io-priority': ('Priority', _io_bursts('Priority'), 'exact', False),
+    'io-rr': ('Round Robin', _io_bursts('Round Robin'), 'exact', False),
+    'metrics-fcfs': ('FCFS', _metrics_only('FCFS'), 'metrics', False),
+    'metrics-sjf': ('SJF', _metrics_only('SJF'), 'metrics', False),
+    'metrics-priority': ('Priority', _metrics_only('Priority'), 'metrics', False),
+    'metrics-rr': ('Round Robin', _metrics_only('Round Robin'), 'metrics', False),
+    'lottery': ('Lottery', lambda processes, quantum, edit: run_lottery(processes, quantum), 'exact', False),
+    'stride': ('Stride', lambda processes, quantum, edit: run_stride(processes, quantum), 'exact', False),
+    'edf': ('EDF', lambda processes, quantum, edit: run_edf(_with_deadlines(processes)), 'exact', False),
+}
+
+
+class Case:
+    """
+    One fuzz case: a workload, a time quantum and an optional edit of the
+    last process (exercises incremental re-simulation).
+    """
+    
+    def __init__(self, rows, quantum, edit=None):
+        """
+        Initialize the case.
+        
+        Args:
+            rows (list): (process_id, arrival_time, burst_time, priority) tuples
+            quantum (int): Time Quantum for Round Robin
+            edit (tuple): (arrival_time, burst_time, priority) for the last process, or None
+        """
+        self.rows = rows
+        self.quantum = quantum
+        self.edit = edit if rows else None
+    
+    def processes(self):
+        """Fresh Process objects for the workload."""
+        return [Process(*row) for row in self.rows]
+    
+    def edited_processes(self):
+        """Fresh Process objects with the edit applied (what the reference sees)."""
+        processes = self.processes()
+        if self.edit:
+            last = processes[-1]
+            last.arrival_time, last.burst_time, last.priority = self.edit
+            last.remaining_time = last.burst_time
+        return processes
+    
+    def size(self):
+        """Rough size used to confirm that shrinking made progress."""
+        return (len(self.rows), sum(abs(a) + abs(b) + abs(p) for _, a, b, p in self.rows),
+                self.quantum, 0 if self.edit is None else 1 + sum(map(abs, self.edit)))
+    
+    def describe(self):
+        """
+        Render the case in the input file format.
+        
+        Returns:
+            str: Comment header plus one line per process
+        """
+        lines = [f"# quantum={self.quantum}" + (f", edit last process to (arrival, burst, priority)={self.edit}"
+                                                if self.edit else "")]
+        lines += [f"{pid},{arrival},{burst},{priority}" for pid, arrival, burst, priority in self.rows]
+        return "\n".join(lines)
+
+
+def generate_case(rng, kind):
+    """
+    Generate one workload of the given kind.
+    
+    Args:
+        rng (random.Random): Seeded generator
+        kind (str): One of WORKLOAD_KINDS
+    
+    Returns:
+        Case: Generated case
+    """
+    n = rng.randint(1, 24)
+    quantum = rng.choice([1, 1, 2, 3, 4, 5, 8])
+    
+    if kind == 'ties':
+        # Few distinct values so arrivals, bursts and priorities collide
+        arrivals = [rng.choice([0, 0, 2, 5]) for _ in range(n)]
+        bursts = [rng.choice([3, 3, 5]) for _ in range(n)]
+        priorities = [rng.choice([1, 1, 2]) for _ in range(n)]
+    elif kind == 'idle_gaps':
+        # Sparse arrivals: the CPU goes idle between groups
+        arrivals, time = [], 0
+        for _ in range(n):
+            time += rng.choice([0, 0, 1, 15, 40])
+            arrivals.append(time)
+        rng.shuffle(arrivals)
+        bursts = [rng.randint(1, 10) for _ in range(n)]
+        priorities = [rng.randint(1, 5) for _ in range(n)]
+    elif kind == 'zero_length':
+        # Zero bursts at the edges: at time 0, at the last arrival, back to back
+        arrivals = [rng.choice([0, rng.randint(0, 20)]) for _ in range(n)]
+        bursts = [rng.choice([0, 0, 1, rng.randint(0, 8)]) for _ in range(n)]
+        priorities = [rng.randint(0, 3) for _ in range(n)]
+    elif kind == 'huge_bursts':
+        # A few very long jobs among short ones; the quantum keeps run_rr affordable
+        arrivals = [rng.randint(0, 1000) for _ in range(n)]
+        bursts = [rng.choice([rng.randint(1, 50), rng.randint(10**5, 10**7)]) for _ in range(n)]
+        priorities = [rng.randint(1, 10) for _ in range(n)]
+        quantum = max(quantum, sum(bursts) // MAX_REFERENCE_SLICES + 1)
+    else:
+        arrivals = [rng.randint(0, 50) for _ in range(n)]
+        bursts = [rng.randint(1, 20) for _ in range(n)]
+        priorities = [rng.randint(1, 5) for _ in range(n)]
+    
+    rows = [(f"P{i + 1}", arrivals[i], bursts[i], priorities[i]) for i in range(n)]
+    edit = None
+    if rng.random() < 0.5:
+        edit = (rng.choice([0, arrivals[-1], rng.randint(0, max(arrivals) + 5)]),
+                rng.choice([bursts[-1], rng.randint(0, 20)]),
+                rng.randint(0, 5))
+    return Case(rows, quantum, edit)
+
+
+def _process_rows(completed):
+    """Per-process metrics in completion order, for comparison."""
+    return [(p.process_id, p.arrival_time, p.burst_time, p.start_time, p.finish_time,
+             p.turnaround_time, p.waiting_time) for p in completed]
+
+
+def _gantt_tiles(reference, candidate):
+    """
+    Check that every candidate slice covers a run of reference slices
+    exactly: same process for ordinary slices, no IDLE inside a
+    ROUND_SUMMARY_ID block.
+    
+    Returns:
+        str: Description of the first mismatch, or None
+    """
+    index = 0
+    for process_id, start, end in candidate:
+        if index >= len(reference) or reference[index][1] != start:
+            return f"candidate slice {(process_id, start, end)} does not start a reference slice"
+        if start == end:
+            if reference[index] != (process_id, start, end):
+                return f"slice {(process_id, start, end)} != reference {reference[index]}"
+            index += 1
+            continue
+        while index < len(reference) and reference[index][2] <= end:
+            ref_id = reference[index][0]
+            if (ref_id == 'IDLE') if process_id == ROUND_SUMMARY_ID else (ref_id != process_id):
+                return f"slice {(process_id, start, end)} covers reference {reference[index]}"
+            last_end = reference[index][2]
+            index += 1
+            if last_end == end:
+                break
+        else:
+            return f"slice {(process_id, start, end)} does not end on a reference boundary"
+    if index != len(reference):
+        return f"reference slices from {reference[index]} are missing"
+    return None
+
+
+def check_case(case, engine):
+    """
+    Run one engine and its reference on a case.
+    
+    Args:
+        case (Case): Workload to run
+        engine (str): Key of ENGINES
+    
+    Returns:
+        str: Description of the first difference, or None if they match
+    """
+    algorithm, runner, comparison, applies_edits = ENGINES[engine]
+    try:
+        expected = REFERENCES[algorithm](case.edited_processes(), case.quantum)
+        if applies_edits:
+            actual = runner(case.processes(), case.quantum, case.edit)
+        else:
+            actual = runner(case.edited_processes(), case.quantum, None)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    
+    if comparison == 'metrics':
+        expected = summarize_run(*expected)
+        return None if actual == expected else f"metrics {actual} != reference {expected}"
+    
+    expected_gantt, expected_completed = expected
+    actual_gantt, actual_completed = actual
+    if _process_rows(actual_completed) != _process_rows(expected_completed):
+        return (f"process metrics {_process_rows(actual_completed)} != "
+                f"reference {_process_rows(expected_completed)}")
+    if comparison == 'exact':
+        return None if list(actual_gantt) == expected_gantt else \
+            f"Gantt {list(actual_gantt)} != reference {expected_gantt}"
+    return _gantt_tiles(expected_gantt, actual_gantt)
+
+
+def _shrink_candidates(case):
+    """Yield smaller variants of a case, most aggressive first."""
+    rows = case.rows
+    
+    # Drop processes (halves first, then one at a time)
+    for chunk in (len(rows) // 2, 1):
+        if chunk:
+            for start in range(0, len(rows), chunk):
+                smaller = rows[:start] + rows[start + chunk:]
+                if smaller:
+                    yield Case(smaller, case.quantum, case.edit)
+    
+    if case.edit:
+        yield Case(rows, case.quantum, None)
+    
+    # Make numbers smaller
+    for i, (pid, arrival, burst, priority) in enumerate(rows):
+        for new in ((pid, 0, burst, priority), (pid, arrival // 2, burst, priority),
+                    (pid, arrival - 1, burst, priority), (pid, arrival, burst // 2, priority),
+                    (pid, arrival, burst - 1, priority), (pid, arrival, burst, 0),
+                    (pid, arrival, burst, priority // 2)):
+            if new != rows[i] and min(new[1:3]) >= 0:
+                yield Case(rows[:i] + [new] + rows[i + 1:], case.quantum, case.edit)
+    
+    for quantum in (1, case.quantum // 2, case.quantum - 1):
+        if 0 < quantum < case.quantum:
+            yield Case(rows, quantum, case.edit)
+    
+    # Renumber IDs so the counterexample reads P1..Pn
+    renumbered = [(f"P{i + 1}",) + row[1:] for i, row in enumerate(rows)]
+    if renumbered != rows:
+        yield Case(renumbered, case.quantum, case.edit)
+
+
+def shrink(case, engine):
+    """
+    Greedily shrink a failing case while it keeps failing.
+    
+    Args:
+        case (Case): Failing case
+        engine (str): Key of ENGINES
+    
+    Returns:
+        tuple: (minimal case, its failure description)
+    """
+    failure = check_case(case, engine)
+    progress = True
+    while progress:
+        progress = False
+        for candidate in _shrink_candidates(case):
+            candidate_failure = check_case(candidate, engine)
+            if candidate_failure and candidate.size() <= case.size():
+                case, failure = candidate, candidate_failure
+                progress = True
+                break
+    return case, failure
+
+
+def run_fuzz(cases=1000, seed=0, engines=tuple(ENGINES)):
+    """
+    Fuzz the engines and shrink the first failure of each.
+    
+    Args:
+        cases (int): Workloads to generate
+        seed (int): Random seed
+        engines (sequence): Keys of ENGINES to check
+    
+    Returns:
+        dict: engine -> {'cases', 'failures', 'counterexample', 'failure'}
+    """
+    rng = random.Random(seed)
+    report = {engine: {'cases': 0, 'failures': 0, 'counterexample': None, 'failure': None}
+              for engine in engines}
+    
+    for index in range(cases):
+        case = generate_case(rng, WORKLOAD_KINDS[index % len(WORKLOAD_KINDS)])
+        for engine in engines:
+            entry = report[engine]
+            entry['cases'] += 1
+            if not check_case(case, engine):
+                continue
+            entry['failures'] += 1
+            if entry['counterexample'] is None:
+                minimal, failure = shrink(copy.deepcopy(case), engine)
+                entry['counterexample'] = minimal.describe()
+                entry['failure'] = failure
+    
+    return report
+
+
+def main():
+    """Run the fuzzer and print (and optionally save) the results."""
+    parser = argparse.ArgumentParser(description="Differential fuzzing of the optimized scheduling engines.")
+    parser.add_argument("--cases", type=int, default=1000, help="Workloads to generate (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--engines", default=",".join(ENGINES),
+                        help=f"Comma-separated engines to check (default: all: {', '.join(ENGINES)})")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    args = parser.parse_args()
+    
+    engines = [name.strip() for name in args.engines.split(",") if name.strip()]
+    unknown = [name for name in engines if name not in ENGINES]
+    if unknown:
+        parser.error(f"Unknown engines: {', '.join(unknown)}")
+    
+    start = time.perf_counter()
+    report = run_fuzz(args.cases, args.seed, engines)
+    elapsed = time.perf_counter() - start
+    
+    failed = False
+    for engine, entry in report.items():
+        status = "OK" if not entry['failures'] else f"{entry['failures']} FAILED"
+        print(f"{engine:<22} {entry['cases']:>6} cases  {status}")
+        if entry['failures']:
+            failed = True
+            print(f"  Minimal counterexample ({entry['failure']}):")
+            for line in entry['counterexample'].splitlines():
+                print(f"    {line}")
+    print(f"Seed {args.seed}, {elapsed:.2f}s")
+    
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as file:
+            json.dump({"seed": args.seed, "engines": report}, file, indent=2)
+        print(f"Results written to {args.json_path}")
+    
+    # Non-zero exit code lets CI flag a divergence
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,40 +7,83 @@ Main entry point for the scheduling simulator.
 Supports both CLI and GUI modes.
 """
 
-import sys
+import argparse
+import contextlib
+import functools
 import logging
 from src.parser import parse_input
-from src.scheduler import run_fcfs, run_sjf, run_priority, run_rr
-from src.cli_view import print_results, calculate_cpu_utilization, get_average_waiting_time, export_to_csv
-from src.gui_view import run_gui
+from src.scheduler import (run_fcfs, run_sjf, run_priority, run_rr, run_rr_fast, run_lottery, run_stride,
+                           run_edf)
+from src.priority_buckets import run_priority_buckets
+from src.io_scheduler import run_io_bursts
+from src.cli_view import (print_results, calculate_cpu_utilization, get_average_waiting_time,
+                          get_deadline_metrics, print_deadline_report, export_to_csv, OUTPUT_MODES,
+                          DEFAULT_TRUNCATE_ROWS)
+from src.log_config import setup_logging, stop_logging, LOG_FORMATS
+from src.simulator import ALGORITHM_NAMES, OPTIONAL_ALGORITHM_NAMES, QUANTUM_ALGORITHMS, parse_algorithms
+from src.workload import prepare_workload
+from src.guardrails import (BudgetExceeded, DEFAULT_MAX_MEMORY_MB, DEFAULT_MAX_SLICES, OVER_LIMIT_ACTIONS,
+                            check_limits, estimate_cost, run_budget)
+from src.experiment import BURST_DISTRIBUTIONS, WorkloadParams, run_experiment, print_experiment_report
+from src.analytics import PERIODS, RESULT_FILES, analyze_results, print_analysis_report
 
-# Configure logging
-logging.basicConfig(
-    filename='simulation.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+# NOTE: src.gui_view (and with it tkinter) is imported only when the GUI is
+# launched, and logging is set up in main() rather than at import time,
+# so CLI runs start fast and `import main` / `import src` have no side effects.
 
 
-def run_cli_mode(file_path, time_quantum=3):
+def run_cli_mode(file_path, time_quantum=3, output_mode='full', quiet=False,
+                 truncate_rows=DEFAULT_TRUNCATE_ROWS, trace_dir=None,
+                 checkpoint_dir=None, checkpoint_interval=60.0, resume=False, fast_rr=False,
+                 algorithms=ALGORITHM_NAMES, export=True, aging_interval=None, profiler=None,
+                 telemetry_path=None, telemetry_window=1, max_slices=None, max_memory=None,
+                 over_limit='refuse', time_budget=None, memory_budget=None, estimate_only=False,
+                 lottery_seed=0):
     """
     Run the simulator in CLI (Command Line Interface) mode.
-    Executes all 4 scheduling algorithms and displays results.
+    Executes the selected scheduling algorithms (all 4 by default) and displays results.
     
     Args:
         file_path (str): Path to the input file
         time_quantum (int): Time Quantum for Round Robin (default: 3)
+        output_mode (str): 'full', 'truncated' or 'summary' (default: 'full')
+        quiet (bool): Skip all terminal rendering, e.g. for batch runs (default: False)
+        truncate_rows (int): Rows kept at each end in 'truncated' mode
+        trace_dir (str): If set, write a binary execution trace per algorithm here
+        checkpoint_dir (str): If set, checkpoint the Round Robin run here periodically
+        checkpoint_interval (float): Seconds between checkpoints (default: 60)
+        resume (bool): Continue Round Robin from its latest checkpoint, if any
+        fast_rr (bool): Skip whole Round Robin rounds; skipped rounds are summarized
+                        in the Gantt chart and checkpoints are not needed
+        algorithms (sequence): Algorithm names to run (default: all)
+        export (bool): Append the results to results.csv (default: True)
+        aging_interval (int): If set, Priority ages waiting processes by one level
+                              per this many time units (bucketed engine)
+        profiler (MemoryProfiler): If set, measure memory of parsing, each run and the export
+        telemetry_path (str): If set, record windowed time series of every run and
+                              write them to this JSON file
+        telemetry_window (int): Initial telemetry window in time units (doubles as needed)
+        max_slices (int): Refuse runs estimated to produce more Gantt chart entries
+        max_memory (int): Refuse runs estimated to need more MiB for their results
+        over_limit (str): 'refuse' or 'metrics-only' (rerun without a Gantt chart)
+                          for runs over max_slices / max_memory
+        time_budget (float): Stop any run that takes longer, in seconds
+        memory_budget (float): Stop any run that grows the process by more MiB
+        estimate_only (bool): Print the pre-flight estimates and stop without running
+        lottery_seed (int): Random seed of Lottery scheduling (default: 0)
     """
     logging.info("CLI mode started")
-    print("\n" + "="*70)
-    print("  CS305 PROCESS SCHEDULING SIMULATOR - CLI MODE")
-    print("="*70)
+    if not quiet:
+        print("\n" + "="*70)
+        print("  CS305 PROCESS SCHEDULING SIMULATOR - CLI MODE")
+        print("="*70)
     
     # Parse input file
-    print(f"\nReading processes from: {file_path}")
+    if not quiet:
+        print(f"\nReading processes from: {file_path}")
     logging.info(f"Reading input file: {file_path}")
-    processes = parse_input(file_path)
+    with profiler.phase("parse_input") if profiler else contextlib.nullcontext():
+        processes = parse_input(file_path)
     
     if not processes:
         logging.error("No processes loaded from input file")
@@ -48,75 +91,579 @@ def run_cli_mode(file_path, time_quantum=3):
         return
     
     logging.info(f"Input file parsed: {len(processes)} processes loaded")
-    print(f"Successfully loaded {len(processes)} processes.\n")
+    if not quiet:
+        print(f"Successfully loaded {len(processes)} processes.\n")
+    
+    # Sorted, copied and indexed once; every engine below shares it read-only
+    workload = prepare_workload(processes)
+    
+    # Processes with CPU/I-O burst sequences block during I/O, which only the
+    # event-driven engine models; it then runs every algorithm
+    has_io = workload.has_io
+    if has_io:
+        logging.info("Workload has I/O bursts - using the event-driven I/O engine")
+    
+    if estimate_only:
+        print_cost_estimates(workload, algorithms, time_quantum, fast_rr, max_slices, max_memory)
+        return
+    
+    # Pre-flight: predict the size of every run and hold back the ones over the limits
+    requested = len(algorithms)
+    metrics_only = []
+    if max_slices or max_memory:
+        for algorithm in list(algorithms):
+            estimate = estimate_cost(workload, algorithm, time_quantum, fast_rr)
+            reasons = check_limits(estimate, max_slices, max_memory)
+            if not reasons:
+                continue
+            algorithms = [name for name in algorithms if name != algorithm]
+            # The streaming engine has no I/O bursts, aging or proportional share,
+            # so those runs can only be refused
+            fallback = (over_limit == 'metrics-only' and not has_io and algorithm in ALGORITHM_NAMES
+                        and not (algorithm == 'Priority' and aging_interval))
+            if fallback:
+                metrics_only.append(algorithm)
+            action = "running metrics-only" if fallback else "refused"
+            logging.warning(f"Algorithm {algorithm} over limits ({', '.join(reasons)}) - {action}")
+            if not quiet:
+                print(f"Pre-flight: {algorithm} would need {' and '.join(reasons)} - {action}.")
+                if not fallback:
+                    print("  Raise --max-slices / --max-memory, or use --over-limit metrics-only.")
     
     # Dictionary to store results for comparison and CSV export
     results = {}
     
-    # Run all 4 scheduling algorithms
-    
-    # 1. First Come First Served (FCFS)
-    logging.info("Algorithm FCFS execution started")
-    gantt_chart, completed = run_fcfs(processes)
-    cpu_util = calculate_cpu_utilization(gantt_chart)
-    avg_wt = get_average_waiting_time(completed)
-    results['FCFS'] = (completed, avg_wt)
-    print_results("FCFS (First Come First Served)", completed, gantt_chart, cpu_util)
-    logging.info(f"Algorithm FCFS execution completed - Avg WT: {avg_wt:.2f}")
-    
-    # 2. Shortest Job First (SJF)
-    logging.info("Algorithm SJF execution started")
-    gantt_chart, completed = run_sjf(processes)
-    cpu_util = calculate_cpu_utilization(gantt_chart)
-    avg_wt = get_average_waiting_time(completed)
-    results['SJF'] = (completed, avg_wt)
-    print_results("SJF (Shortest Job First)", completed, gantt_chart, cpu_util)
-    logging.info(f"Algorithm SJF execution completed - Avg WT: {avg_wt:.2f}")
-    
-    # 3. Priority Scheduling
-    logging.info("Algorithm Priority execution started")
-    gantt_chart, completed = run_priority(processes)
-    cpu_util = calculate_cpu_utilization(gantt_chart)
-    avg_wt = get_average_waiting_time(completed)
-    results['Priority'] = (completed, avg_wt)
-    print_results("Priority Scheduling", completed, gantt_chart, cpu_util)
-    logging.info(f"Algorithm Priority execution completed - Avg WT: {avg_wt:.2f}")
+    # Windowed time series, fed by the engines alongside the trace writer.
+    # Tracing, telemetry and memory profiling are only imported when their
+    # options are used; batch scripts run main.py thousands of times without them
+    telemetry_runs = {}
+    if telemetry_path:
+        from src.telemetry import Telemetry
+        telemetry_runs = {algorithm: Telemetry(processes, telemetry_window) for algorithm in algorithms}
+    
+    # Run the selected scheduling algorithms (all 4 by default). Each run is
+    # (algorithm, trace key, trace label, results title, engine, trace state);
+    # the engine takes the run's recorder and returns (gantt_chart, completed)
+    runs = []
+    
+    # 1-3. FCFS, SJF and Priority (the event-driven engine when processes do I/O)
+    for algorithm, key, title, engine in (
+            ('FCFS', 'fcfs', "FCFS (First Come First Served)", run_fcfs),
+            ('SJF', 'sjf', "SJF (Shortest Job First)", run_sjf),
+            ('Priority', 'priority', "Priority Scheduling", run_priority)):
+        if algorithm not in algorithms:
+            continue
+        if has_io:
+            engine = functools.partial(run_io_bursts, workload, algorithm, time_quantum)
+        elif algorithm == 'Priority' and aging_interval:
+            # Bucketed ready queues; waiting processes gain a level per interval
+            engine = functools.partial(run_priority_buckets, workload, aging_interval)
+            title = f"Priority Scheduling (aging every {aging_interval})"
+        else:
+            engine = functools.partial(engine, workload)
+        runs.append((algorithm, key, algorithm, title, engine, None))
     
     # 4. Round Robin (RR)
-    logging.info(f"Algorithm Round Robin execution started (TQ={time_quantum})")
-    gantt_chart, completed = run_rr(processes, time_quantum)
-    cpu_util = calculate_cpu_utilization(gantt_chart)
-    avg_wt = get_average_waiting_time(completed)
-    results['Round Robin'] = (completed, avg_wt)
-    print_results(f"Round Robin (Time Quantum = {time_quantum})", completed, gantt_chart, cpu_util)
-    logging.info(f"Algorithm Round Robin execution completed - Avg WT: {avg_wt:.2f}")
+    if 'Round Robin' in algorithms:
+        label = f"Round Robin (TQ={time_quantum})"
+        title = f"Round Robin (Time Quantum = {time_quantum})"
+        if has_io:
+            engine = functools.partial(run_io_bursts, workload, 'Round Robin', time_quantum)
+            runs.append(('Round Robin', 'rr', label, title, engine, None))
+        elif fast_rr:
+            # Round skipping is fast enough that checkpoints are not needed
+            engine = functools.partial(run_rr_fast, workload, time_quantum)
+            runs.append(('Round Robin', 'rr', label, title, engine, None))
+        else:
+            checkpointer, resume_state = open_rr_checkpoint(checkpoint_dir, file_path, processes, time_quantum,
+                                                            checkpoint_interval, resume)
+            if resume_state and trace_dir:
+                from src.trace import can_resume_trace
+                if not can_resume_trace(trace_dir, file_path, 'rr', resume_state['trace']):
+                    # Appending to a fresh trace would lose every event before the checkpoint
+                    logging.warning("Round Robin checkpoint has no matching trace in the trace directory; "
+                                    "starting from the beginning")
+                    if not quiet:
+                        print("Note: the Round Robin trace cannot be resumed; starting from the beginning.")
+                    resume_state = None
+            engine = functools.partial(run_rr, workload, time_quantum,
+                                       checkpointer=checkpointer, resume_state=resume_state)
+            runs.append(('Round Robin', 'rr', label, title, engine,
+                         resume_state['trace'] if resume_state else None))
     
-    print("\n" + "="*70)
-    print("  All algorithms completed successfully!")
-    print("="*70)
+    # 5-6. Lottery and Stride (tickets from the priority column), then EDF
+    # (deadlines from the optional deadline column)
+    for algorithm in OPTIONAL_ALGORITHM_NAMES:
+        if algorithm not in algorithms:
+            continue
+        if has_io:
+            logging.warning(f"Algorithm {algorithm} skipped - it does not model I/O bursts")
+            if not quiet:
+                print(f"\n{algorithm} skipped: CPU/I-O burst sequences are not supported.")
+            continue
+        if algorithm == 'EDF':
+            runs.append(('EDF', 'edf', "EDF", "EDF (Earliest Deadline First)",
+                         functools.partial(run_edf, workload), None))
+            continue
+        if algorithm == 'Lottery':
+            engine = functools.partial(run_lottery, workload, time_quantum, seed=lottery_seed)
+        else:
+            engine = functools.partial(run_stride, workload, time_quantum)
+        runs.append((algorithm, algorithm.lower(), f"{algorithm} (TQ={time_quantum})",
+                     f"{algorithm} (Time Quantum = {time_quantum})", engine, None))
+    
+    execute_runs(runs, file_path, time_quantum, results, trace_dir=trace_dir, profiler=profiler,
+                 telemetry_runs=telemetry_runs, time_budget=time_budget, memory_budget=memory_budget,
+                 quiet=quiet, output_mode=output_mode, truncate_rows=truncate_rows)
+    
+    # Runs over the limits: aggregates only, no Gantt chart or per-process results
+    if metrics_only:
+        run_over_limit_metrics(workload, metrics_only, time_quantum, results, quiet)
+    
+    if not quiet:
+        print("\n" + "="*70)
+        if len(results) == requested:
+            print("  All algorithms completed successfully!")
+        else:
+            print(f"  {len(results)} of {requested} algorithms completed (see the messages above)")
+        print("="*70)
+    
+    # Deadline misses and tardiness of every run, if the input has deadlines
+    if workload.has_deadlines:
+        for name, (completed, _) in results.items():
+            if completed is not None:
+                deadline_metrics = get_deadline_metrics(completed)
+                logging.info(f"Algorithm {name} missed {deadline_metrics['missed']} of "
+                             f"{deadline_metrics['deadlines']} deadlines")
+        if not quiet:
+            print_deadline_report(results)
     
     # Smart Recommendation: Find the best algorithm
-    print_smart_recommendation(results)
+    print_smart_recommendation(results, quiet=quiet)
+    
+    # Time series of every run (queue build-up, throughput, utilization)
+    if telemetry_runs:
+        from src.telemetry import write_telemetry
+        write_telemetry(telemetry_runs, telemetry_path)
+        logging.info(f"Telemetry written to {telemetry_path}")
+        if not quiet:
+            print_telemetry_summary(telemetry_runs, telemetry_path)
     
     # Export results to CSV
-    logging.info("Exporting results to CSV")
-    export_to_csv(results, filename="results.csv")
-    logging.info("Results exported successfully")
+    if export:
+        logging.info("Exporting results to CSV")
+        with profiler.phase("export_to_csv") if profiler else contextlib.nullcontext():
+            # Metrics-only runs have no per-process rows to export
+            export_to_csv({name: result for name, result in results.items() if result[0] is not None},
+                          filename="results.csv", quiet=quiet)
+        logging.info("Results exported successfully")
+    
+    if not quiet:
+        print()
+
+
+
+
+def execute_runs(runs, file_path, time_quantum, results, trace_dir=None, profiler=None,
+                 telemetry_runs=None, time_budget=None, memory_budget=None, quiet=False,
+                 output_mode='full', truncate_rows=DEFAULT_TRUNCATE_ROWS):
+    """
+    Run algorithms one after another, each with its own trace, telemetry,
+    memory phase and budget, and collect and print their results.
+    
+    Args:
+        runs (list): (algorithm, trace key, trace label, results title, engine,
+                     trace state) tuples; engine(recorder) returns (gantt_chart, completed)
+                     and a trace state resumes that run's checkpointed trace
+        file_path (str): Input file (names the traces)
+        time_quantum (int): Time Quantum, logged for the quantum-based algorithms
+        results (dict): Algorithm name -> (completed, avg_waiting_time), extended in place
+        trace_dir (str): If set, write a binary execution trace per run here
+        profiler (MemoryProfiler): If set, measure memory of each run
+        telemetry_runs (dict): Algorithm name -> Telemetry for runs that record time series
+        time_budget (float): Stop any run that takes longer, in seconds
+        memory_budget (float): Stop any run that grows the process by more MiB
+        quiet (bool): Only log, print nothing (default: False)
+        output_mode (str): 'full', 'truncated' or 'summary' (default: 'full')
+        truncate_rows (int): Rows kept at each end in 'truncated' mode
+    """
+    if trace_dir:
+        from src.trace import trace_writer_for
+    
+    telemetry_runs = telemetry_runs or {}
+    for algorithm, key, label, title, engine, trace_state in runs:
+        quantum_note = f" (TQ={time_quantum})" if algorithm in QUANTUM_ALGORITHMS else ""
+        logging.info(f"Algorithm {algorithm} execution started{quantum_note}")
+        try:
+            phase = profiler.phase(f"run_{key}") if profiler else contextlib.nullcontext()
+            trace = (trace_writer_for(trace_dir, file_path, key, label, trace_state) if trace_dir
+                     else contextlib.nullcontext())
+            with phase, trace as trace_writer:
+                recorders = [recorder for recorder in (trace_writer, telemetry_runs.get(algorithm),
+                                                       run_budget(time_budget, memory_budget))
+                             if recorder is not None]
+                if len(recorders) > 1:
+                    from src.telemetry import combine_recorders
+                    recorders = [combine_recorders(*recorders)]
+                gantt_chart, completed = engine(recorders[0] if recorders else None)
+        except BudgetExceeded as e:
+            report_budget_stop(algorithm, e, quiet)
+        else:
+            cpu_util = calculate_cpu_utilization(gantt_chart)
+            avg_wt = get_average_waiting_time(completed)
+            results[algorithm] = (completed, avg_wt)
+            if not quiet:
+                print_results(title, completed, gantt_chart, cpu_util,
+                              output_mode=output_mode, truncate_rows=truncate_rows)
+            logging.info(f"Algorithm {algorithm} execution completed - Avg WT: {avg_wt:.2f}")
+
+
+def print_cost_estimates(workload, algorithms, time_quantum, fast_rr, max_slices, max_memory):
+    """
+    Print the pre-flight estimate of every selected run.
+    
+    Args:
+        workload (PreparedWorkload): Workload of the run
+        algorithms (sequence): Algorithm names
+        time_quantum (int): Time Quantum for Round Robin
+        fast_rr (bool): Round Robin skips whole rounds
+        max_slices (int): Slice limit (0 or None: none)
+        max_memory (int): Memory limit in MiB (0 or None: none)
+    """
+    print("="*70)
+    print(f"  PRE-FLIGHT ESTIMATES - {len(workload)} processes")
+    print("="*70)
+    print(f"  {'Algorithm':<14} {'Slices':>16} {'Events':>16} {'Memory MiB':>11}  Limits")
+    for algorithm in algorithms:
+        estimate = estimate_cost(workload, algorithm, time_quantum, fast_rr)
+        slices = f"{'' if estimate.exact else '<= '}{estimate.slices:,}"
+        status = "over" if check_limits(estimate, max_slices, max_memory) else "ok"
+        print(f"  {algorithm:<14} {slices:>16} {estimate.events:>16,} "
+              f"{estimate.memory_bytes / 2**20:>11,.1f}  {status}")
+    print("="*70 + "\n")
+
+
+def run_over_limit_metrics(workload, algorithms, time_quantum, results, quiet=False):
+    """
+    Run algorithms that are over the pre-flight limits in metrics-only mode.
+    
+    Args:
+        workload (PreparedWorkload): Workload of the run (no I/O bursts)
+        algorithms (list): Algorithm names to run
+        time_quantum (int): Time Quantum for Round Robin
+        results (dict): Results of the run, extended with (None, avg_waiting_time) entries
+        quiet (bool): Only log, print nothing (default: False)
+    """
+    from src.metrics_only import run_metrics_only
+    
+    rows = list(zip(workload.ids, workload.arrivals, workload.bursts, workload.priorities))
+    if not quiet:
+        print("\n" + "="*70)
+        print(f"  METRICS-ONLY RUNS (over the pre-flight limits) - {len(rows)} processes")
+        print("="*70)
+        print(f"  {'Algorithm':<14} {'Avg WT':>12} {'Avg TAT':>12} {'CPU Util %':>12}")
+    for algorithm in algorithms:
+        logging.info(f"Algorithm {algorithm} execution started (metrics only)")
+        summary = run_metrics_only(algorithm, rows, time_quantum).summary()
+        results[algorithm] = (None, summary['avg_waiting_time'])
+        if not quiet:
+            print(f"  {algorithm:<14} {summary['avg_waiting_time']:>12.2f} "
+                  f"{summary['avg_turnaround_time']:>12.2f} {summary['cpu_utilization']:>12.2f}")
+        logging.info(f"Algorithm {algorithm} execution completed - "
+                     f"Avg WT: {summary['avg_waiting_time']:.2f}")
+
+
+def report_budget_stop(algorithm, error, quiet=False):
+    """
+    Report a run stopped by its wall-clock or memory budget.
+    
+    Args:
+        algorithm (str): Algorithm name
+        error (BudgetExceeded): The stop, with the progress reached
+        quiet (bool): Only log, print nothing (default: False)
+    """
+    logging.warning(f"Algorithm {algorithm} stopped cleanly: {error} "
+                    f"after {error.slices} slices (simulated time {error.sim_time})")
+    if not quiet:
+        print(f"\n{algorithm} stopped cleanly: {error} after {error.slices:,} slices "
+              f"(simulated time {error.sim_time:,}). Its results are skipped.")
+
+
+def print_telemetry_summary(telemetry_runs, telemetry_path):
+    """
+    Print where each run's ready queue peaked (its worst overload window).
+    
+    Args:
+        telemetry_runs (dict): Algorithm name -> Telemetry
+        telemetry_path (str): File the series were written to
+    """
+    print("\n" + "-"*70)
+    print(f"  Telemetry written to {telemetry_path}")
+    for algorithm, telemetry in telemetry_runs.items():
+        peak = telemetry.peak_window('ready_queue')
+        if peak is None:
+            continue
+        start, end, value = peak
+        print(f"  {algorithm:<14} {len(telemetry.series()['ready_queue'])} windows of {telemetry.window}, "
+              f"peak ready queue {value:.2f} in [{start}, {end})")
+    print("-"*70)
+
+
+def open_rr_checkpoint(checkpoint_dir, file_path, processes, time_quantum, interval, resume):
+    """
+    Set up on-disk checkpoints for the Round Robin run.
+    
+    Args:
+        checkpoint_dir (str): Checkpoint directory; None disables checkpoints
+        file_path (str): Input file (names the checkpoint)
+        processes (list): Parsed workload (fingerprinted so only the same run resumes)
+        time_quantum (int): Time Quantum for Round Robin
+        interval (float): Seconds between checkpoints
+        resume (bool): Load the latest checkpoint for this run
+    
+    Returns:
+        tuple: (Checkpointer or None, saved state or None)
+    """
+    if not checkpoint_dir:
+        return None, None
+    
+    import os
+    from src.checkpoint import Checkpointer, workload_fingerprint
+    
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    checkpointer = Checkpointer(
+        os.path.join(checkpoint_dir, f"{stem}_rr.ckpt"),
+        workload_fingerprint(processes, 'Round Robin', time_quantum),
+        interval
+    )
+    
+    resume_state = checkpointer.load() if resume else None
+    if resume_state:
+        logging.info(f"Resuming Round Robin from checkpoint at t={resume_state['current_time']}")
+    elif resume:
+        logging.info("No matching Round Robin checkpoint found; starting from the beginning")
+    return checkpointer, resume_state
+
+
+def run_replay_mode(trace_path, output_mode='full', truncate_rows=DEFAULT_TRUNCATE_ROWS):
+    """
+    Re-render a recorded execution trace in the terminal.
+    
+    Args:
+        trace_path (str): Trace file written with --trace-dir
+        output_mode (str): 'full', 'truncated' or 'summary'
+        truncate_rows (int): Slices kept at each end in 'truncated' mode
+    """
+    from src.trace import TraceReader
+    from src.cli_view import print_gantt_chart
+    
+    logging.info(f"Replaying trace: {trace_path}")
+    try:
+        reader = TraceReader(trace_path)
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot read trace file. {e}")
+        return
+    
+    with reader:
+        print("\n" + "="*70)
+        print(f"  TRACE REPLAY - {reader.algorithm or 'unknown algorithm'}")
+        print("="*70)
+        
+        if output_mode != 'summary':
+            limit = truncate_rows if output_mode == 'truncated' else None
+            print("\nGantt Chart:")
+            print_gantt_chart(reader.iter_gantt(), limit=limit)
+        
+        stats = reader.summary()
+        print(f"\n  Slices: {stats['slices']}  Completed processes: {stats['completed']}  "
+              f"Makespan: {stats['makespan']}")
+        print(f"\nCPU Utilization: {stats['cpu_utilization']:.2f}%")
+        print("="*70 + "\n")
+
+
+def run_batch_mode(pattern, time_quantum, args):
+    """
+    Run the simulator over every workload file matching a directory or glob.
     
-    print()
+    Args:
+        pattern (str): Directory or glob pattern selecting input files
+        time_quantum (int): Time Quantum for Round Robin
+        args (argparse.Namespace): Parsed arguments (algorithms, workers, limits, quiet)
+    """
+    from src.batch import run_batch
+    
+    try:
+        algorithms = parse_algorithms(args.algorithms)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    
+    logging.info(f"Batch mode started: {pattern} ({', '.join(algorithms)})")
+    summary = run_batch(pattern, algorithms, time_quantum, workers=args.workers,
+                        max_in_flight=args.max_in_flight, quiet=args.quiet)
+    if summary:
+        logging.info(f"Batch mode completed: {summary.files} files, {summary.failed} failed")
+
+
+def run_metrics_mode(file_path, time_quantum, args):
+    """
+    Run the selected algorithms keeping only summary metrics.
+    The input file is streamed once per algorithm and no Gantt chart or
+    per-process results are kept, so memory stays flat for huge workloads.
+    
+    Args:
+        file_path (str): Path to the input file (sorted by arrival time)
+        time_quantum (int): Time Quantum for Round Robin
+        args (argparse.Namespace): Parsed arguments (algorithms, quiet)
+    """
+    from src.metrics_only import run_metrics_only
+    from src.parser import iter_input
+    
+    try:
+        algorithms = parse_algorithms(args.algorithms)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    
+    logging.info(f"Metrics-only mode started: {file_path} ({', '.join(algorithms)})")
+    results = {}
+    summaries = {}
+    
+    for algorithm in algorithms:
+        logging.info(f"Algorithm {algorithm} execution started (metrics only)")
+        try:
+            metrics = run_metrics_only(algorithm, iter_input(file_path), time_quantum)
+        except FileNotFoundError:
+            print(f"Error: File '{file_path}' not found!")
+            return
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        
+        if not metrics.processes:
+            logging.error("No processes loaded from input file")
+            print("Error: No processes loaded. Exiting.")
+            return
+        
+        summaries[algorithm] = metrics.summary()
+        results[algorithm] = (None, summaries[algorithm]['avg_waiting_time'])
+        logging.info(f"Algorithm {algorithm} execution completed - "
+                     f"Avg WT: {summaries[algorithm]['avg_waiting_time']:.2f}")
+    
+    if not args.quiet:
+        print("\n" + "="*70)
+        print(f"  METRICS-ONLY MODE - {metrics.processes} processes")
+        print("="*70)
+        print(f"  {'Algorithm':<14} {'Avg WT':>12} {'Avg TAT':>12} {'CPU Util %':>12}")
+        for algorithm, summary in summaries.items():
+            print(f"  {algorithm:<14} {summary['avg_waiting_time']:>12.2f} "
+                  f"{summary['avg_turnaround_time']:>12.2f} {summary['cpu_utilization']:>12.2f}")
+    
+    # Per-process CSV export needs the full results, so it is skipped here
+    print_smart_recommendation(results, quiet=args.quiet)
+
 
+def run_recommend_mode(file_path, time_quantum, args):
+    """
+    Find only the algorithm with the lowest average waiting time.
+    The candidates run interleaved on the metrics-only engines, and each one
+    is cut off once the waiting time it has already accrued shows it cannot
+    beat the winner, so losing runs stop early.
+    
+    Args:
+        file_path (str): Path to the input file
+        time_quantum (int): Time Quantum for Round Robin
+        args (argparse.Namespace): Parsed arguments (algorithms, quiet)
+    """
+    import time
+    from src.metrics_only import compare_metrics_only
+    
+    try:
+        algorithms = parse_algorithms(args.algorithms)
+        workload = prepare_workload(parse_input(file_path))
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found!")
+        return
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    
+    if not workload:
+        logging.error("No processes loaded from input file")
+        print("Error: No processes loaded. Exiting.")
+        return
+    
+    logging.info(f"Recommendation started: {file_path} ({', '.join(algorithms)})")
+    rows = list(zip(workload.ids, workload.arrivals, workload.bursts, workload.priorities,
+                    workload.io_bursts))
+    start = time.perf_counter()
+    try:
+        finished, pruned = compare_metrics_only(rows, algorithms, time_quantum)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    elapsed = time.perf_counter() - start
+    
+    for algorithm, bound in pruned.items():
+        logging.info(f"Algorithm {algorithm} pruned - Avg WT at least {bound:.2f}")
+    logging.info(f"Recommendation completed in {elapsed:.2f}s")
+    
+    # Same order as the full comparison, so ties are reported the same way
+    results = {algorithm: (None, finished[algorithm].summary()['avg_waiting_time'])
+               for algorithm in algorithms if algorithm in finished}
+    if not args.quiet:
+        print(f"\n{len(workload)} processes, {len(pruned)} of {len(algorithms)} candidates "
+              f"pruned ({elapsed:.2f}s)")
+    print_smart_recommendation(results, quiet=args.quiet, pruned=pruned)
 
 
+def run_experiment_mode(time_quantum, args):
+    """
+    Run a Monte Carlo experiment over seeded random workloads.
+    
+    Args:
+        time_quantum (int): Time Quantum for Round Robin
+        args (argparse.Namespace): Parsed arguments (experiment options, algorithms, workers)
+    """
+    try:
+        algorithms = parse_algorithms(args.algorithms)
+        params = WorkloadParams(
+            num_processes=args.processes,
+            mean_interarrival=args.mean_interarrival,
+            mean_burst=args.mean_burst,
+            burst_distribution=args.burst_dist,
+            priority_levels=args.priority_levels
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    
+    logging.info(f"Experiment started: runs={args.runs}, seed={args.seed}, algorithms={', '.join(algorithms)}")
+    report = run_experiment(params, runs=args.runs, seed=args.seed, algorithms=algorithms,
+                            time_quantum=time_quantum, workers=args.workers,
+                            confidence=args.confidence, early_stop=not args.no_early_stop)
+    print_experiment_report(report, confidence=args.confidence)
+    logging.info(f"Experiment completed: {report['trials']} workloads, stopped early: {report['stopped_early']}")
+
 
-def print_smart_recommendation(results):
+def print_smart_recommendation(results, quiet=False, pruned=None):
     """
     Analyze and recommend the best algorithm based on average waiting time.
     
     Args:
         results (dict): Dictionary mapping algorithm names to (processes, avg_waiting_time)
+        quiet (bool): Only log the winner, print nothing (default: False)
+        pruned (dict): Algorithms cut off early -> lower bound on their average
+                       waiting time (see run_recommend_mode)
     """
     if not results:
         return
+    pruned = pruned or {}
+    
+    if quiet:
+        best_name, (_, best_avg_wt) = min(results.items(), key=lambda x: x[1][1])
+        logging.info(f"Best algorithm: {best_name} with avg WT: {best_avg_wt:.2f}")
+        return
     
     print("\n" + "="*70)
     print("  SMART RECOMMENDATION - ALGORITHM COMPARISON")
@@ -126,6 +673,8 @@ def print_smart_recommendation(results):
     print("\nAverage Waiting Times:")
     for algo_name, (_, avg_wt) in results.items():
         print(f"  • {algo_name:<20} : {avg_wt:.2f} time units")
+    for algo_name, bound in pruned.items():
+        print(f"  • {algo_name:<20} : >= {bound:.2f} time units (pruned)")
     
     # Find the best algorithm (lowest average waiting time)
     best_algorithm = min(results.items(), key=lambda x: x[1][1])
@@ -143,35 +692,319 @@ def print_smart_recommendation(results):
     logging.info(f"Best algorithm: {best_name} with avg WT: {best_avg_wt:.2f}")
 
 
+def run_analyze_mode(file_paths, args):
+    """
+    Aggregate historical results files by algorithm, workload and time range.
+    
+    Args:
+        file_paths (list): Results CSV files; empty for results.csv and gui_results.csv
+        args (argparse.Namespace): Parsed arguments (group_by, period, since, until)
+    """
+    import os
+    import time
+    
+    if not file_paths:
+        file_paths = [path for path in RESULT_FILES if os.path.exists(path)]
+        if not file_paths:
+            print(f"Error: No results files found ({', '.join(RESULT_FILES)})")
+            return
+    
+    group_by = tuple(field.strip() for field in args.group_by.split(',') if field.strip())
+    logging.info(f"Analysis started: {', '.join(file_paths)} (by {', '.join(group_by)})")
+    start = time.perf_counter()
+    try:
+        analyzer = analyze_results(file_paths, group_by, args.period, since=args.since, until=args.until)
+    except FileNotFoundError as e:
+        print(f"Error: File '{e.filename}' not found!")
+        return
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    elapsed = time.perf_counter() - start
+    
+    print_analysis_report(analyzer, elapsed)
+    logging.info(f"Analysis completed: {analyzer.rows} rows, {analyzer.runs} runs in {elapsed:.2f}s")
+
+
+def build_arg_parser():
+    """
+    Build the command-line argument parser.
+    
+    Returns:
+        argparse.ArgumentParser: Parser for CLI arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="CS305 Process Scheduling Simulator. "
+                    "Run without arguments to launch the GUI."
+    )
+    parser.add_argument("file_path", nargs="?",
+                        help="Input file with processes (omit to launch the GUI)")
+    parser.add_argument("time_quantum", nargs="?",
+                        help="Time Quantum for Round Robin (default: 3)")
+    parser.add_argument("--quantum", type=int, default=None,
+                        help="Time Quantum for Round Robin (alternative to the positional argument)")
+    parser.add_argument("--output", choices=OUTPUT_MODES, default="full",
+                        help="Output mode: full chart/table, truncated head/tail, or summary only")
+    parser.add_argument("--rows", type=int, default=DEFAULT_TRUNCATE_ROWS,
+                        help=f"Rows shown at each end in truncated mode (default: {DEFAULT_TRUNCATE_ROWS})")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="Skip all terminal rendering (results are still logged and exported)")
+    parser.add_argument("--no-export", action="store_true",
+                        help="Do not append the results to results.csv")
+    parser.add_argument("--telemetry", metavar="FILE",
+                        help="Write windowed time series (ready-queue length, in-flight count, "
+                             "throughput, utilization) of every run to this JSON file")
+    parser.add_argument("--telemetry-window", type=int, default=1, metavar="N",
+                        help="Initial telemetry window in time units; it doubles so that a run "
+                             "fits in 512 windows (default: 1)")
+    parser.add_argument("--max-slices", type=int, default=DEFAULT_MAX_SLICES, metavar="N",
+                        help="Pre-flight limit: runs estimated to produce more Gantt chart "
+                             f"entries are refused (0 = no limit, default: {DEFAULT_MAX_SLICES:,})")
+    parser.add_argument("--max-memory", type=int, default=DEFAULT_MAX_MEMORY_MB, metavar="MB",
+                        help="Pre-flight limit on the estimated memory of a run's results "
+                             f"(0 = no limit, default: {DEFAULT_MAX_MEMORY_MB})")
+    parser.add_argument("--over-limit", choices=OVER_LIMIT_ACTIONS, default='refuse',
+                        help="What to do with runs over the pre-flight limits: refuse them, or run "
+                             "them without a Gantt chart like --metrics-only (default: refuse)")
+    parser.add_argument("--estimate", action="store_true",
+                        help="Print the pre-flight estimate (slices, events, memory) of each run and exit")
+    parser.add_argument("--time-budget", type=float, metavar="SECONDS",
+                        help="Stop any single run cleanly after this many seconds")
+    parser.add_argument("--memory-budget", type=float, metavar="MB",
+                        help="Stop any single run cleanly once it has grown the process by this many MB")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="Measure peak/retained memory and top allocation sites of parsing, "
+                             "each algorithm and the export (tracemalloc; slower)")
+    
+    # Execution trace options
+    parser.add_argument("--trace-dir",
+                        help="Write a compact binary execution trace per algorithm to this directory")
+    parser.add_argument("--replay", metavar="TRACE",
+                        help="Re-render a recorded trace file instead of running a simulation")
+    
+    # Checkpoint options
+    parser.add_argument("--checkpoint-dir",
+                        help="Periodically checkpoint the Round Robin run to this directory")
+    parser.add_argument("--checkpoint-interval", type=float, default=60.0,
+                        help="Seconds between checkpoints (default: 60)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue Round Robin from the latest checkpoint in --checkpoint-dir")
+    parser.add_argument("--aging", type=int, default=None, metavar="INTERVAL",
+                        help="Priority: waiting processes gain one priority level every INTERVAL "
+                             "time units, preventing starvation")
+    parser.add_argument("--fast-rr", action="store_true",
+                        help="Round Robin skips whole rounds when nothing arrives or finishes; "
+                             "skipped rounds appear as one ROUNDS slice in the Gantt chart")
+    
+    # Metrics-only options
+    parser.add_argument("--metrics-only", action="store_true",
+                        help="Stream the input and keep only summary metrics (no Gantt chart, "
+                             "process table or CSV export); input must be sorted by arrival time")
+    parser.add_argument("--recommend", action="store_true",
+                        help="Only find the algorithm with the lowest average waiting time, "
+                             "cutting off candidates that can no longer win (metrics-only engines)")
+    
+    # Batch options
+    parser.add_argument("--batch", action="store_true",
+                        help="Treat file_path as a directory or glob and evaluate every matching file")
+    parser.add_argument("--algorithms", default="all",
+                        help="Comma-separated algorithms to run, e.g. rr,sjf: fcfs, sjf, priority, rr, "
+                             "lottery, stride, edf; 'all' is the first four (default: all)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Batch/experiment/service mode: worker processes (default: CPU count)")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="Batch mode: maximum files queued in the pool at once (default: 2 x workers)")
+    
+    # HTTP service options
+    parser.add_argument("--serve", action="store_true",
+                        help="Run a local HTTP simulation service (POST /simulate, GET /health)")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Service: interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8305,
+                        help="Service: TCP port (default: 8305)")
+    parser.add_argument("--cache-size", type=int, default=256,
+                        help="Service: cached algorithm results to keep (default: 256)")
+    
+    # Monte Carlo experiment options
+    parser.add_argument("--experiment", action="store_true",
+                        help="Compare algorithms over many seeded random workloads (no input file)")
+    parser.add_argument("--runs", type=int, default=1000,
+                        help="Experiment: maximum number of workloads (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed of experiments (reproducible for any --workers) and of "
+                             "Lottery scheduling (default: 0)")
+    parser.add_argument("--processes", type=int, default=50,
+                        help="Experiment: processes per workload (default: 50)")
+    parser.add_argument("--mean-interarrival", type=float, default=4.0,
+                        help="Experiment: mean time between arrivals (default: 4.0)")
+    parser.add_argument("--mean-burst", type=float, default=6.0,
+                        help="Experiment: mean burst time (default: 6.0)")
+    parser.add_argument("--burst-dist", choices=BURST_DISTRIBUTIONS, default="exponential",
+                        help="Experiment: burst time distribution (default: exponential)")
+    parser.add_argument("--priority-levels", type=int, default=5,
+                        help="Experiment: priorities drawn from 1..N (default: 5)")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="Experiment: confidence level of the intervals (default: 0.95)")
+    parser.add_argument("--no-early-stop", action="store_true",
+                        help="Experiment: run all workloads even after the intervals separate")
+    
+    # Results analysis options
+    parser.add_argument("--analyze", nargs="*", metavar="FILE",
+                        help="Aggregate exported results files (default: results.csv and gui_results.csv)")
+    parser.add_argument("--group-by", default="algorithm,workload",
+                        help="Analysis: comma-separated fields from algorithm, workload, period "
+                             "(default: algorithm,workload)")
+    parser.add_argument("--period", choices=PERIODS, default="day",
+                        help="Analysis: time bucket for the period field (default: day)")
+    parser.add_argument("--since", metavar="TIMESTAMP",
+                        help="Analysis: only runs at or after this time, e.g. 2025-12-19 or '2025-12-19 18:30'")
+    parser.add_argument("--until", metavar="TIMESTAMP",
+                        help="Analysis: only runs at or before this time (a date includes the whole day)")
+    
+    # Logging options
+    parser.add_argument("--log-file", default="simulation.log",
+                        help="Log file path (default: simulation.log)")
+    parser.add_argument("--log-format", choices=LOG_FORMATS, default="text",
+                        help="Log as classic text lines or JSON lines with run ID and timing fields")
+    parser.add_argument("--log-level", choices=["INFO", "DEBUG"], default="INFO",
+                        help="DEBUG also records per-slice scheduler events")
+    parser.add_argument("--log-max-bytes", type=int, default=0,
+                        help="Rotate the log file at this size in bytes (default: 0, no rotation)")
+    parser.add_argument("--log-backups", type=int, default=3,
+                        help="Rotated log files to keep (default: 3)")
+    parser.add_argument("--log-sample-rate", type=float, default=1.0,
+                        help="Fraction of DEBUG scheduler events to keep, 0.0-1.0 (default: 1.0)")
+    return parser
+
+
 def main():
     """
     Main function - Entry point of the application.
     Determines whether to run in CLI or GUI mode based on command-line arguments.
     """
+    parser = build_arg_parser()
+    args = parser.parse_intermixed_args()
+    if not 0.0 <= args.log_sample_rate <= 1.0:
+        parser.error("--log-sample-rate must be between 0.0 and 1.0")
+    if args.rows < 0:
+        parser.error("--rows must be 0 or positive")
+    if args.runs <= 0:
+        parser.error("--runs must be positive")
+    if not 0.0 < args.confidence < 1.0:
+        parser.error("--confidence must be between 0.0 and 1.0 (exclusive)")
+    if (args.workers is not None and args.workers < 1) or \
+            (args.max_in_flight is not None and args.max_in_flight < 1):
+        parser.error("--workers and --max-in-flight must be at least 1")
+    if args.resume and not args.checkpoint_dir:
+        parser.error("--resume requires --checkpoint-dir")
+    if args.aging is not None and args.aging <= 0:
+        parser.error("--aging must be a positive number of time units")
+    if args.telemetry_window <= 0:
+        parser.error("--telemetry-window must be a positive number of time units")
+    if args.telemetry and args.checkpoint_dir:
+        parser.error("--telemetry cannot be combined with --checkpoint-dir")
+    if args.max_slices < 0 or args.max_memory < 0:
+        parser.error("--max-slices and --max-memory must be 0 (no limit) or positive")
+    if (args.time_budget is not None and args.time_budget <= 0) or \
+            (args.memory_budget is not None and args.memory_budget <= 0):
+        parser.error("--time-budget and --memory-budget must be positive")
+    
+    # Log writes happen on background threads; stop_logging() flushes them on exit
+    log_listener = setup_logging(
+        filename=args.log_file,
+        log_format=args.log_format,
+        level=getattr(logging, args.log_level),
+        max_bytes=args.log_max_bytes,
+        backup_count=args.log_backups,
+        sample_rate=args.log_sample_rate
+    )
+    try:
+        run_app(args)
+    finally:
+        stop_logging(log_listener)
+
+
+def run_app(args):
+    """
+    Run CLI or GUI mode for parsed command-line arguments.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments from build_arg_parser()
+    """
     logging.info("Application started")
-    # Check if user provided command-line arguments
-    if len(sys.argv) > 1:
+    
+    # Time quantum: --quantum wins over the positional argument
+    time_quantum = 3  # Default value
+    if args.quantum is not None:
+        time_quantum = args.quantum
+    elif args.time_quantum is not None:
+        try:
+            time_quantum = int(args.time_quantum)
+        except ValueError:
+            print("Error: Time Quantum must be an integer. Using default value 3.")
+    if time_quantum <= 0:
+        logging.error(f"Invalid time quantum: {time_quantum}")
+        print("Error: Time Quantum must be greater than 0.")
+        return
+    
+    if args.serve:
+        # Service Mode: simulations over HTTP for other tools
+        # Example: python main.py --serve --port 8305 --workers 4
+        from src.service import run_service
+        run_service(args.host, args.port, workers=args.workers, cache_size=args.cache_size)
+    elif args.replay:
+        # Replay Mode: re-render a recorded run without simulating it again
+        # Example: python main.py --replay traces/processes_rr.sct --output truncated
+        run_replay_mode(args.replay, output_mode=args.output, truncate_rows=args.rows)
+    elif args.analyze is not None:
+        # Analysis Mode: aggregate historical results, no simulation
+        # Example: python main.py --analyze --group-by algorithm,period --period month
+        run_analyze_mode(args.analyze, args)
+    elif args.experiment:
+        # Experiment Mode: random workloads, no input file needed
+        # Example: python main.py --experiment --runs 2000 --seed 42 --processes 100
+        run_experiment_mode(time_quantum, args)
+    elif args.file_path:
         # CLI Mode: User provided input file path and optional time quantum
-        # Usage: python main.py data/processes.txt [time_quantum]
-        # Example: python main.py data/processes.txt 4
-        file_path = sys.argv[1]
-        
-        # Check if time quantum is provided as second argument
-        if len(sys.argv) > 2:
-            try:
-                time_quantum = int(sys.argv[2])
-            except ValueError:
-                print("Error: Time Quantum must be an integer. Using default value 3.")
-                time_quantum = 3
+        # Usage: python main.py data/processes.txt [time_quantum] [--output MODE] [--quiet]
+        # Example: python main.py data/processes.txt 4 --output truncated
+        if args.batch:
+            run_batch_mode(args.file_path, time_quantum, args)
+        elif args.metrics_only:
+            run_metrics_mode(args.file_path, time_quantum, args)
+        elif args.recommend:
+            run_recommend_mode(args.file_path, time_quantum, args)
         else:
-            time_quantum = 3  # Default value
-        
-        run_cli_mode(file_path, time_quantum)
+            try:
+                algorithms = parse_algorithms(args.algorithms)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return
+            profiler = None
+            if args.profile_memory:
+                from src.memory_profile import MemoryProfiler, print_memory_report
+                profiler = MemoryProfiler()
+            run_cli_mode(args.file_path, time_quantum, output_mode=args.output,
+                         quiet=args.quiet, truncate_rows=args.rows, trace_dir=args.trace_dir,
+                         checkpoint_dir=args.checkpoint_dir, checkpoint_interval=args.checkpoint_interval,
+                         resume=args.resume, fast_rr=args.fast_rr,
+                         algorithms=algorithms, export=not args.no_export,
+                         aging_interval=args.aging, profiler=profiler,
+                         telemetry_path=args.telemetry, telemetry_window=args.telemetry_window,
+                         max_slices=args.max_slices, max_memory=args.max_memory,
+                         over_limit=args.over_limit, time_budget=args.time_budget,
+                         memory_budget=args.memory_budget, estimate_only=args.estimate,
+                         lottery_seed=args.seed)
+            if profiler:
+                profiler.stop()
+                if not args.quiet:
+                    print_memory_report(profiler.report())
     else:
         # GUI Mode: No arguments provided
         # Usage: python main.py
         print("No command-line arguments detected.")
         print("Launching GUI mode...\n")
+        from src.gui_view import run_gui
         run_gui()
 
 
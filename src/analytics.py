@@ -0,0 +1,336 @@
+# Streaming analytics over exported results files
+# results.csv (CLI) and gui_results.csv (GUI) grow by one block of rows per
+# run and algorithm:
+#   Timestamp,Algorithm,Process_ID,Arrival,Burst,Priority,Finish,Turnaround,Waiting
+# The rows of one algorithm in one run are contiguous, so a run is detected
+# as a change of (timestamp, algorithm) and reduced to a few sums the moment
+# it ends; nothing else is kept. Files are read in large blocks: a block of
+# well-formed rows is split into columns at once and summed per run with
+# builtins, other blocks (headers, blank lines, older 7-column rows without
+# timestamp and priority, summary tables) are parsed row by row.
+#
+# A workload is identified by a hash of its process, arrival, burst and
+# priority columns, so runs of the same input file group together whatever
+# the file was called. Each column is hashed as its own stream, which gives
+# the same digest however the rows are split into blocks.
+
+import csv
+import hashlib
+import itertools
+import operator
+
+from src.parser import BULK_CHUNK_CHARS, open_input
+
+# Files analyzed when none are given
+RESULT_FILES = ('results.csv', 'gui_results.csv')
+
+# Fields the runs can be grouped by
+GROUP_FIELDS = ('algorithm', 'workload', 'period')
+
+# Period -> length of the timestamp prefix ("YYYY-MM-DD HH:MM:SS") it keeps
+PERIODS = {'year': 4, 'month': 7, 'day': 10, 'hour': 13}
+
+# Period label of rows exported before timestamps were added
+NO_TIMESTAMP = '(no timestamp)'
+
+# Columns per row in the current export format
+_COLUMNS = 9
+
+
+class ResultsAnalyzer:
+    """
+    One-pass grouped accumulators over exported per-process result rows.
+    """
+    
+    def __init__(self, group_by=('algorithm', 'workload'), period='day', since=None, until=None):
+        """
+        Initialize empty accumulators.
+        
+        Args:
+            group_by (tuple): Fields from GROUP_FIELDS to group runs by
+            period (str): Time bucket for the 'period' field, a key of PERIODS
+            since (str): Keep runs at or after this timestamp prefix (e.g. "2025-12-19")
+            until (str): Keep runs at or before this timestamp prefix
+        
+        Raises:
+            ValueError: For an unknown group field or period
+        """
+        for field in group_by:
+            if field not in GROUP_FIELDS:
+                raise ValueError(f"Unknown group field: {field} (choose from {', '.join(GROUP_FIELDS)})")
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period: {period} (choose from {', '.join(PERIODS)})")
+        
+        self.group_by = tuple(group_by)
+        self.period = period
+        self.since = since
+        self.until = until
+        
+        # Group key -> [runs, processes, waiting sum, turnaround sum,
+        #               best run avg WT, worst run avg WT, first timestamp, last timestamp]
+        self.groups = {}
+        self.files = 0
+        self.rows = 0
+        self.runs = 0
+        self.skipped = 0  # Lines that are not result rows (headers, summaries, malformed)
+        
+        self._run = None  # (timestamp, algorithm) of the run being read
+        self._reset_run()
+    
+    def _reset_run(self):
+        """Start accumulating a new run."""
+        self._run_hashes = [hashlib.sha1() for _ in range(4)]  # Process, arrival, burst, priority
+        self._run_processes = 0
+        self._run_waiting = 0
+        self._run_turnaround = 0
+    
+    def _switch_run(self, timestamp, algorithm):
+        """Close the current run if the next rows belong to another one."""
+        if self._run != (timestamp, algorithm):
+            self._close_run()
+            self._run = (timestamp, algorithm)
+    
+    def _close_run(self):
+        """Fold the finished run into its group."""
+        if self._run is None or not self._run_processes:
+            self._run = None
+            return
+        
+        timestamp, algorithm = self._run
+        processes = self._run_processes
+        self._run = None
+        if (self.since or self.until) and timestamp is None:
+            self._reset_run()
+            return
+        if (self.since and timestamp < self.since) or \
+                (self.until and timestamp[:len(self.until)] > self.until):
+            self._reset_run()
+            return
+        
+        digest = hashlib.sha1(b''.join(column.digest() for column in self._run_hashes)).hexdigest()
+        fields = {
+            'algorithm': algorithm,
+            'workload': f"{processes} procs #{digest[:8]}",
+            'period': timestamp[:PERIODS[self.period]] if timestamp else NO_TIMESTAMP,
+        }
+        key = tuple(fields[field] for field in self.group_by)
+        avg_waiting = self._run_waiting / processes
+        
+        group = self.groups.get(key)
+        if group is None:
+            self.groups[key] = [1, processes, self._run_waiting, self._run_turnaround,
+                                avg_waiting, avg_waiting, timestamp, timestamp]
+        else:
+            group[0] += 1
+            group[1] += processes
+            group[2] += self._run_waiting
+            group[3] += self._run_turnaround
+            group[4] = min(group[4], avg_waiting)
+            group[5] = max(group[5], avg_waiting)
+            if timestamp:
+                group[6] = min(group[6] or timestamp, timestamp)
+                group[7] = max(group[7] or timestamp, timestamp)
+        self.runs += 1
+        self._reset_run()
+    
+    def feed_file(self, file_path):
+        """
+        Stream one results file (.gz / .xz are decompressed on the fly).
+        
+        Args:
+            file_path (str): Path to a results CSV file
+        
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        with open_input(file_path) as file:
+            tail = ''
+            while True:
+                block = file.read(BULK_CHUNK_CHARS)
+                if not block:
+                    if tail:
+                        self._feed_text(tail + '\n')
+                    break
+                
+                # Complete lines only; the partial last line waits for the next block
+                block = tail + block
+                cut = block.rfind('\n') + 1
+                tail = block[cut:]
+                if cut:
+                    self._feed_text(block[:cut])
+        
+        # Runs never continue into another file
+        self._close_run()
+        self.files += 1
+    
+    def _feed_text(self, text):
+        """
+        Accumulate a block of complete lines.
+        
+        Args:
+            text (str): Complete lines, each ending in a line break
+        """
+        lines = text.split('\n')
+        lines.pop()
+        if not self._feed_bulk(text, len(lines)):
+            self._feed_rows(csv.reader(lines))
+    
+    def _feed_bulk(self, text, count):
+        """
+        Accumulate a block of well-formed rows column-wise.
+        
+        Args:
+            text (str): Complete lines, each ending in a line break
+            count (int): Number of lines in the block
+        
+        Returns:
+            bool: False (and nothing accumulated) if the block needs row-by-row parsing
+        """
+        # Every line must have exactly 9 unquoted fields for the columns to line up
+        if '"' in text or text.count(',') != (_COLUMNS - 1) * count:
+            return False
+        fields = text.replace('\n', '\n,').split(',')
+        fields.pop()
+        if ''.join(fields[_COLUMNS - 1::_COLUMNS]).count('\n') != count:
+            return False  # Some line ends in another column
+        try:
+            turnaround = list(map(int, fields[7::_COLUMNS]))
+            waiting = list(map(int, fields[8::_COLUMNS]))
+        except ValueError:
+            return False
+        
+        timestamps = fields[0::_COLUMNS]
+        algorithms = fields[1::_COLUMNS]
+        workload = [fields[column::_COLUMNS] for column in range(2, 6)]
+        
+        # Run boundaries: rows whose timestamp or algorithm differs from the previous row
+        changed = map(operator.or_, map(operator.ne, timestamps[1:], timestamps),
+                      map(operator.ne, algorithms[1:], algorithms))
+        starts = [0]
+        starts.extend(itertools.compress(range(1, count), changed))
+        starts.append(count)
+        
+        for start, end in zip(starts, starts[1:]):
+            self._switch_run(timestamps[start], algorithms[start])
+            for column_hash, column in zip(self._run_hashes, workload):
+                column_hash.update((','.join(column[start:end]) + ',').encode('utf-8'))
+            self._run_processes += end - start
+            self._run_waiting += sum(waiting[start:end])
+            self._run_turnaround += sum(turnaround[start:end])
+        self.rows += count
+        return True
+    
+    def _feed_rows(self, rows):
+        """
+        Accumulate rows one at a time (any layout the exports have used).
+        
+        Args:
+            rows (iterable): Lists of fields, as from csv.reader
+        """
+        for row in rows:
+            if len(row) == _COLUMNS:
+                timestamp, algorithm, process_id, arrival, burst, priority, _, turnaround, waiting = row
+            elif len(row) == 7:
+                # Older export: Algorithm,Process_ID,Arrival_Time,Burst_Time,Finish_Time,Turnaround_Time,Waiting_Time
+                timestamp, priority = None, 'N/A'
+                algorithm, process_id, arrival, burst, _, turnaround, waiting = row
+            else:
+                self.skipped += 1
+                continue
+            try:
+                turnaround = int(turnaround)
+                waiting = int(waiting)
+            except ValueError:
+                self.skipped += 1  # Header row
+                continue
+            
+            self._switch_run(timestamp, algorithm)
+            for column_hash, value in zip(self._run_hashes, (process_id, arrival, burst, priority)):
+                column_hash.update(f"{value},".encode('utf-8'))
+            self._run_processes += 1
+            self._run_waiting += waiting
+            self._run_turnaround += turnaround
+            self.rows += 1
+    
+    def report(self):
+        """
+        Aggregated results, one entry per group.
+        
+        Returns:
+            list: Dicts with the group fields, runs, processes, avg_waiting_time,
+                  avg_turnaround_time (per process), best_run_wt / worst_run_wt
+                  (average waiting time of the best and worst run), first and last
+                  timestamps; sorted by group
+        """
+        self._close_run()
+        report = []
+        for key in sorted(self.groups, key=lambda key: tuple(str(value) for value in key)):
+            runs, processes, waiting, turnaround, best, worst, first, last = self.groups[key]
+            entry = dict(zip(self.group_by, key))
+            entry.update({
+                'runs': runs,
+                'processes': processes,
+                'avg_waiting_time': waiting / processes,
+                'avg_turnaround_time': turnaround / processes,
+                'best_run_wt': best,
+                'worst_run_wt': worst,
+                'first': first,
+                'last': last,
+            })
+            report.append(entry)
+        return report
+
+
+def analyze_results(file_paths, group_by=('algorithm', 'workload'), period='day', since=None, until=None):
+    """
+    Stream several results files into one set of grouped accumulators.
+    
+    Args:
+        file_paths (list): Results CSV files, read in order
+        group_by (tuple): Fields from GROUP_FIELDS to group runs by
+        period (str): Time bucket for the 'period' field, a key of PERIODS
+        since (str): Keep runs at or after this timestamp prefix
+        until (str): Keep runs at or before this timestamp prefix
+    
+    Returns:
+        ResultsAnalyzer: Analyzer holding the accumulated groups
+    
+    Raises:
+        FileNotFoundError: If a file does not exist
+        ValueError: For an unknown group field or period
+    """
+    analyzer = ResultsAnalyzer(group_by, period, since, until)
+    for file_path in file_paths:
+        analyzer.feed_file(file_path)
+    return analyzer
+
+
+def print_analysis_report(analyzer, elapsed=None):
+    """
+    Print the grouped results as a table.
+    
+    Args:
+        analyzer (ResultsAnalyzer): Analyzer after all files were fed
+        elapsed (float): Seconds spent reading, shown when given
+    """
+    report = analyzer.report()
+    
+    print("\n" + "="*70)
+    print("  RESULTS ANALYSIS")
+    print("="*70)
+    timing = f" in {elapsed:.2f}s" if elapsed is not None else ""
+    print(f"  {analyzer.files} files, {analyzer.rows} rows, {analyzer.runs} runs{timing}"
+          f" ({analyzer.skipped} other lines skipped)")
+    if not report:
+        print("  No runs found.")
+        print("="*70 + "\n")
+        return
+    
+    widths = {'algorithm': 12, 'workload': 22, 'period': 19}
+    header = "  " + " ".join(f"{field.capitalize():<{widths[field]}}" for field in analyzer.group_by)
+    print(f"{header} {'Runs':>6} {'Avg WT':>10} {'Avg TAT':>10} {'Best WT':>9} {'Worst WT':>9}")
+    for entry in report:
+        label = "  " + " ".join(f"{entry[field]:<{widths[field]}}" for field in analyzer.group_by)
+        print(f"{label} {entry['runs']:>6} {entry['avg_waiting_time']:>10.2f} "
+              f"{entry['avg_turnaround_time']:>10.2f} {entry['best_run_wt']:>9.2f} {entry['worst_run_wt']:>9.2f}")
+    print("="*70 + "\n")
@@ -0,0 +1,242 @@
+# Batch mode - evaluate many workload files across a process pool
+# Each file is parsed and simulated in a worker process; results are
+# streamed back as they complete and aggregated into a report.
+
+import concurrent.futures
+import glob
+import os
+import time
+
+from src.log_config import worker_logging_kwargs
+from src.parser import parse_input
+from src.simulator import ALGORITHM_NAMES, run_algorithm, summarize_run
+from src.workload import prepare_workload
+
+
+def find_workload_files(pattern):
+    """
+    Expand a directory or glob pattern into a sorted list of workload files.
+    
+    Args:
+        pattern (str): Directory (all files inside it) or glob such as "traces/**/*.txt"
+    
+    Returns:
+        list: Sorted file paths
+    """
+    if os.path.isdir(pattern):
+        candidates = [os.path.join(pattern, name) for name in os.listdir(pattern)
+                      if not name.startswith('.')]
+    else:
+        candidates = glob.glob(pattern, recursive=True)
+    
+    return sorted(path for path in candidates if os.path.isfile(path))
+
+
+def evaluate_file(file_path, algorithms=ALGORITHM_NAMES, time_quantum=3):
+    """
+    Parse one workload file and run the selected algorithms on it.
+    Runs inside a worker process, so it never raises: errors are returned.
+    
+    Args:
+        file_path (str): Path to the workload file
+        algorithms (sequence): Algorithm names to run
+        time_quantum (int): Time Quantum for Round Robin
+    
+    Returns:
+        dict: file, process count, per-algorithm metrics, winner and error (or None)
+    """
+    result = {'file': file_path, 'processes': 0, 'metrics': {}, 'winner': None, 'error': None}
+    
+    try:
+        processes = parse_input(file_path)
+        if not processes:
+            result['error'] = "No processes loaded"
+            return result
+        
+        result['processes'] = len(processes)
+        workload = prepare_workload(processes)  # Sorted once for every algorithm
+        for algorithm in algorithms:
+            # Only summary metrics are kept, so Round Robin can skip whole rounds
+            gantt_chart, completed = run_algorithm(algorithm, workload, time_quantum, fast_rr=True)
+            result['metrics'][algorithm] = summarize_run(gantt_chart, completed)
+        
+        # Same rule as the smart recommendation: lowest average waiting time wins
+        result['winner'] = min(result['metrics'],
+                               key=lambda name: result['metrics'][name]['avg_waiting_time'])
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    
+    return result
+
+
+def iter_batch_results(files, algorithms=ALGORITHM_NAMES, time_quantum=3,
+                       workers=None, max_in_flight=None):
+    """
+    Evaluate files across a process pool, yielding results as they complete.
+    At most `max_in_flight` files are submitted at a time, so memory stays
+    bounded no matter how many files are in the batch.
+    
+    Args:
+        files (list): Workload file paths
+        algorithms (sequence): Algorithm names to run
+        time_quantum (int): Time Quantum for Round Robin
+        workers (int): Worker processes (default: CPU count)
+        max_in_flight (int): Maximum submitted-but-unfinished files (default: 2 * workers)
+    
+    Yields:
+        dict: Result of evaluate_file() for each file, in completion order
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    algorithms = tuple(algorithms)
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, **worker_logging_kwargs()) as executor:
+        pending = {}
+        file_iter = iter(files)
+        
+        while True:
+            # Top up the pool until the in-flight limit is reached
+            while len(pending) < max_in_flight:
+                file_path = next(file_iter, None)
+                if file_path is None:
+                    break
+                future = executor.submit(evaluate_file, file_path, algorithms, time_quantum)
+                pending[future] = file_path
+            
+            if not pending:
+                break
+            
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                file_path = pending.pop(future)
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. killed); report it and keep going
+                    yield {'file': file_path, 'processes': 0, 'metrics': {},
+                           'winner': None, 'error': f"{type(e).__name__}: {e}"}
+
+
+class BatchSummary:
+    """
+    Running aggregate over batch results (one pass, constant memory per algorithm).
+    """
+    
+    def __init__(self, algorithms):
+        """
+        Initialize empty aggregates.
+        
+        Args:
+            algorithms (sequence): Algorithm names being evaluated
+        """
+        self.algorithms = list(algorithms)
+        self.files = 0
+        self.failed = 0
+        self.wins = {name: 0 for name in self.algorithms}
+        self.totals = {name: {'avg_waiting_time': 0.0, 'avg_turnaround_time': 0.0,
+                              'cpu_utilization': 0.0} for name in self.algorithms}
+    
+    def add(self, result):
+        """
+        Fold one file result into the aggregates.
+        
+        Args:
+            result (dict): Result of evaluate_file()
+        """
+        self.files += 1
+        if result['error']:
+            self.failed += 1
+            return
+        
+        self.wins[result['winner']] += 1
+        for name, metrics in result['metrics'].items():
+            for key, value in metrics.items():
+                self.totals[name][key] += value
+    
+    def means(self, algorithm):
+        """
+        Mean metrics of one algorithm over all successful files.
+        
+        Args:
+            algorithm (str): Algorithm name
+        
+        Returns:
+            dict: Mean of each summary metric (0.0 if no file succeeded)
+        """
+        succeeded = self.files - self.failed
+        return {key: (total / succeeded if succeeded else 0.0)
+                for key, total in self.totals[algorithm].items()}
+
+
+def run_batch(pattern, algorithms=ALGORITHM_NAMES, time_quantum=3, workers=None,
+              max_in_flight=None, quiet=False):
+    """
+    Run batch mode and stream a report to the terminal.
+    
+    Args:
+        pattern (str): Directory or glob selecting the workload files
+        algorithms (sequence): Algorithm names to run on each file
+        time_quantum (int): Time Quantum for Round Robin
+        workers (int): Worker processes (default: CPU count)
+        max_in_flight (int): Maximum submitted-but-unfinished files
+        quiet (bool): Skip per-file lines; only print the overall summary
+    
+    Returns:
+        BatchSummary: Aggregated results (None if no files matched)
+    """
+    files = find_workload_files(pattern)
+    if not files:
+        print(f"Error: No workload files match '{pattern}'.")
+        return None
+    
+    print("\n" + "="*70)
+    print(f"  BATCH MODE - {len(files)} files, algorithms: {', '.join(algorithms)}")
+    print("="*70)
+    
+    summary = BatchSummary(algorithms)
+    start = time.perf_counter()
+    
+    for result in iter_batch_results(files, algorithms, time_quantum, workers, max_in_flight):
+        summary.add(result)
+        if quiet:
+            continue
+        
+        name = os.path.basename(result['file'])
+        progress = f"[{summary.files:>{len(str(len(files)))}}/{len(files)}]"
+        if result['error']:
+            print(f"  {progress} {name:<30} FAILED: {result['error']}", flush=True)
+        else:
+            best_wt = result['metrics'][result['winner']]['avg_waiting_time']
+            print(f"  {progress} {name:<30} winner: {result['winner']:<12} "
+                  f"(avg WT {best_wt:.2f})", flush=True)
+    
+    elapsed = time.perf_counter() - start
+    print_batch_summary(summary, elapsed)
+    return summary
+
+
+def print_batch_summary(summary, elapsed):
+    """
+    Print the overall statistics of a batch run.
+    
+    Args:
+        summary (BatchSummary): Aggregated results
+        elapsed (float): Wall-clock duration in seconds
+    """
+    succeeded = summary.files - summary.failed
+    
+    print("\n" + "-"*70)
+    print(f"  Files: {summary.files}  Succeeded: {succeeded}  Failed: {summary.failed}  "
+          f"Time: {elapsed:.2f}s")
+    print("-"*70)
+    print(f"  {'Algorithm':<14} {'Wins':>6} {'Mean Avg WT':>12} {'Mean Avg TAT':>13} {'Mean CPU %':>11}")
+    
+    for name in summary.algorithms:
+        means = summary.means(name)
+        print(f"  {name:<14} {summary.wins[name]:>6} {means['avg_waiting_time']:>12.2f} "
+              f"{means['avg_turnaround_time']:>13.2f} {means['cpu_utilization']:>11.2f}")
+    
+    if succeeded:
+        best = max(summary.algorithms, key=lambda name: summary.wins[name])
+        print(f"\n  *** Most frequent winner: {best} ({summary.wins[best]}/{succeeded} files) ***")
+    print("-"*70)
@@ -0,0 +1,173 @@
+# On-disk checkpoints for long-running simulations
+# A Checkpointer periodically pickles the live engine state to a file
+# (written atomically), so a killed run can continue where it stopped and
+# still produce exactly the output of an uninterrupted run. Results that
+# only grow (finished slices, completed processes) are appended to a
+# journal next to it instead, so each checkpoint costs time and disk in
+# proportion to the live state, not to the length of the run so far.
+# Checkpoints are pickles: only resume from files this tool wrote.
+
+import hashlib
+import os
+import pickle
+import time
+
+# Checkpoint file format version (bump when the saved state changes)
+CHECKPOINT_VERSION = 2
+
+# Loop iterations between wall-clock checks (keeps due() cheap)
+CHECK_EVERY = 4096
+
+# Suffix of the journal file written next to each checkpoint
+JOURNAL_SUFFIX = '.journal'
+
+
+def workload_fingerprint(processes, algorithm, time_quantum=None):
+    """
+    Identify a workload and its parameters, so a checkpoint is only
+    resumed for exactly the same run.
+    
+    Args:
+        processes (list): List of Process objects
+        algorithm (str): Algorithm name
+        time_quantum (int): Time Quantum (Round Robin only)
+    
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256(f"{algorithm}|{time_quantum}|".encode('utf-8'))
+    for p in processes:
+        bursts = f",{' '.join(map(str, p.bursts))}" if p.bursts else ""
+        # Only processes with a deadline add it, so older fingerprints stay valid
+        deadline = f"@{p.deadline}" if p.deadline is not None else ""
+        digest.update(f"{p.process_id},{p.arrival_time},{p.burst_time},{p.priority}{bursts}{deadline};"
+                      .encode('utf-8'))
+    return digest.hexdigest()
+
+
+class Checkpointer:
+    """
+    Saves and restores engine state at a fixed wall-clock interval, plus
+    an append-only journal of results that are final.
+    """
+    
+    def __init__(self, file_path, fingerprint, interval=60.0):
+        """
+        Initialize the checkpointer.
+        
+        Args:
+            file_path (str): Checkpoint file path
+            fingerprint (str): Workload fingerprint (see workload_fingerprint)
+            interval (float): Seconds between checkpoints
+        """
+        self.file_path = file_path
+        self.journal_path = file_path + JOURNAL_SUFFIX
+        self.fingerprint = fingerprint
+        self.interval = interval
+        self.saved = 0
+        # The journal is started over unless read_journal() resumed it
+        self._journal_open = False
+        self._journal_offset = 0
+        self._calls = 0
+        self._next_save = time.monotonic() + interval
+    
+    def due(self):
+        """
+        Check whether a checkpoint should be written now.
+        
+        Returns:
+            bool: True once per interval
+        """
+        self._calls += 1
+        if self._calls % CHECK_EVERY:
+            return False
+        return time.monotonic() >= self._next_save
+    
+    def save(self, state, journal=None):
+        """
+        Atomically write engine state to the checkpoint file.
+        
+        Args:
+            state (dict): Picklable live engine state
+            journal: Picklable results that became final since the last save;
+                     appended to the journal (made durable before the state)
+        """
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # The checkpoint records how much of the journal belongs to it, so
+        # entries appended by a save that never completed are dropped on resume
+        with open(self.journal_path, 'ab' if self._journal_open else 'wb') as file:
+            if journal is not None:
+                pickle.dump(journal, file, protocol=pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            journal_offset = file.tell()
+        self._journal_open = True
+        
+        payload = {'version': CHECKPOINT_VERSION, 'fingerprint': self.fingerprint, 'state': state,
+                   'journal_offset': journal_offset}
+        temp_path = self.file_path + '.tmp'
+        with open(temp_path, 'wb') as file:
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.file_path)
+        
+        self.saved += 1
+        self._next_save = time.monotonic() + self.interval
+    
+    def load(self):
+        """
+        Read the latest checkpoint if it belongs to this run.
+        
+        Returns:
+            dict: Saved engine state, or None if there is no matching checkpoint
+        """
+        try:
+            with open(self.file_path, 'rb') as file:
+                payload = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        
+        if payload.get('version') != CHECKPOINT_VERSION or payload.get('fingerprint') != self.fingerprint:
+            return None
+        # Without the journal the finished part of the run is lost
+        try:
+            if os.path.getsize(self.journal_path) < payload['journal_offset']:
+                return None
+        except OSError:
+            return None
+        self._journal_offset = payload['journal_offset']
+        return payload['state']
+    
+    def read_journal(self):
+        """
+        Read the journal of the checkpoint returned by load(), dropping any
+        entries written after it; later saves append to it.
+        
+        Returns:
+            list: Journal entries, oldest first
+        
+        Raises:
+            ValueError: If the journal cannot be read back
+        """
+        entries = []
+        try:
+            with open(self.journal_path, 'r+b') as file:
+                file.truncate(self._journal_offset)
+                while file.tell() < self._journal_offset:
+                    entries.append(pickle.load(file))
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            raise ValueError(f"Checkpoint journal {self.journal_path} is unreadable: {e}") from e
+        self._journal_open = True
+        return entries
+    
+    def clear(self):
+        """Remove the checkpoint and its journal once the run has completed."""
+        for path in (self.file_path, self.journal_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
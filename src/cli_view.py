@@ -1,7 +1,52 @@
 # CLI View - Terminal output formatting for scheduling results
 
+import bisect
+import collections
+import sys
 
-def print_results(algorithm_name, processes, gantt_chart, cpu_utilization):
+
+# Supported CLI output modes:
+#   full      - complete Gantt chart and process table (streamed in chunks)
+#   truncated - first/last rows only, with the middle elided
+#   summary   - averages and CPU utilization only
+OUTPUT_MODES = ('full', 'truncated', 'summary')
+
+# Number of Gantt slices / table rows shown at each end in truncated mode
+DEFAULT_TRUNCATE_ROWS = 10
+
+# Number of text pieces collected before a single write to the terminal
+WRITE_CHUNK_SIZE = 4096
+
+# Tardiness percentiles shown in the deadline report
+TARDINESS_PERCENTILES = (50, 90, 99)
+
+
+def write_chunked(pieces, stream=None, chunk_size=WRITE_CHUNK_SIZE):
+    """
+    Write an iterable of text pieces to a stream in large chunks.
+    Avoids one print() call (and one terminal write) per row on huge runs.
+    
+    Args:
+        pieces (iterable): Strings to write, in order
+        stream: Output stream (default: sys.stdout)
+        chunk_size (int): Number of pieces joined per write call
+    """
+    if stream is None:
+        stream = sys.stdout
+    
+    buffer = []
+    for piece in pieces:
+        buffer.append(piece)
+        if len(buffer) >= chunk_size:
+            stream.write(''.join(buffer))
+            buffer.clear()
+    
+    if buffer:
+        stream.write(''.join(buffer))
+
+
+def print_results(algorithm_name, processes, gantt_chart, cpu_utilization,
+                  output_mode='full', truncate_rows=DEFAULT_TRUNCATE_ROWS):
     """
     Print scheduling results in a nicely formatted way to the terminal.
     
@@ -10,19 +55,25 @@ def print_results(algorithm_name, processes, gantt_chart, cpu_utilization):
         processes (list): List of completed Process objects
         gantt_chart (list): List of tuples (process_id, start_time, end_time)
         cpu_utilization (float): CPU utilization percentage
+        output_mode (str): One of OUTPUT_MODES (default: 'full')
+        truncate_rows (int): Rows kept at each end in 'truncated' mode
     """
     # Print header with algorithm name
     print("\n" + "="*70)
     print(f"  {algorithm_name} SCHEDULING RESULTS")
     print("="*70)
     
-    # Print Gantt Chart
-    print("\nGantt Chart:")
-    print_gantt_chart(gantt_chart)
-    
-    # Print process details table
-    print("\nProcess Details:")
-    print_process_table(processes)
+    # Summary mode skips the (potentially huge) Gantt chart and table
+    if output_mode != 'summary':
+        limit = truncate_rows if output_mode == 'truncated' else None
+        
+        # Print Gantt Chart
+        print("\nGantt Chart:")
+        print_gantt_chart(gantt_chart, limit=limit)
+        
+        # Print process details table
+        print("\nProcess Details:")
+        print_process_table(processes, limit=limit)
     
     # Calculate and print average times
     print_average_times(processes)
@@ -32,62 +83,126 @@ def print_results(algorithm_name, processes, gantt_chart, cpu_utilization):
     print("="*70 + "\n")
 
 
-def print_gantt_chart(gantt_chart):
+def _iter_gantt_pieces(gantt_chart, limit=None):
+    """
+    Generate the text pieces of a Gantt chart line.
+    Works on lists and on one-pass iterables (e.g. a trace replay), keeping
+    at most `limit` slices in memory when truncating.
+    
+    Args:
+        gantt_chart (iterable): Tuples (process_id, start_time, end_time)
+        limit (int): If set, only the first and last `limit` slices are shown
+    
+    Yields:
+        str: Consecutive pieces of the chart, e.g. "[0]--P1--"
+    """
+    slices = iter(gantt_chart)
+    last_end = None
+    
+    if limit is None:
+        for process_id, start_time, last_end in slices:
+            yield f"[{start_time}]--{process_id}--"
+    else:
+        # Head: first `limit` slices are printed as they arrive
+        for _, (process_id, start_time, last_end) in zip(range(limit), slices):
+            yield f"[{start_time}]--{process_id}--"
+        
+        # Tail: keep the last `limit` slices, counting the ones pushed out
+        tail = collections.deque(maxlen=limit)
+        omitted = 0
+        first_omitted_start = None
+        for item in slices:
+            last_end = item[2]
+            if len(tail) == limit:
+                dropped = tail[0] if limit else item
+                if first_omitted_start is None:
+                    first_omitted_start = dropped[1]
+                omitted += 1
+            tail.append(item)
+        
+        if omitted:
+            yield f"[{first_omitted_start}] ... ({omitted} slices omitted) ... "
+        for process_id, start_time, last_end in tail:
+            yield f"[{start_time}]--{process_id}--"
+    
+    # Add final end time bracket
+    if last_end is not None:
+        yield f"[{last_end}]"
+
+
+def print_gantt_chart(gantt_chart, limit=None, stream=None):
     """
     Print Gantt chart in format: [0]--P1--[5]--P2--[10]
     
     Args:
-        gantt_chart (list): List of tuples (process_id, start_time, end_time)
+        gantt_chart (iterable): Tuples (process_id, start_time, end_time)
+        limit (int): If set, only the first and last `limit` slices are shown
+        stream: Output stream (default: sys.stdout)
     """
-    if not gantt_chart:
-        print("  (Empty)")
-        return
+    if stream is None:
+        stream = sys.stdout
     
-    # Build the Gantt chart string
-    gantt_str = ""
+    pieces = _iter_gantt_pieces(gantt_chart, limit)
+    first_piece = next(pieces, None)
+    if first_piece is None:
+        stream.write("  (Empty)\n")
+        return
     
-    for process_id, start_time, end_time in gantt_chart:
-        # Add start time bracket
-        gantt_str += f"[{start_time}]"
-        
-        # Add process ID with dashes
-        gantt_str += f"--{process_id}--"
+    stream.write("  " + first_piece)
+    write_chunked(pieces, stream)
+    stream.write("\n")
+
+
+def _format_process_row(process):
+    """
+    Format a single row of the process details table.
     
-    # Add final end time bracket
-    if gantt_chart:
-        last_end_time = gantt_chart[-1][2]
-        gantt_str += f"[{last_end_time}]"
+    Args:
+        process (Process): Process with calculated times
     
-    print(f"  {gantt_str}")
+    Returns:
+        str: Table row terminated by a newline
+    """
+    return (f"  | {process.process_id:<6} | "
+            f"{process.arrival_time:<8} | "
+            f"{process.burst_time:<6} | "
+            f"{process.finish_time:<7} | "
+            f"{process.turnaround_time:<6} | "
+            f"{process.waiting_time:<6} |\n")
 
 
-def print_process_table(processes):
+def print_process_table(processes, limit=None, stream=None):
     """
     Print a formatted table showing process scheduling metrics.
     
     Args:
         processes (list): List of Process objects with calculated times
+        limit (int): If set, only the first and last `limit` rows are shown
+        stream: Output stream (default: sys.stdout)
     """
+    if stream is None:
+        stream = sys.stdout
+    
     # Table header
-    print("  " + "-"*60)
-    print(f"  | {'ID':<6} | {'Arrival':<8} | {'Burst':<6} | {'Finish':<7} | {'TAT':<6} | {'WT':<6} |")
-    print("  " + "-"*60)
+    stream.write("  " + "-"*60 + "\n")
+    stream.write(f"  | {'ID':<6} | {'Arrival':<8} | {'Burst':<6} | {'Finish':<7} | {'TAT':<6} | {'WT':<6} |\n")
+    stream.write("  " + "-"*60 + "\n")
     
     # Sort processes by process ID for consistent display
     processes_sorted = sorted(processes, key=lambda p: p.process_id)
+    total = len(processes_sorted)
     
-    # Print each process row
-    for process in processes_sorted:
-        print(f"  | {process.process_id:<6} | "
-              f"{process.arrival_time:<8} | "
-              f"{process.burst_time:<6} | "
-              f"{process.finish_time:<7} | "
-              f"{process.turnaround_time:<6} | "
-              f"{process.waiting_time:<6} |")
+    # Print each process row (head and tail only when truncating)
+    if limit is not None and total > 2 * limit:
+        write_chunked(map(_format_process_row, processes_sorted[:limit]), stream)
+        stream.write(f"  | ... {total - 2 * limit} rows omitted ...\n")
+        write_chunked(map(_format_process_row, processes_sorted[total - limit:]), stream)
+    else:
+        write_chunked(map(_format_process_row, processes_sorted), stream)
     
     # Table footer
-    print("  " + "-"*60)
-    print("  Note: TAT = Turnaround Time, WT = Waiting Time")
+    stream.write("  " + "-"*60 + "\n")
+    stream.write("  Note: TAT = Turnaround Time, WT = Waiting Time\n")
 
 
 def print_average_times(processes):
@@ -164,13 +279,82 @@ def get_average_waiting_time(processes):
     return total_waiting / len(processes)
 
 
-def export_to_csv(results_dict, filename="results.csv"):
+def get_average_turnaround_time(processes):
+    """
+    Calculate average turnaround time for a list of processes.
+    
+    Args:
+        processes (list): List of Process objects
+    
+    Returns:
+        float: Average turnaround time
+    """
+    if not processes:
+        return 0.0
+    
+    total_turnaround = sum(p.turnaround_time for p in processes)
+    return total_turnaround / len(processes)
+
+
+def get_deadline_metrics(processes):
+    """
+    Deadline-miss count and tardiness distribution of a completed run.
+    Tardiness is how late a process finished: max(0, finish - deadline).
+    
+    Args:
+        processes (list): List of completed Process objects
+    
+    Returns:
+        dict: 'deadlines' (processes that have one), 'missed', 'miss_rate' (%),
+              'avg_tardiness' and 'max_tardiness' over processes with a deadline,
+              and 'percentiles' (TARDINESS_PERCENTILES -> tardiness, nearest rank)
+    """
+    tardiness = sorted(max(0, p.finish_time - p.deadline) for p in processes if p.deadline is not None)
+    count = len(tardiness)
+    missed = count - bisect.bisect_right(tardiness, 0)
+    return {
+        'deadlines': count,
+        'missed': missed,
+        'miss_rate': missed / count * 100 if count else 0.0,
+        'avg_tardiness': sum(tardiness) / count if count else 0.0,
+        'max_tardiness': tardiness[-1] if count else 0,
+        'percentiles': {pct: tardiness[max(0, -(-pct * count // 100) - 1)] if count else 0
+                        for pct in TARDINESS_PERCENTILES},
+    }
+
+
+def print_deadline_report(results):
+    """
+    Print deadline misses and tardiness percentiles of every algorithm run.
+    
+    Args:
+        results (dict): Algorithm name -> (processes, avg_waiting_time); entries
+                        without processes (metrics-only runs) are skipped
+    """
+    print("\n" + "="*70)
+    print("  DEADLINES - MISSES AND TARDINESS")
+    print("="*70)
+    percentile_header = "".join(f"{f'P{pct}':>8}" for pct in TARDINESS_PERCENTILES)
+    print(f"  {'Algorithm':<14} {'Missed':>13} {'Miss %':>8} {'Avg':>8}{percentile_header} {'Max':>8}")
+    for algorithm, (processes, _) in results.items():
+        if processes is None:
+            continue
+        metrics = get_deadline_metrics(processes)
+        percentiles = "".join(f"{metrics['percentiles'][pct]:>8}" for pct in TARDINESS_PERCENTILES)
+        missed = f"{metrics['missed']}/{metrics['deadlines']}"
+        print(f"  {algorithm:<14} {missed:>13} {metrics['miss_rate']:>8.2f} "
+              f"{metrics['avg_tardiness']:>8.2f}{percentiles} {metrics['max_tardiness']:>8}")
+    print("="*70)
+
+
+def export_to_csv(results_dict, filename="results.csv", quiet=False):
     """
     Export scheduling results to a CSV file with append mode.
     
     Args:
         results_dict (dict): Dictionary mapping algorithm names to (processes, avg_waiting_time)
         filename (str): Output CSV filename (default: "results.csv")
+        quiet (bool): Skip the progress bar and status messages (default: False)
     """
     import csv
     import os
@@ -181,7 +365,8 @@ def export_to_csv(results_dict, filename="results.csv"):
         file_exists = os.path.exists(filename)
         
         # Show ASCII progress bar
-        show_ascii_progress("Saving results")
+        if not quiet:
+            show_ascii_progress("Saving results")
         
         with open(filename, mode='a', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
@@ -209,7 +394,8 @@ def export_to_csv(results_dict, filename="results.csv"):
                         process.waiting_time
                     ])
         
-        print(f"\n✓ Results exported to {filename}")
+        if not quiet:
+            print(f"\n✓ Results exported to {filename}")
         return True
     
     except Exception as e:
@@ -225,7 +411,6 @@ def show_ascii_progress(message="Processing", duration=0.8):
         message (str): Message to display
         duration (float): Animation duration in seconds
     """
-    import sys
     import time
     
     total_bars = 10
@@ -0,0 +1,269 @@
+# Monte Carlo experiment runner
+# Generates many seeded random workloads, runs every algorithm on each one in
+# worker processes and reports mean metrics with confidence intervals.
+#
+# Reproducibility: workload i is generated from its own seed derived from
+# (seed, i), and results are folded into the statistics in index order, one
+# fixed-size round at a time. The outcome therefore depends only on the seed
+# and the parameters, never on the number of workers.
+
+import concurrent.futures
+import functools
+import math
+import os
+import random
+from statistics import NormalDist
+
+from src.log_config import worker_logging_kwargs
+from src.model import Process
+from src.simulator import ALGORITHM_NAMES, run_algorithm, summarize_run
+from src.workload import prepare_workload
+
+
+# Supported burst time distributions
+BURST_DISTRIBUTIONS = ('exponential', 'uniform')
+
+# Metrics reported for each algorithm
+EXPERIMENT_METRICS = ('avg_waiting_time', 'avg_turnaround_time', 'cpu_utilization')
+
+# Minimum trials before the early-stop rule is checked
+MIN_TRIALS_BEFORE_STOP = 30
+
+
+class WorkloadParams:
+    """
+    Parameters of the random workload generator.
+    """
+    
+    def __init__(self, num_processes=50, mean_interarrival=4.0, mean_burst=6.0,
+                 burst_distribution='exponential', priority_levels=5):
+        """
+        Initialize workload parameters.
+        
+        Args:
+            num_processes (int): Processes per generated workload
+            mean_interarrival (float): Mean time between arrivals (Poisson arrivals)
+            mean_burst (float): Mean CPU burst time
+            burst_distribution (str): One of BURST_DISTRIBUTIONS
+            priority_levels (int): Priorities are drawn uniformly from 1..priority_levels
+        """
+        if burst_distribution not in BURST_DISTRIBUTIONS:
+            raise ValueError(f"Unknown burst distribution: {burst_distribution}")
+        if num_processes <= 0 or mean_burst < 1 or priority_levels <= 0 or mean_interarrival < 0:
+            raise ValueError("Workload parameters must be positive")
+        
+        self.num_processes = num_processes
+        self.mean_interarrival = mean_interarrival
+        self.mean_burst = mean_burst
+        self.burst_distribution = burst_distribution
+        self.priority_levels = priority_levels
+
+
+def generate_workload(params, seed):
+    """
+    Generate one random workload.
+    
+    Args:
+        params (WorkloadParams): Generator parameters
+        seed (int): Seed for this workload
+    
+    Returns:
+        list: List of Process objects sorted by arrival time
+    """
+    rng = random.Random(seed)
+    processes = []
+    arrival_time = 0
+    
+    for i in range(params.num_processes):
+        if i > 0 and params.mean_interarrival > 0:
+            arrival_time += int(rng.expovariate(1.0 / params.mean_interarrival))
+        
+        if params.burst_distribution == 'exponential':
+            burst_time = max(1, round(rng.expovariate(1.0 / params.mean_burst)))
+        else:
+            burst_time = rng.randint(1, max(1, round(2 * params.mean_burst) - 1))
+        
+        priority = rng.randint(1, params.priority_levels)
+        processes.append(Process(f"P{i + 1}", arrival_time, burst_time, priority))
+    
+    return processes
+
+
+def trial_seed(seed, index):
+    """
+    Derive the seed of trial `index` from the experiment seed.
+    
+    Args:
+        seed (int): Experiment seed
+        index (int): Trial number
+    
+    Returns:
+        int: Seed for the trial's workload
+    """
+    return random.Random(f"{seed}:{index}").getrandbits(64)
+
+
+def run_trial(index, seed, params, algorithms, time_quantum):
+    """
+    Generate workload `index` and run every algorithm on it (worker process).
+    
+    Args:
+        index (int): Trial number
+        seed (int): Experiment seed
+        params (WorkloadParams): Generator parameters
+        algorithms (tuple): Algorithm names to run
+        time_quantum (int): Time Quantum for Round Robin
+    
+    Returns:
+        dict: Algorithm name -> summary metrics (see simulator.summarize_run)
+    """
+    workload = prepare_workload(generate_workload(params, trial_seed(seed, index)))
+    return {algorithm: summarize_run(*run_algorithm(algorithm, workload, time_quantum, fast_rr=True))
+            for algorithm in algorithms}
+
+
+class RunningStats:
+    """
+    Welford's online mean/variance accumulator.
+    """
+    
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def add(self, value):
+        """
+        Add one observation.
+        
+        Args:
+            value (float): Observed value
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+    
+    def half_width(self, confidence=0.95):
+        """
+        Half-width of the normal-approximation confidence interval of the mean.
+        
+        Args:
+            confidence (float): Confidence level, e.g. 0.95
+        
+        Returns:
+            float: Half-width (infinity with fewer than 2 observations)
+        """
+        if self.count < 2:
+            return math.inf
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        std_dev = math.sqrt(self._m2 / (self.count - 1))
+        return z * std_dev / math.sqrt(self.count)
+
+
+def intervals_separated(stats, metric='avg_waiting_time', confidence=0.95):
+    """
+    Check whether the best algorithm's interval is clear of all others.
+    
+    Args:
+        stats (dict): Algorithm name -> metric name -> RunningStats
+        metric (str): Metric to compare (lower is better)
+        confidence (float): Confidence level
+    
+    Returns:
+        bool: True if the best upper bound lies below every other lower bound
+    """
+    if len(stats) < 2:
+        return True
+    
+    best = min(stats, key=lambda name: stats[name][metric].mean)
+    best_upper = stats[best][metric].mean + stats[best][metric].half_width(confidence)
+    
+    return all(best_upper < s[metric].mean - s[metric].half_width(confidence)
+               for name, s in stats.items() if name != best)
+
+
+def run_experiment(params, runs=1000, seed=0, algorithms=ALGORITHM_NAMES, time_quantum=3,
+                   workers=None, confidence=0.95, round_size=100, early_stop=True):
+    """
+    Run a Monte Carlo experiment over seeded random workloads.
+    
+    Args:
+        params (WorkloadParams): Workload generator parameters
+        runs (int): Maximum number of workloads
+        seed (int): Experiment seed
+        algorithms (sequence): Algorithm names to compare
+        time_quantum (int): Time Quantum for Round Robin
+        workers (int): Worker processes (default: CPU count)
+        confidence (float): Confidence level of the reported intervals
+        round_size (int): Workloads evaluated between early-stop checks
+        early_stop (bool): Stop once the avg WT intervals separate
+    
+    Returns:
+        dict: 'trials' (int), 'stopped_early' (bool) and
+              'stats' (algorithm -> metric -> RunningStats)
+    """
+    algorithms = tuple(algorithms)
+    workers = workers or os.cpu_count() or 1
+    stats = {name: {metric: RunningStats() for metric in EXPERIMENT_METRICS} for name in algorithms}
+    trials = 0
+    stopped_early = False
+    
+    trial = functools.partial(run_trial, seed=seed, params=params,
+                              algorithms=algorithms, time_quantum=time_quantum)
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, **worker_logging_kwargs()) as executor:
+        while trials < runs:
+            indices = range(trials, min(trials + round_size, runs))
+            
+            # map() returns results in index order, whatever order workers finish in
+            chunksize = max(1, len(indices) // (4 * workers))
+            round_results = executor.map(trial, indices, chunksize=chunksize)
+            
+            for result in round_results:
+                for name, metrics in result.items():
+                    for metric in EXPERIMENT_METRICS:
+                        stats[name][metric].add(metrics[metric])
+            trials = indices.stop
+            
+            if (early_stop and trials >= MIN_TRIALS_BEFORE_STOP and trials < runs
+                    and intervals_separated(stats, confidence=confidence)):
+                stopped_early = True
+                break
+    
+    return {'trials': trials, 'stopped_early': stopped_early, 'stats': stats}
+
+
+def print_experiment_report(report, confidence=0.95):
+    """
+    Print the per-algorithm means and confidence intervals of an experiment.
+    
+    Args:
+        report (dict): Result of run_experiment()
+        confidence (float): Confidence level used for the intervals
+    """
+    stats = report['stats']
+    level = f"{confidence * 100:g}%"
+    
+    print("\n" + "="*70)
+    print(f"  MONTE CARLO EXPERIMENT - {report['trials']} workloads ({level} confidence intervals)")
+    print("="*70)
+    print(f"  {'Algorithm':<14} {'Avg WT':>16} {'Avg TAT':>16} {'CPU Util %':>16}")
+    
+    for name, metrics in stats.items():
+        cells = [f"{metrics[m].mean:.2f} ± {metrics[m].half_width(confidence):.2f}"
+                 for m in EXPERIMENT_METRICS]
+        print(f"  {name:<14} {cells[0]:>16} {cells[1]:>16} {cells[2]:>16}")
+    
+    best = min(stats, key=lambda name: stats[name]['avg_waiting_time'].mean)
+    print("\n" + "-"*70)
+    if report['stopped_early']:
+        print(f"  Stopped early: {best} is best by average waiting time "
+              f"with non-overlapping intervals.")
+    elif intervals_separated(stats, confidence=confidence):
+        print(f"  {best} is best by average waiting time with non-overlapping intervals.")
+    else:
+        print(f"  Lowest mean average waiting time: {best} "
+              f"(intervals overlap; run more workloads to separate them).")
+    print("-"*70)
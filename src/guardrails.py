@@ -0,0 +1,287 @@
+# Pre-flight cost estimation and run budgets
+# A typo such as a quantum of 1 on a workload with huge bursts can make
+# Round Robin run for hours and build a Gantt chart that does not fit in
+# memory. estimate_cost() predicts the size of a run from workload
+# statistics before anything is simulated:
+#   - every algorithm here is work-conserving, so the CPU's busy and idle
+#     periods are the same for all of them and one O(n) pass counts the
+#     idle slices exactly
+#   - FCFS, SJF and Priority dispatch every process once; Round Robin gives
+#     a process of burst b exactly max(1, ceil(b / quantum)) slices
+#   - EDF preempts only on an arrival, and each arrival splits at most one
+#     slice, so it needs at most one more slice per process
+# Runs over the limits are refused (or switched to metrics-only mode by the
+# CLI). Once a run starts, RunBudget enforces a hard wall-clock and memory
+# budget: it rides along as a trace recorder and stops the engine with
+# BudgetExceeded, which unwinds cleanly (trace files are closed, the last
+# Round Robin checkpoint is kept for --resume).
+
+import os
+import sys
+import time
+
+try:
+    import resource  # Peak RSS where /proc is not available (not on Windows)
+except ImportError:
+    resource = None
+
+from src.workload import prepare_workload
+
+# Approximate bytes per Gantt chart entry (tuple, list slot, time ints)
+BYTES_PER_SLICE = 112
+
+# Approximate bytes per Process object an engine creates
+BYTES_PER_PROCESS = 240
+
+# Default CLI limits (0 disables a limit)
+DEFAULT_MAX_SLICES = 20_000_000
+DEFAULT_MAX_MEMORY_MB = 2048
+
+# What the CLI does with a run over the limits
+OVER_LIMIT_ACTIONS = ('refuse', 'metrics-only')
+
+# Recorder calls between memory checks (the clock is checked on every call)
+MEMORY_CHECK_EVERY = 4096
+
+
+class CostEstimate:
+    """
+    Predicted size of one algorithm run.
+    """
+    
+    def __init__(self, algorithm, processes, slices, events, memory_bytes, exact):
+        """
+        Initialize the estimate.
+        
+        Args:
+            algorithm (str): Algorithm display name
+            processes (int): Number of processes
+            slices (int): Gantt chart entries, idle periods included
+            events (int): Scheduler events (arrivals, dispatches, completions, I/O wake-ups)
+            memory_bytes (int): Approximate memory for the Gantt chart and process objects
+            exact (bool): True if slices is exact, False if it is an upper bound
+        """
+        self.algorithm = algorithm
+        self.processes = processes
+        self.slices = slices
+        self.events = events
+        self.memory_bytes = memory_bytes
+        self.exact = exact
+    
+    def __repr__(self):
+        """
+        String representation for debugging purposes.
+        
+        Returns:
+            str: Algorithm, slices and memory
+        """
+        bound = "" if self.exact else "<="
+        return (f"CostEstimate({self.algorithm}, slices{bound}{self.slices}, "
+                f"memory~{self.memory_bytes / 2**20:.1f} MiB)")
+
+
+class BudgetExceeded(Exception):
+    """
+    A run hit its wall-clock or memory budget and was stopped.
+    """
+    
+    def __init__(self, message, slices, sim_time):
+        """
+        Initialize the error.
+        
+        Args:
+            message (str): Which budget was exceeded, and by how much
+            slices (int): Slices recorded before the stop
+            sim_time (int): Simulated time reached
+        """
+        super().__init__(message)
+        self.slices = slices
+        self.sim_time = sim_time
+
+
+def idle_periods(workload):
+    """
+    Count the idle periods of any work-conserving schedule of a workload.
+    
+    Args:
+        workload (list | PreparedWorkload): Processes without I/O bursts
+    
+    Returns:
+        int: Number of IDLE entries in the Gantt chart
+    """
+    workload = prepare_workload(workload)
+    idle = 0
+    current_time = 0
+    for arrival, burst in zip(workload.arrivals, workload.bursts):
+        if arrival > current_time:
+            idle += 1
+            current_time = arrival
+        current_time += burst
+    return idle
+
+
+def estimate_cost(workload, algorithm, time_quantum=3, fast_rr=False):
+    """
+    Predict slices, events and memory of a run without simulating it.
+    
+    Args:
+        workload (list | PreparedWorkload): Processes to schedule
+        algorithm (str): 'FCFS', 'SJF', 'Priority', 'Round Robin', 'Lottery', 'Stride' or 'EDF'
+        time_quantum (int): Time Quantum for the quantum-based algorithms (default: 3)
+        fast_rr (bool): Round Robin skips whole rounds (slices become an upper bound)
+    
+    Returns:
+        CostEstimate: Predicted size of the run
+    
+    Raises:
+        ValueError: For a bad quantum
+    """
+    workload = prepare_workload(workload)
+    # Lottery and Stride also run one slice per quantum, so they cost what Round Robin does
+    round_robin = algorithm in ('Round Robin', 'Lottery', 'Stride')
+    if round_robin and time_quantum <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    
+    processes = len(workload)
+    wakeups = 0
+    if workload.has_io:
+        # One dispatch per CPU burst (more with Round Robin); every I/O burst
+        # may end an idle period, so idle time is only bounded
+        cpu_bursts = [bursts[0::2] if bursts else (burst,)
+                      for bursts, burst in zip(workload.io_bursts, workload.bursts)]
+        wakeups = sum(len(bursts) // 2 for bursts in workload.io_bursts if bursts)
+        if round_robin:
+            dispatches = sum(max(1, -(-burst // time_quantum)) for bursts in cpu_bursts for burst in bursts)
+        else:
+            dispatches = sum(map(len, cpu_bursts))
+        idle = min(dispatches, len(workload.distinct_arrivals) + wakeups)
+        exact = False
+    else:
+        if round_robin:
+            dispatches = sum(max(1, -(-burst // time_quantum)) for burst in workload.bursts)
+        elif algorithm == 'EDF':
+            dispatches = 2 * processes
+        else:
+            dispatches = processes
+        idle = idle_periods(workload)
+        # Round skipping merges whole rounds, so the plain Round Robin count is a bound
+        exact = not (algorithm == 'Round Robin' and fast_rr) and algorithm != 'EDF'
+    
+    slices = dispatches + idle
+    return CostEstimate(
+        algorithm,
+        processes,
+        slices,
+        events=2 * processes + dispatches + wakeups,
+        memory_bytes=slices * BYTES_PER_SLICE + processes * BYTES_PER_PROCESS,
+        exact=exact
+    )
+
+
+def check_limits(estimate, max_slices=DEFAULT_MAX_SLICES, max_memory_mb=DEFAULT_MAX_MEMORY_MB):
+    """
+    Compare an estimate with the configured limits.
+    
+    Args:
+        estimate (CostEstimate): Result of estimate_cost()
+        max_slices (int): Maximum Gantt chart entries (0 or None: no limit)
+        max_memory_mb (int): Maximum estimated memory in MiB (0 or None: no limit)
+    
+    Returns:
+        list: Human-readable reasons the run is over a limit (empty if it fits)
+    """
+    reasons = []
+    bound = "" if estimate.exact else "up to "
+    if max_slices and estimate.slices > max_slices:
+        reasons.append(f"{bound}{estimate.slices:,} slices (limit {max_slices:,})")
+    if max_memory_mb and estimate.memory_bytes > max_memory_mb * 2**20:
+        reasons.append(f"~{estimate.memory_bytes / 2**20:,.0f} MiB (limit {max_memory_mb:,} MiB)")
+    return reasons
+
+
+def current_memory():
+    """
+    Resident memory of this process.
+    
+    Returns:
+        int: Bytes (current RSS from /proc, else the peak RSS), or None if unknown
+    """
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    return None
+
+
+class RunBudget:
+    """
+    Hard wall-clock and memory budget for one run. Pass it (or a SliceTee
+    containing it) as an engine's trace_writer.
+    """
+    
+    def __init__(self, time_limit=None, memory_limit_mb=None):
+        """
+        Start the budget clock.
+        
+        Args:
+            time_limit (float): Seconds the run may take (None: unlimited)
+            memory_limit_mb (float): MiB the process may grow by during the run (None: unlimited)
+        """
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit_mb * 2**20 if memory_limit_mb else None
+        self.slices = 0
+        self._deadline = time.monotonic() + time_limit if time_limit else None
+        self._baseline = current_memory() if self.memory_limit else None
+        if self._baseline is None:
+            self.memory_limit = None  # Memory cannot be measured on this platform
+    
+    def _check(self, now):
+        """
+        Stop the run if a budget is exhausted.
+        
+        Args:
+            now (int): Simulated time reached
+        
+        Raises:
+            BudgetExceeded: If the wall-clock or memory budget is used up
+        """
+        self.slices += 1
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise BudgetExceeded(f"wall-clock budget of {self.time_limit:g}s exceeded", self.slices, now)
+        if self.memory_limit is not None and self.slices % MEMORY_CHECK_EVERY == 0:
+            grown = current_memory() - self._baseline
+            if grown > self.memory_limit:
+                raise BudgetExceeded(f"memory budget of {self.memory_limit / 2**20:g} MiB exceeded "
+                                     f"({grown / 2**20:.0f} MiB used)", self.slices, now)
+    
+    def idle(self, start, end):
+        """Check the budget on an idle period."""
+        self._check(end)
+    
+    def record_slice(self, process_id, start, end, finished):
+        """Check the budget on an execution slice."""
+        self._check(end)
+    
+    def checkpoint_state(self):
+        """Nothing to checkpoint (a resumed run gets a fresh budget)."""
+        return None
+
+
+def run_budget(time_limit=None, memory_limit_mb=None):
+    """
+    Start a budget for one run, if any budget is set.
+    
+    Args:
+        time_limit (float): Seconds the run may take (None: unlimited)
+        memory_limit_mb (float): MiB the process may grow by during the run (None: unlimited)
+    
+    Returns:
+        RunBudget: The started budget, or None if neither limit is set
+    """
+    if not time_limit and not memory_limit_mb:
+        return None
+    return RunBudget(time_limit, memory_limit_mb)
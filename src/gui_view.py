@@ -1,11 +1,27 @@
 # GUI View - Tkinter-based graphical interface for the scheduler
 
+import concurrent.futures
+import os
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from tkinter import filedialog, messagebox, simpledialog, ttk
 import time
 from src.parser import parse_input
-from src.scheduler import run_fcfs, run_sjf, run_priority, run_rr
+from src.scheduler import run_rr, run_lottery, run_stride
 from src.cli_view import calculate_cpu_utilization, get_average_waiting_time, export_to_csv
+from src.trace import TraceReader, TRACE_EXTENSION
+from src.incremental import INCREMENTAL_ALGORITHMS, IncrementalScheduler
+from src.io_scheduler import has_io_bursts, run_io_bursts
+from src.log_config import worker_logging_kwargs
+from src.telemetry import Telemetry
+from src.simulator import ALGORITHM_NAMES, PROPORTIONAL_SHARE_NAMES, run_algorithm, summarize_run
+from src.checkpoint import workload_fingerprint
+from src.workload import prepare_workload
+
+# Maximum slices drawn when replaying a trace (the canvas cannot show more)
+MAX_REPLAY_SLICES = 2000
+
+# How often (ms) the Compare view checks its worker pool
+COMPARE_POLL_MS = 50
 
 
 class SchedulerApp:
@@ -31,6 +47,16 @@ class SchedulerApp:
         self.processes = []
         self.time_quantum = tk.IntVar(value=3)  # Default time quantum
         self.current_results = {}  # Store results for CSV export
+        self.engines = {}  # Incremental engines for FCFS/SJF/Priority (per loaded file)
+        self.workload = None  # Prepared workload shared by full re-runs (rebuilt after edits)
+        self.last_run = None  # (algorithm name, completed processes, Gantt chart) on display
+        
+        # Compare view: worker pool (created on first use), running jobs and
+        # the last comparison, keyed by workload fingerprint and quantum
+        self.executor = None
+        self.compare_jobs = {}  # Future -> algorithm name
+        self.compare_key = None  # (fingerprint, quantum) of the running comparison
+        self.compare_cache = None  # (fingerprint, {algorithm: (gantt_chart, completed)})
         
         # Colors for different processes in Gantt chart
         self.colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', 
@@ -42,6 +68,9 @@ class SchedulerApp:
         
         # Create GUI components
         self.create_widgets()
+        
+        # Stop the worker pool together with the window
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
     
     def create_widgets(self):
         """Create and layout all GUI components."""
@@ -73,6 +102,19 @@ class SchedulerApp:
         )
         self.lbl_file_path.pack(side=tk.LEFT, padx=10)
         
+        # Trace replay button
+        self.btn_replay_trace = tk.Button(
+            top_frame,
+            text="Replay Trace",
+            command=self.replay_trace,
+            bg="#7F8C8D",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            padx=10,
+            pady=5
+        )
+        self.btn_replay_trace.pack(side=tk.RIGHT, padx=10)
+        
         # Time Quantum input
         tk.Label(
             top_frame, 
@@ -94,12 +136,14 @@ class SchedulerApp:
         btn_frame = tk.Frame(self.root, bg="#ECF0F1", pady=15)
         btn_frame.pack(fill=tk.X)
         
-        # Create 4 algorithm buttons
+        # Create the algorithm buttons (4 classic + 2 proportional share)
         algorithms = [
             ("FCFS", self.run_fcfs, "#27AE60"),
             ("SJF", self.run_sjf, "#E67E22"),
             ("Priority", self.run_priority, "#8E44AD"),
-            ("Round Robin", self.run_rr, "#C0392B")
+            ("Round Robin", self.run_rr, "#C0392B"),
+            ("Lottery", self.run_lottery, "#16A085"),
+            ("Stride", self.run_stride, "#2980B9")
         ]
         
         for name, command, color in algorithms:
@@ -118,6 +162,21 @@ class SchedulerApp:
             # Store button reference with original color
             self.algorithm_buttons[name] = {'button': btn, 'original_color': color}
         
+        # Compare button (all algorithms side by side)
+        btn = tk.Button(
+            btn_frame,
+            text="Compare",
+            command=self.run_compare,
+            bg="#2C3E50",
+            fg="white",
+            font=("Arial", 11, "bold"),
+            width=12,
+            height=2,
+            relief=tk.RAISED
+        )
+        btn.pack(side=tk.LEFT, padx=15, expand=True)
+        self.algorithm_buttons["Compare"] = {'button': btn, 'original_color': "#2C3E50"}
+        
         # ===== BOTTOM SECTION: Results Display =====
         results_frame = tk.Frame(self.root, bg="white")
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -163,6 +222,9 @@ class SchedulerApp:
         
         self.tree.pack(fill=tk.BOTH, pady=5)
         
+        # Double-click a row to edit that process (what-if analysis)
+        self.tree.bind("<Double-1>", self.edit_process)
+        
         # Statistics Labels
         stats_frame = tk.Frame(results_frame, bg="white")
         stats_frame.pack(fill=tk.X, pady=10)
@@ -234,12 +296,25 @@ class SchedulerApp:
             pady=2
         )
         self.btn_export_csv.pack(side=tk.RIGHT, padx=5)
+        
+        # Telemetry button (time series of the displayed run)
+        self.btn_telemetry = tk.Button(
+            status_frame,
+            text="Telemetry",
+            command=self.show_telemetry,
+            bg="#2980B9",
+            fg="white",
+            font=("Arial", 9, "bold"),
+            padx=10,
+            pady=2
+        )
+        self.btn_telemetry.pack(side=tk.RIGHT, padx=5)
     
     def select_file(self):
         """Open file dialog to select input file."""
         file_path = filedialog.askopenfilename(
             title="Select Input File",
-            filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
+            filetypes=[("Text Files", "*.txt"), ("Compressed Files", "*.gz *.xz"), ("All Files", "*.*")]
         )
         
         if file_path:
@@ -250,6 +325,8 @@ class SchedulerApp:
             
             # Parse the file
             self.processes = parse_input(file_path)
+            self.engines = {}
+            self.workload = None
             if self.processes:
                 messagebox.showinfo("Success", f"Loaded {len(self.processes)} processes!")
             else:
@@ -332,6 +409,164 @@ class SchedulerApp:
         # Reset status after 2 seconds
         self.root.after(2000, lambda: self.lbl_status.config(text="Ready"))
     
+    def replay_trace(self):
+        """Re-render a recorded execution trace without running the simulation."""
+        trace_path = filedialog.askopenfilename(
+            title="Select Trace File",
+            filetypes=[("Scheduling Traces", f"*{TRACE_EXTENSION}"), ("All Files", "*.*")]
+        )
+        if not trace_path:
+            return
+        
+        try:
+            with TraceReader(trace_path) as reader:
+                gantt_chart = self.coalesce_slices(reader.iter_gantt())
+                stats = reader.summary()
+                algorithm = reader.algorithm or "Trace"
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Cannot read trace file.\n{e}")
+            return
+        
+        self.highlight_button(None)
+        self.last_run = None
+        self.canvas.delete("all")
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.draw_gantt_chart(gantt_chart)
+        
+        # Per-process times are not part of the trace
+        self.lbl_avg_turnaround.config(text="Average Turnaround Time: --")
+        self.lbl_avg_waiting.config(text="Average Waiting Time: --")
+        self.lbl_cpu_util.config(text=f"CPU Utilization: {stats['cpu_utilization']:.2f}%")
+        
+        shown = f", first {len(gantt_chart)} drawn" if len(gantt_chart) >= MAX_REPLAY_SLICES else ""
+        self.lbl_status.config(text=f"Replayed {algorithm}: {stats['slices']} slices{shown}")
+    
+    def coalesce_slices(self, slices, limit=MAX_REPLAY_SLICES):
+        """
+        Merge back-to-back slices of the same process and cap the slice count.
+        
+        Args:
+            slices (iterable): Tuples (process_id, start_time, end_time)
+            limit (int): Maximum number of slices to keep
+        
+        Returns:
+            list: Coalesced Gantt chart
+        """
+        gantt_chart = []
+        for process_id, start_time, end_time in slices:
+            if gantt_chart and gantt_chart[-1][0] == process_id and gantt_chart[-1][2] == start_time:
+                gantt_chart[-1] = (process_id, gantt_chart[-1][1], end_time)
+            elif len(gantt_chart) < limit:
+                gantt_chart.append((process_id, start_time, end_time))
+            else:
+                break
+        return gantt_chart
+    
+    def get_result(self, algorithm):
+        """
+        Schedule the loaded workload with a non-preemptive algorithm.
+        Workloads with I/O bursts go to the event-driven I/O engine, the
+        others to the incremental engine (kept for what-if edits).
+        
+        Args:
+            algorithm (str): 'FCFS', 'SJF' or 'Priority'
+        
+        Returns:
+            tuple: (gantt_chart, completed)
+        """
+        if has_io_bursts(self.processes):
+            return run_io_bursts(self.get_workload(), algorithm)
+        return self.get_engine(algorithm).result()
+    
+    def get_workload(self):
+        """
+        Return the loaded workload prepared for the engines (sorted once,
+        reused by every run until the next edit or file).
+        
+        Returns:
+            PreparedWorkload: Shared read-only workload
+        """
+        if self.workload is None:
+            self.workload = prepare_workload(self.processes)
+        return self.workload
+    
+    def get_engine(self, algorithm):
+        """
+        Return the incremental engine for a non-preemptive algorithm.
+        The engine is created (and runs the full simulation) on first use.
+        
+        Args:
+            algorithm (str): 'FCFS', 'SJF' or 'Priority'
+        
+        Returns:
+            IncrementalScheduler: Engine holding the current schedule
+        """
+        if algorithm not in self.engines:
+            self.engines[algorithm] = IncrementalScheduler(self.processes, algorithm)
+        return self.engines[algorithm]
+    
+    def edit_process(self, event=None):
+        """Edit the selected process and re-simulate only what the change affects."""
+        selection = self.tree.selection()
+        if not selection or not self.processes:
+            return
+        
+        process_id = str(self.tree.item(selection[0], "values")[0])
+        process = next((p for p in self.processes if p.process_id == process_id), None)
+        if process is None:
+            return
+        if process.bursts:
+            messagebox.showinfo("Edit Process", f"{process_id} has I/O bursts; edit them in the input file.")
+            return
+        
+        answer = simpledialog.askstring(
+            "Edit Process",
+            f"Arrival, Burst, Priority for {process_id}:",
+            initialvalue=f"{process.arrival_time},{process.burst_time},{process.priority}",
+            parent=self.root
+        )
+        if not answer:
+            return
+        
+        try:
+            arrival_time, burst_time, priority = (int(v.strip()) for v in answer.split(','))
+            if arrival_time < 0 or burst_time < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Enter three integers: arrival,burst,priority (non-negative times)")
+            return
+        
+        # Keep the loaded workload in sync for algorithms that rerun from scratch
+        process.arrival_time = arrival_time
+        process.burst_time = burst_time
+        process.remaining_time = burst_time
+        process.priority = priority
+        self.workload = None
+        
+        # Non-preemptive engines resume from their last checkpoint before the change
+        for algorithm, engine in self.engines.items():
+            gantt_chart, completed = engine.edit(process_id, arrival_time, burst_time, priority)
+            self.current_results[algorithm] = (list(completed), get_average_waiting_time(completed))
+        
+        if self.active_button in self.engines:
+            gantt_chart, completed = self.engines[self.active_button].result()
+            self.display_results(self.active_button, completed, gantt_chart)
+            resimulated = self.engines[self.active_button].resimulated
+            self.lbl_status.config(text=f"Edited {process_id} - re-simulated {resimulated} dispatches")
+        elif self.active_button in INCREMENTAL_ALGORITHMS:
+            # Workloads with I/O bursts have no engine; rerun the I/O engine
+            gantt_chart, completed = self.get_result(self.active_button)
+            self.current_results[self.active_button] = (list(completed), get_average_waiting_time(completed))
+            self.display_results(self.active_button, completed, gantt_chart)
+            self.lbl_status.config(text=f"Edited {process_id} - re-simulated from scratch")
+        elif self.active_button == "Round Robin":
+            self.run_rr()
+        elif self.active_button in PROPORTIONAL_SHARE_NAMES:
+            self.run_proportional_share(self.active_button)
+        elif self.active_button == "Compare":
+            self.run_compare()
+    
     def run_fcfs(self):
         """Run FCFS algorithm and display results."""
         if not self.check_file_loaded():
@@ -342,9 +577,9 @@ class SchedulerApp:
         self.lbl_status.config(text="Running FCFS...")
         self.root.update_idletasks()
         
-        gantt_chart, completed = run_fcfs(self.processes)
+        gantt_chart, completed = self.get_result("FCFS")
         avg_wt = get_average_waiting_time(completed)
-        self.current_results['FCFS'] = (completed, avg_wt)
+        self.current_results['FCFS'] = (list(completed), avg_wt)
         
         # Animate progress and display results
         self.animate_progress(lambda: self.display_results("FCFS", completed, gantt_chart))
@@ -359,9 +594,9 @@ class SchedulerApp:
         self.lbl_status.config(text="Running SJF...")
         self.root.update_idletasks()
         
-        gantt_chart, completed = run_sjf(self.processes)
+        gantt_chart, completed = self.get_result("SJF")
         avg_wt = get_average_waiting_time(completed)
-        self.current_results['SJF'] = (completed, avg_wt)
+        self.current_results['SJF'] = (list(completed), avg_wt)
         
         # Animate progress and display results
         self.animate_progress(lambda: self.display_results("SJF", completed, gantt_chart))
@@ -376,9 +611,9 @@ class SchedulerApp:
         self.lbl_status.config(text="Running Priority Scheduling...")
         self.root.update_idletasks()
         
-        gantt_chart, completed = run_priority(self.processes)
+        gantt_chart, completed = self.get_result("Priority")
         avg_wt = get_average_waiting_time(completed)
-        self.current_results['Priority'] = (completed, avg_wt)
+        self.current_results['Priority'] = (list(completed), avg_wt)
         
         # Animate progress and display results
         self.animate_progress(lambda: self.display_results("Priority", completed, gantt_chart))
@@ -403,13 +638,245 @@ class SchedulerApp:
         self.lbl_status.config(text=f"Running Round Robin (Q={quantum})...")
         self.root.update_idletasks()
         
-        gantt_chart, completed = run_rr(self.processes, quantum)
+        if has_io_bursts(self.processes):
+            gantt_chart, completed = run_io_bursts(self.get_workload(), 'Round Robin', quantum)
+        else:
+            gantt_chart, completed = run_rr(self.get_workload(), quantum)
         avg_wt = get_average_waiting_time(completed)
         self.current_results['Round Robin'] = (completed, avg_wt)
         
         # Animate progress and display results
         self.animate_progress(lambda: self.display_results(f"Round Robin (Q={quantum})", completed, gantt_chart))
     
+    def run_lottery(self):
+        """Run Lottery scheduling and display results."""
+        self.run_proportional_share("Lottery")
+    
+    def run_stride(self):
+        """Run Stride scheduling and display results."""
+        self.run_proportional_share("Stride")
+    
+    def run_proportional_share(self, algorithm):
+        """
+        Run Lottery or Stride scheduling (tickets from the priority column) and display results.
+        
+        Args:
+            algorithm (str): 'Lottery' or 'Stride'
+        """
+        if not self.check_file_loaded():
+            return
+        if has_io_bursts(self.processes):
+            messagebox.showerror("Error", f"{algorithm} does not support CPU/I-O burst sequences.")
+            return
+        
+        # Get time quantum value
+        try:
+            quantum = self.time_quantum.get()
+            if quantum <= 0:
+                messagebox.showerror("Error", "Time quantum must be greater than 0!")
+                return
+        except tk.TclError:
+            messagebox.showerror("Error", "Invalid time quantum value!")
+            return
+        
+        # Highlight button
+        self.highlight_button(algorithm)
+        self.lbl_status.config(text=f"Running {algorithm} (Q={quantum})...")
+        self.root.update_idletasks()
+        
+        engine = run_lottery if algorithm == "Lottery" else run_stride
+        gantt_chart, completed = engine(self.get_workload(), quantum)
+        avg_wt = get_average_waiting_time(completed)
+        self.current_results[algorithm] = (completed, avg_wt)
+        
+        # Animate progress and display results
+        self.animate_progress(lambda: self.display_results(f"{algorithm} (Q={quantum})", completed, gantt_chart))
+    
+    def run_compare(self):
+        """
+        Run every algorithm concurrently in the worker pool and compare them.
+        Results are reused while the workload and quantum stay the same.
+        """
+        if not self.check_file_loaded():
+            return
+        if self.compare_jobs:
+            return  # A comparison is already running
+        
+        # Get time quantum value
+        try:
+            quantum = self.time_quantum.get()
+            if quantum <= 0:
+                messagebox.showerror("Error", "Time quantum must be greater than 0!")
+                return
+        except tk.TclError:
+            messagebox.showerror("Error", "Invalid time quantum value!")
+            return
+        
+        self.highlight_button("Compare")
+        
+        # Edits change the fingerprint, so a cached comparison is never stale
+        fingerprint = workload_fingerprint(self.processes, 'Compare', quantum)
+        if self.compare_cache and self.compare_cache[0] == fingerprint:
+            self.lbl_status.config(text=f"Comparison (Q={quantum}) unchanged - cached results")
+            self.show_comparison(quantum, self.compare_cache[1])
+            return
+        
+        # Lottery and Stride join the comparison unless processes do I/O
+        algorithms = ALGORITHM_NAMES
+        if not has_io_bursts(self.processes):
+            algorithms += PROPORTIONAL_SHARE_NAMES
+        
+        if self.executor is None:
+            workers = min(len(ALGORITHM_NAMES + PROPORTIONAL_SHARE_NAMES), os.cpu_count() or 1)
+            self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers, **worker_logging_kwargs())
+        
+        self.compare_key = (fingerprint, quantum)
+        self.compare_jobs = {
+            self.executor.submit(run_algorithm, algorithm, self.get_workload(), quantum): algorithm
+            for algorithm in algorithms
+        }
+        self.progress_bar['value'] = 0
+        self.lbl_status.config(text=f"Comparing {len(algorithms)} algorithms (Q={quantum})...")
+        
+        # Poll instead of waiting, so the window stays responsive
+        self.root.after(COMPARE_POLL_MS, self.poll_compare)
+    
+    def poll_compare(self):
+        """Track the running comparison and show it once every algorithm is done."""
+        done = sum(future.done() for future in self.compare_jobs)
+        self.progress_bar['value'] = done * 100 / len(self.compare_jobs)
+        if done < len(self.compare_jobs):
+            self.root.after(COMPARE_POLL_MS, self.poll_compare)
+            return
+        
+        jobs, self.compare_jobs = self.compare_jobs, {}
+        fingerprint, quantum = self.compare_key
+        try:
+            finished = {algorithm: future.result() for future, algorithm in jobs.items()}
+        except concurrent.futures.BrokenExecutor as e:
+            # A worker died: start a fresh pool next time
+            self.executor = None
+            messagebox.showerror("Error", f"Comparison failed.\n{e}")
+            self.lbl_status.config(text="Ready")
+            return
+        except ValueError as e:
+            messagebox.showerror("Error", f"Comparison failed.\n{e}")
+            self.lbl_status.config(text="Ready")
+            return
+        
+        # Lanes and table rows in the usual algorithm order (the order of submission)
+        results = {algorithm: finished[algorithm] for algorithm in jobs.values()}
+        self.compare_cache = (fingerprint, results)
+        for algorithm, (gantt_chart, completed) in results.items():
+            self.current_results[algorithm] = (list(completed), get_average_waiting_time(completed))
+        
+        self.lbl_status.config(text="Completed ✅")
+        self.root.after(2000, lambda: self.lbl_status.config(text="Ready"))
+        self.show_comparison(quantum, results)
+    
+    def show_comparison(self, quantum, results):
+        """
+        Show stacked Gantt lanes on a shared time axis and a metric table.
+        
+        Args:
+            quantum (int): Time Quantum used for Round Robin, Lottery and Stride
+            results (dict): Algorithm name -> (gantt_chart, completed)
+        """
+        window = tk.Toplevel(self.root)
+        window.title(f"Compare - all algorithms (Q={quantum})")
+        
+        lane_height, lane_gap = 34, 16
+        x_left, x_right = 110, 840
+        y_first = 20
+        axis_y = y_first + len(results) * (lane_height + lane_gap)
+        canvas = tk.Canvas(window, width=860, height=axis_y + 30, bg="white")
+        canvas.pack(fill=tk.X, padx=10, pady=(10, 0))
+        
+        # Shared time axis: the longest schedule sets the scale
+        end_time = max((gantt_chart[-1][2] for gantt_chart, _ in results.values() if gantt_chart), default=0)
+        scale = (x_right - x_left) / end_time if end_time > 0 else 1
+        
+        # Same color for a process in every lane
+        process_colors = {'IDLE': '#BDC3C7'}
+        for i, process in enumerate(self.processes):
+            process_colors.setdefault(process.process_id, self.colors[i % len(self.colors)])
+        
+        for row, (algorithm, (gantt_chart, _)) in enumerate(results.items()):
+            y_top = y_first + row * (lane_height + lane_gap)
+            label = f"RR (Q={quantum})" if algorithm == 'Round Robin' else algorithm
+            canvas.create_text(x_left - 10, y_top + lane_height / 2, text=label,
+                               anchor=tk.E, font=("Arial", 10, "bold"))
+            self.draw_lane(canvas, gantt_chart, x_left, y_top, lane_height, scale, process_colors)
+        
+        # Axis with ticks at quarters of the longest schedule
+        canvas.create_line(x_left, axis_y, x_right, axis_y)
+        for i in range(5):
+            time_mark = end_time * i // 4
+            x = x_left + time_mark * scale
+            canvas.create_line(x, axis_y, x, axis_y + 4)
+            canvas.create_text(x, axis_y + 14, text=str(time_mark), font=("Arial", 8))
+        
+        # Metric summary, best average waiting time highlighted
+        columns = ("Algorithm", "Avg Waiting", "Avg Turnaround", "Avg Response", "CPU Util (%)", "Makespan")
+        table = ttk.Treeview(window, columns=columns, show="headings", height=len(results))
+        for col in columns:
+            table.heading(col, text=col)
+            table.column(col, width=135, anchor=tk.CENTER)
+        table.tag_configure("best", background="#FFF3CD")
+        
+        summaries = {algorithm: summarize_run(gantt_chart, completed)
+                     for algorithm, (gantt_chart, completed) in results.items()}
+        best = min(summaries, key=lambda algorithm: summaries[algorithm]['avg_waiting_time'])
+        for algorithm, (gantt_chart, completed) in results.items():
+            metrics = summaries[algorithm]
+            avg_response = sum(p.start_time - p.arrival_time for p in completed) / len(completed)
+            table.insert("", tk.END, tags=("best",) if algorithm == best else (), values=(
+                algorithm,
+                f"{metrics['avg_waiting_time']:.2f}",
+                f"{metrics['avg_turnaround_time']:.2f}",
+                f"{avg_response:.2f}",
+                f"{metrics['cpu_utilization']:.2f}",
+                gantt_chart[-1][2] if gantt_chart else 0
+            ))
+        table.pack(fill=tk.X, padx=10, pady=10)
+    
+    def draw_lane(self, canvas, gantt_chart, x_left, y_top, height, scale, process_colors):
+        """
+        Draw one algorithm's schedule as a Gantt lane.
+        Slices narrower than a pixel are folded into the next visible one,
+        so long schedules draw at most one rectangle per pixel.
+        
+        Args:
+            canvas (tk.Canvas): Target canvas
+            gantt_chart (list): List of (process_id, start_time, end_time)
+            x_left (int): X coordinate of time 0
+            y_top (int): Top of the lane
+            height (int): Lane height
+            scale (float): Pixels per time unit
+            process_colors (dict): Process ID -> fill color
+        """
+        y_bottom = y_top + height
+        drawn_to = x_left  # Right edge of the last rectangle drawn
+        for process_id, start_time, end_time in gantt_chart:
+            x2 = x_left + end_time * scale
+            if x2 - drawn_to < 1:
+                continue
+            x1 = max(x_left + start_time * scale, drawn_to)
+            canvas.create_rectangle(x1, y_top, x2, y_bottom,
+                                    fill=process_colors.get(process_id, '#7F8C8D'), outline="black")
+            if x2 - x1 > 24:
+                canvas.create_text((x1 + x2) / 2, (y_top + y_bottom) / 2, text=process_id,
+                                   font=("Arial", 8, "bold"),
+                                   fill="white" if process_id != 'IDLE' else "black")
+            drawn_to = x2
+    
+    def close(self):
+        """Stop the worker pool and close the window."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.root.destroy()
+    
     def display_results(self, algorithm_name, processes, gantt_chart):
         """
         Display scheduling results in the GUI.
@@ -423,6 +890,7 @@ class SchedulerApp:
         self.canvas.delete("all")
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self.last_run = (algorithm_name, processes, gantt_chart)
         
         # Draw Gantt Chart
         self.draw_gantt_chart(gantt_chart)
@@ -448,6 +916,66 @@ class SchedulerApp:
         self.lbl_avg_waiting.config(text=f"Average Waiting Time: {avg_waiting:.2f}")
         self.lbl_cpu_util.config(text=f"CPU Utilization: {cpu_util:.2f}%")
     
+    def show_telemetry(self):
+        """Plot windowed time series of the displayed run in a new window."""
+        if not self.last_run:
+            messagebox.showwarning("No Results", "Please run an algorithm first!")
+            return
+        
+        algorithm_name, processes, gantt_chart = self.last_run
+        series = Telemetry.from_run(processes, gantt_chart).series()
+        
+        window = tk.Toplevel(self.root)
+        window.title(f"Telemetry - {algorithm_name} (window = {series['window']} time units)")
+        canvas = tk.Canvas(window, width=760, height=560, bg="white")
+        canvas.pack(fill=tk.BOTH, expand=True)
+        
+        # One chart per series, stacked, sharing the time axis
+        charts = [
+            ("Ready queue length (avg)", series['ready_queue'], "#E67E22"),
+            ("In flight (avg)", series['in_flight'], "#8E44AD"),
+            ("Throughput (completions)", series['throughput'], "#27AE60"),
+            ("CPU utilization (%)", series['utilization'], "#3498DB"),
+        ]
+        for row, (title, values, color) in enumerate(charts):
+            self.draw_series(canvas, 20 + row * 135, title, values, color, series['window'], series['end'])
+    
+    def draw_series(self, canvas, y_top, title, values, color, window, end_time):
+        """
+        Draw one time series as a step line with its axis.
+        
+        Args:
+            canvas (tk.Canvas): Target canvas
+            y_top (int): Top of the chart area
+            title (str): Chart title
+            values (list): One value per window
+            color (str): Line color
+            window (int): Window width in time units
+            end_time (int): Last time in the run
+        """
+        x_left, x_right = 60, 740
+        height = 90
+        y_bottom = y_top + height
+        
+        canvas.create_text(x_left, y_top - 8, text=title, anchor=tk.W, font=("Arial", 9, "bold"))
+        canvas.create_line(x_left, y_bottom, x_right, y_bottom)
+        canvas.create_line(x_left, y_top, x_left, y_bottom)
+        if not values or end_time <= 0:
+            return
+        
+        top_value = max(values) or 1
+        canvas.create_text(x_left - 5, y_top, text=f"{top_value:g}", anchor=tk.E, font=("Arial", 8))
+        canvas.create_text(x_left - 5, y_bottom, text="0", anchor=tk.E, font=("Arial", 8))
+        canvas.create_text(x_right, y_bottom + 10, text=str(end_time), anchor=tk.E, font=("Arial", 8))
+        
+        # Step line: flat across each window
+        scale = (x_right - x_left) / end_time
+        points = []
+        for i, value in enumerate(values):
+            y = y_bottom - value / top_value * height
+            points.extend((x_left + i * window * scale, y, x_left + min((i + 1) * window, end_time) * scale, y))
+        canvas.create_line(*points, fill=color, width=2)
+    
     def draw_gantt_chart(self, gantt_chart):
         """
         Draw Gantt chart on canvas with colored rectangles.
@@ -0,0 +1,182 @@
+# Incremental re-simulation for non-preemptive scheduling
+# The engine keeps periodic checkpoints while it runs. After a small edit to
+# one process (arrival, burst or priority), everything scheduled before the
+# edited process could have arrived is still valid, so the engine resumes
+# from the last checkpoint before that point and re-simulates only the rest.
+#
+# Results are identical to run_fcfs / run_sjf / run_priority, including the
+# FCFS-by-arrival tie-breaking (ties go to the earlier process in arrival order).
+
+import bisect
+import copy
+import heapq
+import math
+
+# Algorithms the engine supports (all non-preemptive)
+INCREMENTAL_ALGORITHMS = ('FCFS', 'SJF', 'Priority')
+
+
+class IncrementalScheduler:
+    """
+    Non-preemptive scheduler with checkpoints and an edit API.
+    """
+    
+    def __init__(self, processes, algorithm='FCFS', checkpoint_interval=None):
+        """
+        Prepare the engine and run the initial simulation.
+        
+        Args:
+            processes (list): List of Process objects (copied, not modified)
+            algorithm (str): 'FCFS', 'SJF' or 'Priority'
+            checkpoint_interval (int): Minimum dispatches between checkpoints
+                                       (default: about sqrt(number of processes));
+                                       larger while the ready queue is longer
+        """
+        if algorithm not in INCREMENTAL_ALGORITHMS:
+            raise ValueError(f"Incremental re-simulation supports {', '.join(INCREMENTAL_ALGORITHMS)}, "
+                             f"not {algorithm}")
+        
+        self.algorithm = algorithm
+        self.checkpoint_interval = checkpoint_interval or max(16, math.isqrt(len(processes)))
+        
+        # Arrival order with the same stable tie-breaking as list.sort():
+        # equal arrival times keep their input order
+        self._processes = copy.deepcopy(processes)
+        self._input_index = {id(p): i for i, p in enumerate(self._processes)}
+        self._by_id = {p.process_id: p for p in self._processes}
+        self._order = sorted(self._processes, key=lambda p: p.arrival_time)
+        self._order_keys = [(p.arrival_time, self._input_index[id(p)]) for p in self._order]
+        
+        self.gantt_chart = []
+        self.completed = []
+        self._checkpoints = []
+        self.resimulated = 0  # Dispatches performed by the last run/edit
+        
+        self._simulate(self._initial_state())
+    
+    def _key(self, process, seq):
+        """Ready-queue ordering key; seq (arrival position) breaks ties."""
+        if self.algorithm == 'SJF':
+            return (process.burst_time, seq)
+        if self.algorithm == 'Priority':
+            return (process.priority, seq)
+        return (seq,)
+    
+    def _initial_state(self):
+        """Checkpoint representing the start of the run (valid for every edit)."""
+        return (0, 0, (), 0, 0)
+    
+    def _simulate(self, checkpoint):
+        """
+        Run the simulation from a checkpoint to the end.
+        
+        Args:
+            checkpoint (tuple): (current_time, cursor, ready heap,
+                                 gantt length, completed length)
+        """
+        current_time, cursor, ready, gantt_len, completed_len = checkpoint
+        del self.gantt_chart[gantt_len:]
+        del self.completed[completed_len:]
+        
+        order = self._order
+        total = len(order)
+        ready = list(ready)
+        gantt_chart = self.gantt_chart
+        completed = self.completed
+        next_checkpoint = self.checkpoint_interval
+        dispatches = 0
+        
+        while cursor < total or ready:
+            # Periodic checkpoint before pulling arrivals at current_time. The
+            # next one is at least a ready queue's length away, so the stored
+            # heaps add up to O(n) and restoring one never costs more than
+            # re-simulating the dispatches since it
+            if dispatches >= next_checkpoint:
+                self._checkpoints.append((current_time, cursor, tuple(ready),
+                                          len(gantt_chart), len(completed)))
+                next_checkpoint = dispatches + max(self.checkpoint_interval, len(ready))
+            
+            # Move every arrived process into the ready queue
+            while cursor < total and order[cursor].arrival_time <= current_time:
+                heapq.heappush(ready, (self._key(order[cursor], cursor), cursor))
+                cursor += 1
+            
+            if not ready:
+                # CPU is idle, jump to next process arrival
+                next_arrival = order[cursor].arrival_time
+                gantt_chart.append(('IDLE', current_time, next_arrival))
+                current_time = next_arrival
+                continue
+            
+            _, seq = heapq.heappop(ready)
+            process = order[seq]
+            
+            # Process runs to completion
+            process.start_time = current_time
+            current_time += process.burst_time
+            process.finish_time = current_time
+            process.turnaround_time = process.finish_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+            
+            gantt_chart.append((process.process_id, process.start_time, process.finish_time))
+            completed.append(process)
+            dispatches += 1
+        
+        self.resimulated = dispatches
+    
+    def result(self):
+        """
+        Current schedule.
+        
+        Returns:
+            tuple: (gantt_chart, completed), as returned by the run_* functions.
+                   The lists are owned by the engine; do not modify them.
+        """
+        return self.gantt_chart, self.completed
+    
+    def edit(self, process_id, arrival_time=None, burst_time=None, priority=None):
+        """
+        Change one process and re-simulate only the affected suffix.
+        
+        Args:
+            process_id (str): ID of the process to change
+            arrival_time (int): New arrival time (None keeps the current value)
+            burst_time (int): New burst time (None keeps the current value)
+            priority (int): New priority (None keeps the current value)
+        
+        Returns:
+            tuple: (gantt_chart, completed) after the edit
+        
+        Raises:
+            KeyError: If no process has this ID
+        """
+        process = self._by_id[process_id]
+        old_arrival = process.arrival_time
+        new_arrival = old_arrival if arrival_time is None else arrival_time
+        
+        # Nothing decided before the earlier of the old and new arrival can
+        # change, so keep only checkpoints taken strictly before that time
+        affected_from = min(old_arrival, new_arrival)
+        while self._checkpoints and self._checkpoints[-1][0] >= affected_from:
+            self._checkpoints.pop()
+        checkpoint = self._checkpoints[-1] if self._checkpoints else self._initial_state()
+        
+        # Apply the edit, moving the process to its new arrival position
+        if new_arrival != old_arrival:
+            input_index = self._input_index[id(process)]
+            position = bisect.bisect_left(self._order_keys, (old_arrival, input_index))
+            del self._order[position]
+            del self._order_keys[position]
+            process.arrival_time = new_arrival
+            position = bisect.bisect_left(self._order_keys, (new_arrival, input_index))
+            self._order.insert(position, process)
+            self._order_keys.insert(position, (new_arrival, input_index))
+        
+        if burst_time is not None:
+            process.burst_time = burst_time
+            process.remaining_time = burst_time
+        if priority is not None:
+            process.priority = priority
+        
+        self._simulate(checkpoint)
+        return self.result()
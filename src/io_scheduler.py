@@ -0,0 +1,181 @@
+# Event-driven scheduling of CPU/I-O burst sequences
+# A process alternates CPU bursts and I/O bursts (see Process.bursts). When a
+# CPU burst ends with more work left, the process blocks: it leaves the CPU
+# and a wake-up event for the end of its I/O burst goes into a heap. Time
+# jumps from event to event (dispatch, burst end, arrival, wake-up), so the
+# cost depends on the number of bursts, never on their length.
+#
+# I/O devices are not a bottleneck: every blocked process does its I/O in
+# parallel with the others. When nothing is ready the CPU idles until the
+# next arrival or wake-up, and the idle time appears in the Gantt chart, so
+# calculate_cpu_utilization() counts it.
+
+import collections
+import heapq
+import logging
+
+from src.scheduler import _log_slice
+from src.workload import PreparedWorkload, prepare_workload
+
+logger = logging.getLogger(__name__)
+
+# Algorithms this engine schedules (display names, as in simulator.ALGORITHM_NAMES)
+IO_ALGORITHMS = ('FCFS', 'SJF', 'Priority', 'Round Robin')
+
+# Algorithm names used in slice log lines (same as the run_* functions)
+_LOG_NAMES = {'FCFS': 'FCFS', 'SJF': 'SJF', 'Priority': 'Priority', 'Round Robin': 'RR'}
+
+
+def has_io_bursts(processes):
+    """
+    Check whether any process has I/O bursts.
+    
+    Args:
+        processes (list | PreparedWorkload): List of Process objects or a prepared workload
+    
+    Returns:
+        bool: True if the workload needs the I/O-aware engine
+    """
+    if isinstance(processes, PreparedWorkload):
+        return processes.has_io
+    return any(p.bursts for p in processes)
+
+
+def run_io_bursts(processes, algorithm, time_quantum=3, trace_writer=None):
+    """
+    Schedule processes with CPU/I-O burst sequences.
+    
+    FCFS, SJF and Priority are non-preemptive per CPU burst; SJF picks the
+    shortest next CPU burst. Round Robin preempts after time_quantum. A
+    process that returns from I/O queues up behind the processes already
+    waiting (ties in SJF and Priority go to the one that became ready
+    first). Processes without I/O bursts are scheduled exactly like the
+    run_* functions schedule them.
+    
+    Args:
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
+        algorithm (str): 'FCFS', 'SJF', 'Priority' or 'Round Robin'
+        time_quantum (int): Time slice for Round Robin (default: 3)
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
+    
+    Returns:
+        tuple: (gantt_chart, processes) where gantt_chart shows CPU execution
+               and idle time; waiting_time excludes time spent in I/O
+    
+    Raises:
+        ValueError: For an unknown algorithm or a bad quantum
+    """
+    if algorithm not in IO_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    round_robin = algorithm == 'Round Robin'
+    if round_robin and time_quantum <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    workload = prepare_workload(processes)
+    processes = workload.copy_processes()
+    
+    # Per-process state, by position in arrival order
+    bursts = [p.bursts or (p.burst_time,) for p in processes]
+    burst_index = [0] * len(processes)  # Current CPU burst (even index into bursts)
+    remaining = [b[0] for b in bursts]  # Time left in the current CPU burst
+    
+    # Ready queue: FIFO for FCFS / Round Robin, heap of (key, seq, position) otherwise
+    fifo = algorithm in ('FCFS', 'Round Robin')
+    ready_queue = collections.deque() if fifo else []
+    wakeups = []  # Heap of (wake-up time, seq, position) for blocked processes
+    seq = 0  # Order in which processes became ready (tie-breaker)
+    
+    current_time = 0
+    gantt_chart = []
+    completed = []
+    cursor = 0  # Next process (in arrival order) that has not arrived yet
+    total = len(processes)
+    log_name = _LOG_NAMES[algorithm]
+    log_slices = logger.isEnabledFor(logging.DEBUG)
+    
+    def make_ready(position):
+        nonlocal seq
+        if fifo:
+            ready_queue.append(position)
+        else:
+            key = remaining[position] if algorithm == 'SJF' else processes[position].priority
+            heapq.heappush(ready_queue, (key, seq, position))
+        seq += 1
+    
+    def release(now):
+        # Arrivals and I/O completions up to `now`, in time order (arrivals first on ties)
+        nonlocal cursor
+        while True:
+            arrival = processes[cursor].arrival_time if cursor < total else None
+            wake = wakeups[0][0] if wakeups else None
+            if arrival is not None and arrival <= now and (wake is None or arrival <= wake):
+                make_ready(cursor)
+                cursor += 1
+            elif wake is not None and wake <= now:
+                make_ready(heapq.heappop(wakeups)[2])
+            else:
+                return
+    
+    while len(completed) < total:
+        release(current_time)
+        
+        # Check if ready queue is empty
+        if not ready_queue:
+            # CPU is idle (everyone is blocked or not here yet), jump to the next event
+            candidates = []
+            if cursor < total:
+                candidates.append(processes[cursor].arrival_time)
+            if wakeups:
+                candidates.append(wakeups[0][0])
+            next_event = min(candidates)
+            gantt_chart.append(('IDLE', current_time, next_event))
+            if log_slices:
+                _log_slice(log_name, 'IDLE', current_time, next_event)
+            if trace_writer:
+                trace_writer.idle(current_time, next_event)
+            current_time = next_event
+            continue
+        
+        # Dispatch the next process
+        position = ready_queue.popleft() if fifo else heapq.heappop(ready_queue)[2]
+        process = processes[position]
+        
+        # Record start time (only first time it gets CPU)
+        if process.start_time is None:
+            process.start_time = current_time
+        
+        # Run the rest of the CPU burst (at most one quantum for Round Robin)
+        execution_time = min(time_quantum, remaining[position]) if round_robin else remaining[position]
+        start = current_time
+        current_time += execution_time
+        remaining[position] -= execution_time
+        
+        index = burst_index[position]
+        finished = remaining[position] == 0 and index + 1 >= len(bursts[position])
+        gantt_chart.append((process.process_id, start, current_time))
+        if log_slices:
+            _log_slice(log_name, process.process_id, start, current_time)
+        if trace_writer:
+            trace_writer.record_slice(process.process_id, start, current_time, finished)
+        
+        if remaining[position]:
+            # Preempted (Round Robin): newcomers during the slice queue up first
+            release(current_time)
+            make_ready(position)
+        elif finished:
+            # Last CPU burst done
+            process.remaining_time = 0
+            process.finish_time = current_time
+            process.turnaround_time = process.finish_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time - process.io_time
+            completed.append(process)
+        else:
+            # CPU burst done: block for the following I/O burst
+            burst_index[position] = index + 2
+            remaining[position] = bursts[position][index + 2]
+            heapq.heappush(wakeups, (current_time + bursts[position][index + 1], seq, position))
+            seq += 1
+    
+    return gantt_chart, completed
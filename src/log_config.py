@@ -0,0 +1,284 @@
+# Logging pipeline for the scheduling simulator
+# Log records are handed to a background thread through a queue, so file
+# writes (and JSON formatting) never happen on the simulation hot path.
+# Pool workers get a QueueHandler on a multiprocessing queue drained in the
+# parent (see worker_logging_kwargs), so only the parent writes the file.
+
+import logging
+import logging.handlers
+import queue
+import time
+from logging.handlers import QueueListener, RotatingFileHandler
+
+
+# Supported log file formats
+LOG_FORMATS = ('text', 'json')
+
+# Classic text format used by simulation.log
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+TEXT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_STANDARD_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# State of the last setup_logging() call, shared with pool workers:
+# the file handler, root level, sample rate and (once a pool asks for it)
+# the cross-process queue and the listener draining it
+_file_handler = None
+_worker_level = logging.INFO
+_worker_sample_rate = 1.0
+_worker_queue = None
+_worker_listener = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Format each log record as one JSON object per line.
+    Every line carries the run ID and the time elapsed since the run started,
+    plus any structured fields passed through `extra=`.
+    """
+    
+    def __init__(self, run_id, start_time=None):
+        """
+        Initialize the formatter.
+        
+        Args:
+            run_id (str): Identifier shared by all records of one run
+            start_time (float): Run start as time.time() (default: now)
+        """
+        super().__init__()
+        # json is only needed for this format; keep it off the CLI startup path
+        import json
+        self._dumps = json.dumps
+        self.run_id = run_id
+        self.start_time = time.time() if start_time is None else start_time
+    
+    def format(self, record):
+        """
+        Convert a log record to a JSON line.
+        
+        Args:
+            record (logging.LogRecord): Record to format
+        
+        Returns:
+            str: JSON-encoded record
+        """
+        entry = {
+            'ts': round(record.created, 6),
+            'elapsed_ms': round((record.created - self.start_time) * 1000, 3),
+            'run_id': self.run_id,
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        
+        # Structured event fields (e.g. event, algorithm, process_id, start, end)
+        for key, value in vars(record).items():
+            if key not in _STANDARD_RECORD_ATTRS and key not in entry:
+                entry[key] = value
+        
+        # QueueHandler has already rendered the traceback into exc_text
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        
+        return self._dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of high-volume DEBUG events.
+    Records at INFO level and above always pass. Sampling is deterministic
+    (every 1/rate-th event is kept), so runs are reproducible.
+    """
+    
+    def __init__(self, sample_rate=1.0):
+        """
+        Initialize the filter.
+        
+        Args:
+            sample_rate (float): Fraction of DEBUG records to keep, 0.0 to 1.0
+        """
+        super().__init__()
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("Sample rate must be between 0.0 and 1.0")
+        self.sample_rate = sample_rate
+        self._credit = 0.0
+    
+    def filter(self, record):
+        """
+        Decide whether a record is kept.
+        
+        Args:
+            record (logging.LogRecord): Candidate record
+        
+        Returns:
+            bool: True if the record should be logged
+        """
+        if record.levelno > logging.DEBUG or self.sample_rate >= 1.0:
+            return True
+        
+        # Accumulate credit; emit one record for every whole unit collected
+        self._credit += self.sample_rate
+        if self._credit >= 1.0:
+            self._credit -= 1.0
+            return True
+        return False
+
+
+# Renders tracebacks the same way for both log formats
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """
+    logging.handlers.QueueHandler that keeps the record's traceback.
+    The stock prepare() drops exc_info and exc_text, so the traceback is
+    rendered into exc_text first and restored on the queued copy.
+    """
+    
+    def format(self, record):
+        """
+        Merge the arguments into the message; the traceback is kept apart
+        in exc_text instead of being appended to the message.
+        
+        Args:
+            record (logging.LogRecord): Record being queued
+        
+        Returns:
+            str: The record's message
+        """
+        return record.getMessage()
+    
+    def prepare(self, record):
+        """
+        Make a record safe to queue (and to pickle for another process).
+        
+        Args:
+            record (logging.LogRecord): Record being queued
+        
+        Returns:
+            logging.LogRecord: Prepared copy with exc_text set
+        """
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+        record = super().prepare(record)
+        record.exc_text = exc_text
+        return record
+
+
+def setup_logging(filename='simulation.log', log_format='text', level=logging.INFO,
+                  max_bytes=0, backup_count=3, sample_rate=1.0, run_id=None):
+    """
+    Route all logging through a queue to a background file writer.
+    
+    Args:
+        filename (str): Log file path (default: 'simulation.log')
+        log_format (str): 'text' (classic lines) or 'json' (JSON lines)
+        level (int): Root logger level; DEBUG enables per-slice scheduler events
+        max_bytes (int): Rotate the file at this size; 0 disables rotation
+        backup_count (int): Rotated files to keep when rotation is enabled
+        sample_rate (float): Fraction of DEBUG events to keep (default: 1.0)
+        run_id (str): Run identifier for JSON lines (default: random)
+    
+    Returns:
+        logging.handlers.QueueListener: Started listener; pass it to
+            stop_logging() to flush
+    """
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Unknown log format: {log_format}")
+    
+    # File handler runs on the listener threads only
+    if max_bytes > 0:
+        file_handler = RotatingFileHandler(filename, maxBytes=max_bytes,
+                                           backupCount=backup_count, encoding='utf-8')
+    else:
+        file_handler = logging.FileHandler(filename, encoding='utf-8')
+    
+    if log_format == 'json':
+        import uuid
+        run_id = run_id or uuid.uuid4().hex[:12]
+        file_handler.setFormatter(JsonLinesFormatter(run_id))
+    else:
+        file_handler.setFormatter(logging.Formatter(TEXT_FORMAT, datefmt=TEXT_DATE_FORMAT))
+    
+    global _file_handler, _worker_level, _worker_sample_rate
+    _file_handler = file_handler
+    _worker_level = level
+    _worker_sample_rate = sample_rate
+    
+    # Callers only pay for a filter check and a queue put
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_rate))
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+    
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    
+    return listener
+
+
+def _configure_worker(log_queue, level, sample_rate):
+    """
+    Pool initializer: send the worker's records to the parent's log file.
+    Forked workers inherit the parent's QueueHandler, whose queue nothing
+    reads in the child, so it is replaced rather than added to.
+    
+    Args:
+        log_queue (multiprocessing.Queue): Queue drained by the parent
+        level (int): Root logger level
+        sample_rate (float): Fraction of DEBUG events to keep
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_rate))
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+
+def worker_logging_kwargs():
+    """
+    Keyword arguments that make a ProcessPoolExecutor's workers log through
+    the parent: their records cross a multiprocessing queue to a listener
+    thread writing with setup_logging()'s file handler, so rotation stays
+    in one process.
+    
+    Returns:
+        dict: initializer/initargs, or empty if logging was not set up
+    """
+    global _worker_queue, _worker_listener
+    if _file_handler is None:
+        return {}
+    
+    # Created on first use: in-process records stay on the cheaper SimpleQueue
+    if _worker_queue is None:
+        import multiprocessing
+        _worker_queue = multiprocessing.Queue()
+        _worker_listener = QueueListener(_worker_queue, _file_handler, respect_handler_level=True)
+        _worker_listener.start()
+    return {'initializer': _configure_worker,
+            'initargs': (_worker_queue, _worker_level, _worker_sample_rate)}
+
+
+def stop_logging(listener):
+    """
+    Write every queued record, from this process and from pool workers.
+    
+    Args:
+        listener (logging.handlers.QueueListener): Result of setup_logging()
+    """
+    global _worker_queue, _worker_listener
+    if _worker_listener is not None:
+        _worker_listener.stop()
+        _worker_queue.close()
+        _worker_queue = _worker_listener = None
+    listener.stop()
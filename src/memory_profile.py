@@ -0,0 +1,150 @@
+# Optional memory profiling with tracemalloc
+# Each profiled phase (parsing, one algorithm run, the CSV export) reports
+# its peak allocation, the bytes it left allocated afterwards and the source
+# lines responsible for them. Disabled profiling costs nothing: phases are
+# plain null contexts, and tracemalloc (which imports pickle) is not even
+# imported.
+
+import contextlib
+import logging
+import os
+
+# Allocation sites reported per phase
+DEFAULT_TOP_SITES = 5
+
+# Stack depth recorded per allocation, so library internals (copy.deepcopy,
+# csv, ...) can be attributed to the simulator line that called them
+TRACE_FRAMES = 16
+
+# Frames that belong to the profiler itself, not to the simulator
+_IGNORED_FILES = ('<frozen importlib._bootstrap>', '<frozen importlib._bootstrap_external>', '<unknown>')
+
+
+class MemoryProfiler:
+    """
+    Collects per-phase tracemalloc measurements.
+    """
+    
+    def __init__(self, top_sites=DEFAULT_TOP_SITES):
+        """
+        Initialize the profiler.
+        
+        Args:
+            top_sites (int): Allocation sites kept per phase
+        """
+        import tracemalloc
+        self._tracemalloc = tracemalloc
+        self._ignored = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        self._ignored += [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+        self.top_sites = top_sites
+        self.phases = []
+        self._started = False
+    
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Measure memory while the block runs.
+        
+        Args:
+            name (str): Phase name, e.g. "parse_input" or "run_rr"
+        
+        Yields:
+            None
+        """
+        tracemalloc = self._tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            self._started = True
+        
+        before = tracemalloc.take_snapshot().filter_traces(self._ignored)
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(self._ignored)
+            
+            # Sites that grew the most during the phase (what it left behind)
+            growth = {}
+            for stat in after.compare_to(before, 'traceback'):
+                site = _project_site(stat.traceback)
+                size, blocks = growth.get(site, (0, 0))
+                growth[site] = (size + stat.size_diff, blocks + stat.count_diff)
+            ranked = sorted(growth.items(), key=lambda item: item[1][0], reverse=True)
+            sites = [{'site': site, 'bytes': size, 'blocks': blocks}
+                     for site, (size, blocks) in ranked[:self.top_sites] if size > 0]
+            
+            record = {'phase': name, 'peak_bytes': peak - baseline,
+                      'retained_bytes': current - baseline, 'top_sites': sites}
+            self.phases.append(record)
+            
+            top = ', '.join(f"{site['site']} (+{site['bytes']} B)" for site in sites[:3]) or "none"
+            logging.info(f"Memory {name}: peak {record['peak_bytes']} B, "
+                         f"retained {record['retained_bytes']} B, top sites: {top}",
+                         extra={'event': 'memory', 'phase': name, 'peak_bytes': record['peak_bytes'],
+                                'retained_bytes': record['retained_bytes']})
+    
+    def report(self):
+        """
+        All measurements so far.
+        
+        Returns:
+            list: One dict per phase: phase, peak_bytes, retained_bytes, top_sites
+        """
+        return list(self.phases)
+    
+    def stop(self):
+        """Stop tracemalloc if this profiler started it."""
+        if self._started:
+            self._tracemalloc.stop()
+            self._started = False
+
+
+def _project_site(traceback):
+    """
+    Name the innermost frame of an allocation that lies in this project.
+    
+    Args:
+        traceback (tracemalloc.Traceback): Allocation stack, oldest frame first
+    
+    Returns:
+        str: "path:line", relative to the working directory when possible
+    """
+    for frame in reversed(traceback):
+        if not frame.filename.startswith('<') and not os.path.relpath(frame.filename).startswith('..'):
+            return f"{os.path.relpath(frame.filename)}:{frame.lineno}"
+    frame = traceback[-1]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def profile_phase(profiler, name):
+    """
+    Context manager measuring a phase, or doing nothing without a profiler.
+    
+    Args:
+        profiler (MemoryProfiler): Active profiler; None disables profiling
+        name (str): Phase name
+    
+    Returns:
+        Context manager
+    """
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.phase(name)
+
+
+def print_memory_report(phases):
+    """
+    Print a per-phase memory table.
+    
+    Args:
+        phases (list): Result of MemoryProfiler.report()
+    """
+    print("\n" + "-"*70)
+    print(f"  {'Phase':<20} {'Peak (KiB)':>12} {'Retained (KiB)':>15}  Top allocation site")
+    for record in phases:
+        site = record['top_sites'][0]['site'] if record['top_sites'] else '-'
+        print(f"  {record['phase']:<20} {record['peak_bytes'] / 1024:>12.1f} "
+              f"{record['retained_bytes'] / 1024:>15.1f}  {site}")
+    print("-"*70)
@@ -0,0 +1,352 @@
+# Metrics-only simulation for capacity studies
+# Runs the scheduling algorithms without a Gantt chart or Process objects:
+# workload rows are streamed in, and each completion is folded straight into
+# running aggregates. Memory depends only on how many processes are waiting
+# at the same time, never on the size of the workload.
+#
+# Rows must arrive in non-decreasing arrival order (the run_* functions sort
+# first, which a stream cannot do without holding it). Results are the same
+# as summarize_run() over the matching run_* output, tie-breaking included.
+#
+# compare_metrics_only() only looks for the lowest average waiting time. The
+# engines are generators that report a lower bound on the run's total
+# waiting time as they go (waiting already accrued never shrinks). The
+# candidates take turns, lowest bound first, so the winner is known as soon
+# as a finished run has the lowest bound, and every other candidate is cut
+# off at the point where its bound passed the winner's total.
+
+import collections
+import heapq
+
+from src.simulator import ALGORITHM_NAMES
+
+# Scheduling decisions a candidate makes per turn in compare_metrics_only()
+COMPARE_STEP = 1024
+
+
+class RunningMetrics:
+    """
+    Constant-memory aggregate of completed processes.
+    """
+    
+    def __init__(self):
+        """Initialize empty aggregates."""
+        self.processes = 0
+        self.total_waiting = 0
+        self.total_turnaround = 0
+        self.busy_time = 0
+        self.makespan = 0
+    
+    def add(self, arrival_time, burst_time, finish_time):
+        """
+        Fold one completed process into the aggregates.
+        
+        Args:
+            arrival_time (int): Arrival time of the process
+            burst_time (int): CPU time it used
+            finish_time (int): Completion time
+        """
+        turnaround = finish_time - arrival_time
+        self.processes += 1
+        self.total_turnaround += turnaround
+        self.total_waiting += turnaround - burst_time
+        self.busy_time += burst_time
+        if finish_time > self.makespan:
+            self.makespan = finish_time
+    
+    def waiting_bound(self, current_time, unfinished, unfinished_arrivals, idle_time):
+        """
+        Lower bound on the total waiting time of the whole run: the waiting
+        time of the completed processes plus what the unfinished ones have
+        accrued by current_time. It never decreases and ends at total_waiting.
+        
+        Args:
+            current_time (int): Simulated time reached
+            unfinished (int): Processes that have arrived but not completed
+            unfinished_arrivals (int): Sum of their arrival times
+            idle_time (int): CPU idle time up to current_time
+        
+        Returns:
+            int: Lower bound on the final total_waiting
+        """
+        # Time in the system so far, minus the CPU time already given out
+        return (self.total_turnaround + unfinished * current_time - unfinished_arrivals
+                - (current_time - idle_time))
+    
+    def summary(self):
+        """
+        Summary metrics, as returned by simulator.summarize_run().
+        
+        Returns:
+            dict: avg_waiting_time, avg_turnaround_time and cpu_utilization
+        """
+        if not self.processes:
+            return {'avg_waiting_time': 0.0, 'avg_turnaround_time': 0.0, 'cpu_utilization': 0.0}
+        
+        # The timeline always starts at 0 and ends with the last completion
+        return {
+            'avg_waiting_time': self.total_waiting / self.processes,
+            'avg_turnaround_time': self.total_turnaround / self.processes,
+            'cpu_utilization': (self.busy_time / self.makespan * 100) if self.makespan else 0.0,
+        }
+
+
+def _in_arrival_order(rows):
+    """
+    Pass rows through, checking that arrival times never decrease.
+    
+    Args:
+        rows (iterable): (process_id, arrival_time, burst_time, priority) tuples
+    
+    Yields:
+        tuple: The same rows
+    
+    Raises:
+        ValueError: If a row arrives earlier than the one before it, or has I/O bursts
+    """
+    last_arrival = None
+    for row in rows:
+        if len(row) > 4 and row[4] and len(row[4]) > 1:
+            raise ValueError(f"Metrics-only mode does not model I/O bursts ({row[0]} has some)")
+        if last_arrival is not None and row[1] < last_arrival:
+            raise ValueError(f"Metrics-only mode needs input sorted by arrival time "
+                             f"({row[0]} arrives at {row[1]} after {last_arrival})")
+        last_arrival = row[1]
+        yield row
+
+
+def _run_non_preemptive(rows, key_index, metrics, step=None):
+    """
+    FCFS / SJF / Priority over a row stream.
+    
+    Args:
+        rows (iterator): Rows in arrival order
+        key_index (int): Row field to minimize (2 = burst, 3 = priority), None for FCFS
+        metrics (RunningMetrics): Aggregates to update
+        step (int): Yield the waiting time bound every this many dispatches (None: never)
+    
+    Yields:
+        int: RunningMetrics.waiting_bound() of the run so far
+    """
+    ready = []  # Heap of (key, arrival position, arrival_time, burst_time)
+    current_time = 0
+    seq = 0
+    ready_arrivals = 0  # Sum of the arrival times in the ready heap
+    idle_time = 0
+    dispatches = 0
+    next_bound = step or -1
+    pending = next(rows, None)
+    
+    while pending is not None or ready:
+        # Move every arrived process into the ready heap; the arrival
+        # position breaks ties, like the stable sort in the run_* functions
+        while pending is not None and pending[1] <= current_time:
+            key = pending[key_index] if key_index else 0
+            heapq.heappush(ready, (key, seq, pending[1], pending[2]))
+            ready_arrivals += pending[1]
+            seq += 1
+            pending = next(rows, None)
+        
+        if not ready:
+            # CPU is idle, jump to next process arrival
+            idle_time += pending[1] - current_time
+            current_time = pending[1]
+            continue
+        
+        # Process runs to completion
+        _, _, arrival_time, burst_time = heapq.heappop(ready)
+        current_time += burst_time
+        ready_arrivals -= arrival_time
+        metrics.add(arrival_time, burst_time, current_time)
+        
+        dispatches += 1
+        if dispatches == next_bound:
+            next_bound += step
+            yield metrics.waiting_bound(current_time, len(ready), ready_arrivals, idle_time)
+
+
+def _run_round_robin(rows, time_quantum, metrics, step=None):
+    """
+    Round Robin over a row stream, skipping whole rounds like run_rr_fast.
+    
+    Args:
+        rows (iterator): Rows in arrival order
+        time_quantum (int): Time slice for each process
+        metrics (RunningMetrics): Aggregates to update
+        step (int): Yield the waiting time bound every this many slices (None: never)
+    
+    Yields:
+        int: RunningMetrics.waiting_bound() of the run so far
+    """
+    ready_queue = collections.deque()  # [remaining_time, arrival_time, burst_time]
+    current_time = 0
+    changed = True  # Ready set changed since the last round-skip attempt
+    since_attempt = 0  # Slices executed since the last round-skip attempt
+    ready_arrivals = 0  # Sum of the arrival times in the ready queue
+    idle_time = 0
+    dispatches = 0
+    next_bound = step or -1
+    pending = next(rows, None)
+    
+    while pending is not None or ready_queue:
+        # Add all processes that have arrived by current_time to ready queue
+        while pending is not None and pending[1] <= current_time:
+            ready_queue.append([pending[2], pending[1], pending[2]])
+            ready_arrivals += pending[1]
+            pending = next(rows, None)
+            changed = True
+        
+        if not ready_queue:
+            # CPU is idle, jump to next process arrival
+            idle_time += pending[1] - current_time
+            current_time = pending[1]
+            continue
+        
+        # Skip full rounds while nothing can finish or arrive (see run_rr_fast)
+        round_length = len(ready_queue) * time_quantum
+        if changed and since_attempt >= len(ready_queue) and (
+                pending is None or pending[1] - current_time > round_length):
+            changed = False
+            since_attempt = 0
+            rounds = (min(entry[0] for entry in ready_queue) - 1) // time_quantum
+            if pending is not None:
+                rounds = min(rounds, (pending[1] - current_time - 1) // round_length)
+            if rounds > 0:
+                for entry in ready_queue:
+                    entry[0] -= rounds * time_quantum
+                current_time += rounds * round_length
+                continue
+        
+        # Execute the first process for one quantum (or until it finishes)
+        entry = ready_queue.popleft()
+        since_attempt += 1
+        execution_time = min(time_quantum, entry[0])
+        current_time += execution_time
+        entry[0] -= execution_time
+        
+        # Processes that arrived during the slice queue up before it
+        while pending is not None and pending[1] <= current_time:
+            ready_queue.append([pending[2], pending[1], pending[2]])
+            ready_arrivals += pending[1]
+            pending = next(rows, None)
+            changed = True
+        
+        if entry[0] == 0:
+            ready_arrivals -= entry[1]
+            metrics.add(entry[1], entry[2], current_time)
+            changed = True
+        else:
+            ready_queue.append(entry)
+        
+        dispatches += 1
+        if dispatches == next_bound:
+            next_bound += step
+            yield metrics.waiting_bound(current_time, len(ready_queue), ready_arrivals, idle_time)
+
+
+def run_metrics_only(algorithm, rows, time_quantum=3):
+    """
+    Simulate one algorithm over a row stream, keeping only aggregates.
+    
+    Args:
+        algorithm (str): One of ALGORITHM_NAMES
+        rows (iterable): (process_id, arrival_time, burst_time, priority) tuples
+                         in arrival order, e.g. parser.iter_input(file_path)
+        time_quantum (int): Time Quantum for Round Robin (default: 3)
+    
+    Returns:
+        RunningMetrics: Aggregates over every completed process
+    
+    Raises:
+        ValueError: For an unknown algorithm, a bad quantum, unsorted input or I/O bursts
+    """
+    metrics = RunningMetrics()
+    # Drain the engine; it never yields without a step
+    collections.deque(_engine(algorithm, rows, time_quantum, metrics), maxlen=0)
+    return metrics
+
+
+def compare_metrics_only(rows, algorithms=ALGORITHM_NAMES, time_quantum=3, step=COMPARE_STEP):
+    """
+    Find the algorithm with the lowest average waiting time, cutting off the
+    candidates that can no longer win. The candidates run interleaved, `step`
+    scheduling decisions at a time, and the one with the lowest waiting time
+    bound always goes next. When that is a finished candidate, its exact
+    total is below every other bound, so the rest are pruned. Ties go to the
+    earlier candidate in `algorithms`, as with the full comparison.
+    
+    Args:
+        rows (sequence): (process_id, arrival_time, burst_time, priority) tuples in
+                         arrival order; each candidate iterates over them separately
+        algorithms (sequence): Candidates, each one of ALGORITHM_NAMES
+        time_quantum (int): Time Quantum for Round Robin (default: 3)
+        step (int): Scheduling decisions per turn (default: COMPARE_STEP)
+    
+    Returns:
+        tuple: (finished, pruned) - finished maps algorithm -> RunningMetrics of the
+               candidates that ran to completion (the winner first); pruned maps
+               algorithm -> lower bound on its average waiting time at the cutoff
+    
+    Raises:
+        ValueError: For an unknown algorithm, a bad quantum, unsorted input or I/O bursts
+    """
+    metrics = {algorithm: RunningMetrics() for algorithm in algorithms}
+    engines = {algorithm: _engine(algorithm, rows, time_quantum, metrics[algorithm], step)
+               for algorithm in algorithms}
+    # Heap of (waiting time bound, candidate order, algorithm); a finished
+    # candidate's bound is its exact total
+    turns = [(0, order, algorithm) for order, algorithm in enumerate(algorithms)]
+    finished = {}
+    
+    while turns:
+        bound, order, algorithm = heapq.heappop(turns)
+        if algorithm in finished:
+            break
+        bound = next(engines[algorithm], None)
+        if bound is None:
+            finished[algorithm] = metrics[algorithm]
+            bound = metrics[algorithm].total_waiting
+        heapq.heappush(turns, (bound, order, algorithm))
+    
+    if not finished:
+        return {}, {}
+    
+    # The winner goes first, then candidates that happened to finish earlier
+    results = {algorithm: finished.pop(algorithm)}
+    results.update(finished)
+    processes = results[algorithm].processes
+    pruned = {name: bound / processes if processes else 0.0
+              for bound, _, name in sorted(turns, key=lambda turn: turn[1]) if name not in results}
+    return results, pruned
+
+
+def _engine(algorithm, rows, time_quantum, metrics, step=None):
+    """
+    Start one metrics-only engine.
+    
+    Args:
+        algorithm (str): One of ALGORITHM_NAMES
+        rows (iterable): Rows in arrival order
+        time_quantum (int): Time Quantum for Round Robin
+        metrics (RunningMetrics): Aggregates to update
+        step (int): Yield the waiting time bound every this many decisions (None: never)
+    
+    Returns:
+        generator: The engine; exhausting it completes the run
+    
+    Raises:
+        ValueError: For an unknown algorithm or a bad quantum
+    """
+    if algorithm not in ALGORITHM_NAMES:
+        raise ValueError(f"Metrics-only mode does not support {algorithm}")
+    
+    rows = _in_arrival_order(iter(rows))
+    if algorithm == 'FCFS':
+        return _run_non_preemptive(rows, None, metrics, step)
+    if algorithm == 'SJF':
+        return _run_non_preemptive(rows, 2, metrics, step)
+    if algorithm == 'Priority':
+        return _run_non_preemptive(rows, 3, metrics, step)
+    if time_quantum <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    return _run_round_robin(rows, time_quantum, metrics, step)
@@ -1,16 +1,45 @@
 # File parser to read process data from input files
+# Input files may be plain text or gzip / xz compressed (chosen by extension)
+# and are decompressed while they stream. Text is parsed in chunks of whole
+# lines: a chunk is split with one str.split() and each column is converted
+# in one pass (faster than the csv module, whose per-row lists dominate). A
+# chunk with comments, blank lines or anything invalid is parsed line by line
+# instead, so the comment, whitespace and validation rules (and their
+# warnings and errors) are always exactly those of _parse_line().
+
+import gc
+import importlib
+import itertools
+import os
 
 from src.model import Process
 
+# Compressed input: file extension -> stdlib module whose open() reads it
+COMPRESSED_EXTENSIONS = {'.gz': 'gzip', '.xz': 'lzma'}
+
+# Lines parsed per bulk chunk of a line iterable (bounds memory while streaming)
+BULK_CHUNK_LINES = 16384
+
+# Characters read per bulk chunk of a file
+BULK_CHUNK_CHARS = 1 << 20
+
 
 def parse_input(file_path):
     """
-    Read and parse process data from a text file.
+    Read and parse process data from a text file (optionally .gz / .xz compressed).
     
     Expected file format (CSV):
-    process_id,arrival_time,burst_time,priority
+    process_id,arrival_time,burst_time,priority[,bursts[,deadline]]
     P1,0,5,2
     P2,1,3,1
+    P3,2,9,3,5 10 4
+    P4,3,4,1,,12
+    
+    The optional fifth field lists alternating CPU and I/O burst times
+    (space separated, starting and ending with a CPU burst); burst_time
+    must then be the total of the CPU bursts. It may be left empty. The
+    optional sixth field is a deadline: the absolute time by which the
+    process should finish (EDF scheduling, deadline-miss report).
     
     Args:
         file_path (str): Path to the input file
@@ -20,36 +49,20 @@ def parse_input(file_path):
     """
     processes = []  # Initialize empty list to store processes
     
+    # Process objects cannot form reference cycles, so the cyclic collector
+    # (which would otherwise rescan the growing list over and over) is paused
+    collecting = gc.isenabled()
+    gc.disable()
     try:
-        # Try to open and read the file
-        with open(file_path, 'r') as file:
-            # Read all lines from the file
-            lines = file.readlines()
-            
-            # Process each line
-            for line in lines:
-                # Remove whitespace and skip empty lines or comments
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Split the line by comma to get individual values
-                parts = line.split(',')
-                
-                # Make sure we have exactly 4 values
-                if len(parts) != 4:
-                    print(f"Warning: Skipping invalid line: {line}")
-                    continue
-                
-                # Extract values from the split parts
-                process_id = parts[0].strip()
-                arrival_time = int(parts[1].strip())
-                burst_time = int(parts[2].strip())
-                priority = int(parts[3].strip())
-                
-                # Create a new Process object and add to list
-                process = Process(process_id, arrival_time, burst_time, priority)
-                processes.append(process)
+        # Create the Process objects straight from each column chunk (no row tuples)
+        with open_input(file_path) as file:
+            for ids, arrivals, bursts, priorities, sequences, deadlines in _iter_file_chunks(file):
+                if sequences is None and deadlines is None:
+                    processes.extend(map(Process, ids, arrivals, bursts, priorities))
+                else:
+                    processes.extend(map(Process, ids, arrivals, bursts, priorities,
+                                         sequences or itertools.repeat(None),
+                                         deadlines or itertools.repeat(None)))
     
     except FileNotFoundError:
         # Handle case when file doesn't exist
@@ -66,5 +79,329 @@ def parse_input(file_path):
         print(f"Error reading file: {e}")
         return []
     
+    finally:
+        if collecting:
+            gc.enable()
+    
     # Return the list of processes
     return processes
+
+
+def open_input(file_path):
+    """
+    Open an input file as text, decompressing .gz and .xz files on the fly.
+    
+    Args:
+        file_path (str): Path to the input file
+    
+    Returns:
+        file object: Text stream over the (decompressed) lines
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    module_name = COMPRESSED_EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+    if module_name is None:
+        return open(file_path, 'r')
+    
+    # Imported on first use so plain-text runs do not pay for it at startup
+    return importlib.import_module(module_name).open(file_path, 'rt')
+
+
+def iter_input(file_path):
+    """
+    Stream process rows from a text file without building Process objects.
+    Same format, comment and validation rules as parse_input(), but rows are
+    yielded one at a time, so memory does not grow with the file size.
+    
+    Args:
+        file_path (str): Path to the input file (.gz / .xz are decompressed)
+    
+    Yields:
+        tuple: (process_id, arrival_time, burst_time, priority), plus the CPU/I-O
+               bursts for lines that have them, plus the deadline (bursts then a
+               tuple or None) for lines that have one
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If a numeric field is not an integer or a burst sequence is invalid
+    """
+    with open_input(file_path) as file:
+        yield from _iter_chunk_rows(_iter_file_chunks(file))
+
+
+def parse_columns(file_path):
+    """
+    Parse a whole input file into columns (no Process objects, no row tuples).
+    
+    Args:
+        file_path (str): Path to the input file (.gz / .xz are decompressed)
+    
+    Returns:
+        dict: 'process_id', 'arrival_time', 'burst_time' and 'priority' lists,
+              'bursts' (CPU/I-O burst tuple or None per row, or None if no row
+              has any) and 'deadline' (deadline or None per row, or None if no
+              row has one)
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If a numeric field is not an integer or a burst sequence is invalid
+    """
+    columns = {'process_id': [], 'arrival_time': [], 'burst_time': [], 'priority': [],
+               'bursts': None, 'deadline': None}
+    with open_input(file_path) as file:
+        for ids, arrivals, bursts, priorities, sequences, deadlines in _iter_file_chunks(file):
+            # Optional columns appear (padded with None) once any row has them
+            for name, values in (('bursts', sequences), ('deadline', deadlines)):
+                if values is not None and columns[name] is None:
+                    columns[name] = [None] * len(columns['process_id'])
+                if columns[name] is not None:
+                    columns[name].extend(values or [None] * len(ids))
+            columns['process_id'].extend(ids)
+            columns['arrival_time'].extend(arrivals)
+            columns['burst_time'].extend(bursts)
+            columns['priority'].extend(priorities)
+    return columns
+
+
+def iter_rows(lines):
+    """
+    Parse process rows from lines of input text (a file, a list, an upload).
+    
+    Args:
+        lines (iterable): Lines in the input file format
+    
+    Yields:
+        tuple: (process_id, arrival_time, burst_time, priority), plus the CPU/I-O
+               bursts for lines that have them, plus the deadline (bursts then a
+               tuple or None) for lines that have one
+    
+    Raises:
+        ValueError: If a numeric field is not an integer or a burst sequence is invalid
+    """
+    yield from _iter_chunk_rows(iter_column_chunks(lines))
+
+
+def iter_column_chunks(lines):
+    """
+    Parse lines of input text in chunks of columns.
+    
+    Args:
+        lines (iterable): Lines in the input file format
+    
+    Yields:
+        tuple: (process_ids, arrival_times, burst_times, priorities, bursts, deadlines)
+               lists for a chunk of lines; bursts (deadlines) is None when no row
+               in the chunk has a CPU/I-O burst sequence (a deadline)
+    
+    Raises:
+        ValueError: If a numeric field is not an integer or a burst sequence is invalid
+    """
+    lines = iter(lines)
+    while True:
+        chunk = list(itertools.islice(lines, BULK_CHUNK_LINES))
+        if not chunk:
+            return
+        
+        # One line end per line (trailing whitespace never matters to the rules)
+        text = '\n'.join(map(str.rstrip, chunk)) + '\n'
+        if text.count('\n') == len(chunk):
+            yield from _parse_text(text)
+        else:
+            # A line with a line break inside: keep the caller's line boundaries
+            yield from _parse_lines(chunk)
+
+
+def _iter_file_chunks(file):
+    """
+    Parse an open input file in chunks of columns, reading large blocks of
+    text instead of single lines.
+    
+    Args:
+        file (file object): Text stream in the input file format
+    
+    Yields:
+        tuple: Column chunks, as from iter_column_chunks()
+    """
+    tail = ''
+    while True:
+        block = file.read(BULK_CHUNK_CHARS)
+        if not block:
+            if tail:
+                yield from _parse_text(tail + '\n')
+            return
+        
+        # Parse complete lines only; the partial last line waits for the next block
+        block = tail + block
+        cut = block.rfind('\n') + 1
+        tail = block[cut:]
+        if cut:
+            yield from _parse_text(block[:cut])
+
+
+def _iter_chunk_rows(chunks):
+    """Turn column chunks back into row tuples."""
+    for ids, arrivals, bursts, priorities, sequences, deadlines in chunks:
+        if sequences is None and deadlines is None:
+            yield from zip(ids, arrivals, bursts, priorities)
+            continue
+        sequences = sequences or [None] * len(ids)
+        deadlines = deadlines or [None] * len(ids)
+        for row, sequence, deadline in zip(zip(ids, arrivals, bursts, priorities), sequences, deadlines):
+            if deadline is not None:
+                yield row + (sequence, deadline)
+            elif sequence is not None:
+                yield row + (sequence,)
+            else:
+                yield row
+
+
+def _parse_text(text):
+    """
+    Parse complete lines of text, in bulk when every line is a plain row.
+    
+    Args:
+        text (str): Complete lines, each ending in a line break
+    
+    Yields:
+        tuple: Column chunks, as from iter_column_chunks()
+    """
+    columns = _bulk_columns(text)
+    if columns is not None:
+        yield columns
+    else:
+        # Comments, blank lines, burst sequences, deadlines or bad values: line by line
+        yield from _parse_lines(text.split('\n')[:-1])
+
+
+def _parse_lines(lines):
+    """
+    Parse lines one at a time with _parse_line().
+    
+    Args:
+        lines (list): Input lines
+    
+    Yields:
+        tuple: One column chunk with every valid row (none if there is none);
+               before an invalid value raises, the rows before it are yielded
+    """
+    rows = []
+    for line in lines:
+        try:
+            row = _parse_line(line)
+        except ValueError:
+            if rows:
+                yield _row_columns(rows)
+            raise
+        if row is not None:
+            rows.append(row)
+    if rows:
+        yield _row_columns(rows)
+
+
+def _row_columns(rows):
+    """
+    Turn parsed rows into a column chunk.
+    
+    Args:
+        rows (list): Non-empty list of row tuples from _parse_line()
+    
+    Returns:
+        tuple: (process_ids, arrival_times, burst_times, priorities, bursts, deadlines)
+    """
+    ids, arrivals, bursts, priorities = (list(column) for column in zip(*(row[:4] for row in rows)))
+    sequences = None
+    if any(len(row) > 4 and row[4] is not None for row in rows):
+        sequences = [row[4] if len(row) > 4 else None for row in rows]
+    deadlines = None
+    if any(len(row) > 5 for row in rows):
+        deadlines = [row[5] if len(row) > 5 else None for row in rows]
+    return ids, arrivals, bursts, priorities, sequences, deadlines
+
+
+def _bulk_columns(text):
+    """
+    Fast path: split a whole chunk at once and convert each column in one pass.
+    
+    Args:
+        text (str): Complete lines, each ending in a line break
+    
+    Returns:
+        tuple: (process_ids, arrival_times, burst_times, priorities, None, None),
+               or None if any line needs the line-by-line rules
+    """
+    # One split for the whole chunk; each line end stays in that line's last field
+    lines = text.count('\n')
+    fields = text.replace('\n', '\n,').split(',')
+    fields.pop()  # Empty field after the last line end
+    if len(fields) != 4 * lines:
+        return None
+    
+    # Every line has exactly 4 fields iff every 4th field holds a line end
+    # (blank lines and other field counts are left to _parse_line())
+    priorities = fields[3::4]
+    if ''.join(priorities).count('\n') != lines:
+        return None
+    
+    ids = list(map(str.strip, fields[0::4]))
+    if '\n#' in '\n' + '\n'.join(ids):
+        return None  # Comment line
+    
+    # int() ignores surrounding whitespace (and the line end), like int(part.strip())
+    try:
+        return (ids, list(map(int, fields[1::4])), list(map(int, fields[2::4])), list(map(int, priorities)),
+                None, None)
+    except ValueError:
+        return None
+
+
+def _parse_line(line):
+    """
+    Parse one line of input text (the reference rules for every parse path).
+    
+    Args:
+        line (str): One line in the input file format
+    
+    Returns:
+        tuple: (process_id, arrival_time, burst_time, priority), plus a tuple of
+               CPU/I-O bursts if the line has them, plus the deadline (bursts then
+               a tuple or None) if it has one; None for blank, comment and invalid
+               lines (invalid ones print a warning)
+    
+    Raises:
+        ValueError: If a numeric field is not an integer, a burst sequence is
+                    invalid or a deadline is before the arrival time
+    """
+    # Remove whitespace and skip empty lines or comments
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    
+    # Split the line by comma to get individual values
+    parts = line.split(',')
+    
+    # Make sure we have 4 values (5 with a CPU/I-O burst sequence, 6 with a deadline)
+    if len(parts) not in (4, 5, 6):
+        print(f"Warning: Skipping invalid line: {line}")
+        return None
+    
+    row = (parts[0].strip(), int(parts[1].strip()), int(parts[2].strip()), int(parts[3].strip()))
+    if len(parts) == 4:
+        return row
+    
+    # Alternating CPU and I/O bursts: CPU first and last, so an odd count
+    bursts = tuple(int(value) for value in parts[4].split()) or None
+    if bursts is not None:
+        if len(bursts) % 2 == 0 or min(bursts) < 0:
+            raise ValueError(f"{row[0]}: burst sequence must alternate CPU and I/O times, "
+                             f"starting and ending with CPU: {parts[4].strip()}")
+        if sum(bursts[::2]) != row[2]:
+            raise ValueError(f"{row[0]}: burst time {row[2]} does not match its CPU bursts "
+                             f"(total {sum(bursts[::2])})")
+    
+    deadline = int(parts[5].strip()) if len(parts) == 6 and parts[5].strip() else None
+    if deadline is None:
+        return row if bursts is None else row + (bursts,)
+    if deadline < row[1]:
+        raise ValueError(f"{row[0]}: deadline {deadline} is before its arrival time {row[1]}")
+    return row + (bursts, deadline)
@@ -0,0 +1,220 @@
+# Bucketed priority scheduling with aging
+# Ready processes live in per-priority FIFO buckets; a bitmap of non-empty
+# buckets finds the best one with a few big-integer operations instead of
+# rescanning the ready list. Those operations work on the whole bitmap, so
+# a selection costs O(size / 64) machine words, where size is the ring
+# width: the widest span of queued keys seen so far, rounded up to a power
+# of two (the ring never shrinks). That is a single word, i.e. O(1), while
+# the span stays under 64 keys.
+#
+# Aging without updates: every `aging_interval` time units (one epoch) each
+# waiting process gains one priority level. A process that arrived in epoch
+# e with priority p therefore has priority p - (now_epoch - e) at any time,
+# and since now_epoch is the same for everyone, the order of the waiting
+# processes is the order of the fixed key p + e. Processes are filed under
+# that key once and never touched again, however many are queued. The price
+# is that keys grow with time: the live span is the priority range plus the
+# number of epochs between the oldest and newest waiting arrival, so a long
+# backlog with a small aging interval widens the ring and makes each
+# selection proportionally slower.
+
+import collections
+import logging
+
+from src.scheduler import _log_slice
+from src.workload import prepare_workload
+
+logger = logging.getLogger(__name__)
+
+# Initial number of bucket slots (grows by doubling when needed)
+INITIAL_BUCKETS = 64
+
+
+class BucketQueue:
+    """
+    Min-priority queue over small integer keys: a ring of FIFO buckets
+    covering keys [base, base + size) plus a bitmap of non-empty buckets.
+    
+    push and pop cost O(size / 64) word operations (the bitmap is rotated as
+    a whole); size only grows, doubling to fit the live key span.
+    """
+    
+    def __init__(self, size=INITIAL_BUCKETS):
+        """
+        Initialize an empty queue.
+        
+        Args:
+            size (int): Initial number of bucket slots (rounded up to a power of two)
+        """
+        self._size = 1 << max(0, size - 1).bit_length()
+        self._buckets = [collections.deque() for _ in range(self._size)]
+        self._bitmap = 0  # Bit i set <=> slot i is non-empty
+        self._base = 0  # Smallest key that can be queued without moving the window
+        self._count = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def _rotated(self):
+        """Bitmap rotated so that bit 0 is the slot of key `base` (O(size / 64))."""
+        shift = self._base & (self._size - 1)
+        mask = (1 << self._size) - 1
+        return ((self._bitmap >> shift) | (self._bitmap << (self._size - shift))) & mask
+    
+    def _grow(self, low, high):
+        """
+        Re-file every queued item into a ring wide enough for keys [low, high].
+        
+        Args:
+            low (int): Smallest key to cover
+            high (int): Largest key to cover
+        """
+        items = []
+        rotated = self._rotated()
+        while rotated:
+            offset = (rotated & -rotated).bit_length() - 1
+            rotated &= rotated - 1
+            items.append((self._base + offset, self._buckets[(self._base + offset) & (self._size - 1)]))
+        
+        size = self._size
+        while high - low >= size:
+            size *= 2
+        self._size = size
+        self._buckets = [collections.deque() for _ in range(size)]
+        self._bitmap = 0
+        for key, bucket in items:
+            slot = key & (size - 1)
+            self._buckets[slot] = bucket
+            self._bitmap |= 1 << slot
+    
+    def push(self, key, item):
+        """
+        Append an item to the bucket of `key` (FIFO within a key).
+        
+        Args:
+            key (int): Priority key (lower is served first)
+            item (object): Queued item
+        """
+        if not self._count:
+            self._base = key
+        elif key < self._base or key - self._base >= self._size:
+            # Key outside the current window: widen it if the live keys do not fit
+            high = max(key, self._base + self._rotated().bit_length() - 1)
+            low = min(key, self._base)
+            if high - low >= self._size:
+                self._grow(low, high)
+            self._base = low
+        
+        slot = key & (self._size - 1)
+        self._buckets[slot].append(item)
+        self._bitmap |= 1 << slot
+        self._count += 1
+    
+    def pop(self):
+        """
+        Remove and return the oldest item with the smallest key.
+        
+        Costs one bitmap rotation, O(size / 64) word operations.
+        
+        Returns:
+            tuple: (key, item)
+        
+        Raises:
+            IndexError: If the queue is empty
+        """
+        if not self._count:
+            raise IndexError("pop from an empty BucketQueue")
+        
+        rotated = self._rotated()
+        key = self._base + (rotated & -rotated).bit_length() - 1
+        slot = key & (self._size - 1)
+        bucket = self._buckets[slot]
+        item = bucket.popleft()
+        if not bucket:
+            self._bitmap &= ~(1 << slot)
+        self._count -= 1
+        
+        # Nothing smaller than the key just served is queued any more
+        self._base = key
+        return key, item
+
+
+def run_priority_buckets(processes, aging_interval=None, trace_writer=None):
+    """
+    Priority Scheduling with bucketed ready queues and optional aging
+    Non-preemptive: Pick the process with highest priority (lowest priority number)
+    
+    Without aging the schedule is identical to run_priority (ties go to the
+    earlier arrival). With aging, a waiting process gains one priority level
+    every `aging_interval` time units, so low-priority work cannot starve.
+    
+    Args:
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
+        aging_interval (int): Time units per priority level gained while waiting
+                              (None or 0 disables aging)
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
+    
+    Returns:
+        tuple: (gantt_chart, processes) where gantt_chart shows execution timeline
+    """
+    if aging_interval is not None and aging_interval < 0:
+        raise ValueError("Aging interval must not be negative")
+    
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    workload = prepare_workload(processes)
+    processes = workload.copy_processes()
+    
+    # Initialize variables
+    current_time = 0
+    gantt_chart = []
+    completed = []
+    ready_queue = BucketQueue()
+    cursor = 0  # Next process (in arrival order) not yet in the ready queue
+    total = len(processes)
+    log_slices = logger.isEnabledFor(logging.DEBUG)
+    
+    while cursor < total or ready_queue:
+        # File every arrived process under its aging key (priority + arrival epoch)
+        while cursor < total and processes[cursor].arrival_time <= current_time:
+            process = processes[cursor]
+            key = process.priority
+            if aging_interval:
+                key += process.arrival_time // aging_interval
+            ready_queue.push(key, process)
+            cursor += 1
+        
+        # Check if ready queue is empty
+        if not ready_queue:
+            # CPU is idle, jump to next process arrival
+            next_arrival = processes[cursor].arrival_time
+            gantt_chart.append(('IDLE', current_time, next_arrival))
+            if log_slices:
+                _log_slice('Priority', 'IDLE', current_time, next_arrival)
+            if trace_writer:
+                trace_writer.idle(current_time, next_arrival)
+            current_time = next_arrival
+            continue
+        
+        # Select process with highest (aged) priority
+        _, process = ready_queue.pop()
+        
+        # Process runs to completion
+        process.start_time = current_time
+        current_time += process.burst_time
+        process.finish_time = current_time
+        
+        # Calculate turnaround time and waiting time
+        process.turnaround_time = process.finish_time - process.arrival_time
+        process.waiting_time = process.turnaround_time - process.burst_time
+        
+        # Add to Gantt chart
+        gantt_chart.append((process.process_id, process.start_time, process.finish_time))
+        if log_slices:
+            _log_slice('Priority', process.process_id, process.start_time, process.finish_time)
+        if trace_writer:
+            trace_writer.record_slice(process.process_id, process.start_time, process.finish_time, True)
+        
+        completed.append(process)
+    
+    return gantt_chart, completed
@@ -1,40 +1,73 @@
 # Scheduling algorithms implementation
-# This file contains the core logic for 4 different CPU scheduling algorithms
+# This file contains the core logic for 4 different CPU scheduling algorithms,
+# plus the Lottery and Stride proportional-share schedulers and real-time EDF
 
 # ASSUMPTIONS:
 # 1. Context-switching overhead is zero.
 # 2. Tie-breaking: FCFS (Arrival Time) is used when burst times or priorities are equal.
+# 3. Proportional share: tickets come from the priority column, see priority_tickets().
 
-import copy
+import collections
+import heapq
+import logging
+import math
 
+from src.workload import prepare_workload
 
-def run_fcfs(processes):
+# Per-slice DEBUG events; enabled with --log-level DEBUG and thinned by the
+# sampling filter in src.log_config so large runs do not flood the log
+logger = logging.getLogger(__name__)
+
+
+def _log_slice(algorithm, process_id, start, end):
+    """
+    Emit a DEBUG event for one Gantt chart slice.
+    
+    Args:
+        algorithm (str): Algorithm name (e.g., "FCFS")
+        process_id (str): Process ID or 'IDLE'
+        start (int): Slice start time
+        end (int): Slice end time
+    """
+    # %-style arguments: the message is only built if the record is kept
+    logger.debug("%s %s [%d-%d]", algorithm, process_id, start, end,
+                 extra={'event': 'idle' if process_id == 'IDLE' else 'run',
+                        'algorithm': algorithm, 'process_id': process_id,
+                        'start': start, 'end': end})
+
+
+def run_fcfs(processes, trace_writer=None):
     """
     First Come First Served (FCFS) Scheduling Algorithm
     Non-preemptive: Once a process starts, it runs to completion
     
     Args:
-        processes (list): List of Process objects
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
     
     Returns:
         tuple: (gantt_chart, processes) where gantt_chart shows execution timeline
     """
-    # Make a copy to avoid modifying original list
-    processes = copy.deepcopy(processes)
-    
-    # Sort processes by arrival time (first come first served)
-    processes.sort(key=lambda p: p.arrival_time)
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    workload = prepare_workload(processes)
+    processes = workload.copy_processes()
     
     # Initialize variables
     current_time = 0
     gantt_chart = []  # Will store (process_id, start_time, end_time)
     completed = []  # Track completed processes
+    log_slices = logger.isEnabledFor(logging.DEBUG)  # Checked once, not per slice
     
     # Process each job in order
     for process in processes:
         # If CPU is idle (current time is before process arrival), add IDLE time
         if current_time < process.arrival_time:
             gantt_chart.append(('IDLE', current_time, process.arrival_time))
+            if log_slices:
+                _log_slice('FCFS', 'IDLE', current_time, process.arrival_time)
+            if trace_writer:
+                trace_writer.idle(current_time, process.arrival_time)
             current_time = process.arrival_time
         
         # Record start time (first time this process gets CPU)
@@ -54,33 +87,38 @@ def run_fcfs(processes):
         
         # Add to Gantt chart
         gantt_chart.append((process.process_id, process.start_time, process.finish_time))
+        if log_slices:
+            _log_slice('FCFS', process.process_id, process.start_time, process.finish_time)
+        if trace_writer:
+            trace_writer.record_slice(process.process_id, process.start_time, process.finish_time, True)
         completed.append(process)
     
     return gantt_chart, completed
 
 
-def run_sjf(processes):
+def run_sjf(processes, trace_writer=None):
     """
     Shortest Job First (SJF) Scheduling Algorithm
     Non-preemptive: Pick the process with shortest burst time among arrived processes
     
     Args:
-        processes (list): List of Process objects
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
     
     Returns:
         tuple: (gantt_chart, processes) where gantt_chart shows execution timeline
     """
-    # Make a copy to avoid modifying original list
-    processes = copy.deepcopy(processes)
-    
-    # Sort by arrival time initially
-    processes.sort(key=lambda p: p.arrival_time)
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    workload = prepare_workload(processes)
+    processes = workload.copy_processes()
     
     # Initialize variables
     current_time = 0
     gantt_chart = []
     completed = []
     remaining = processes.copy()  # Processes not yet completed
+    log_slices = logger.isEnabledFor(logging.DEBUG)
     
     # Continue until all processes are completed
     while remaining:
@@ -90,8 +128,12 @@ def run_sjf(processes):
         # Check if ready queue is empty
         if not ready_queue:
             # CPU is idle, jump to next process arrival
-            next_arrival = min(p.arrival_time for p in remaining)
+            next_arrival = workload.next_arrival(current_time)
             gantt_chart.append(('IDLE', current_time, next_arrival))
+            if log_slices:
+                _log_slice('SJF', 'IDLE', current_time, next_arrival)
+            if trace_writer:
+                trace_writer.idle(current_time, next_arrival)
             current_time = next_arrival
             continue
         
@@ -113,6 +155,10 @@ def run_sjf(processes):
         
         # Add to Gantt chart
         gantt_chart.append((shortest_job.process_id, shortest_job.start_time, shortest_job.finish_time))
+        if log_slices:
+            _log_slice('SJF', shortest_job.process_id, shortest_job.start_time, shortest_job.finish_time)
+        if trace_writer:
+            trace_writer.record_slice(shortest_job.process_id, shortest_job.start_time, shortest_job.finish_time, True)
         
         # Move from remaining to completed
         completed.append(shortest_job)
@@ -121,28 +167,29 @@ def run_sjf(processes):
     return gantt_chart, completed
 
 
-def run_priority(processes):
+def run_priority(processes, trace_writer=None):
     """
     Priority Scheduling Algorithm
     Non-preemptive: Pick the process with highest priority (lowest priority number)
     
     Args:
-        processes (list): List of Process objects
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
     
     Returns:
         tuple: (gantt_chart, processes) where gantt_chart shows execution timeline
     """
-    # Make a copy to avoid modifying original list
-    processes = copy.deepcopy(processes)
-    
-    # Sort by arrival time initially
-    processes.sort(key=lambda p: p.arrival_time)
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    workload = prepare_workload(processes)
+    processes = workload.copy_processes()
     
     # Initialize variables
     current_time = 0
     gantt_chart = []
     completed = []
     remaining = processes.copy()
+    log_slices = logger.isEnabledFor(logging.DEBUG)
     
     # Continue until all processes are completed
     while remaining:
@@ -152,8 +199,12 @@ def run_priority(processes):
         # Check if ready queue is empty
         if not ready_queue:
             # CPU is idle, jump to next process arrival
-            next_arrival = min(p.arrival_time for p in remaining)
+            next_arrival = workload.next_arrival(current_time)
             gantt_chart.append(('IDLE', current_time, next_arrival))
+            if log_slices:
+                _log_slice('Priority', 'IDLE', current_time, next_arrival)
+            if trace_writer:
+                trace_writer.idle(current_time, next_arrival)
             current_time = next_arrival
             continue
         
@@ -175,6 +226,10 @@ def run_priority(processes):
         
         # Add to Gantt chart
         gantt_chart.append((highest_priority.process_id, highest_priority.start_time, highest_priority.finish_time))
+        if log_slices:
+            _log_slice('Priority', highest_priority.process_id, highest_priority.start_time, highest_priority.finish_time)
+        if trace_writer:
+            trace_writer.record_slice(highest_priority.process_id, highest_priority.start_time, highest_priority.finish_time, True)
         
         # Move from remaining to completed
         completed.append(highest_priority)
@@ -183,23 +238,27 @@ def run_priority(processes):
     return gantt_chart, completed
 
 
-def run_rr(processes, time_quantum):
+def run_rr(processes, time_quantum, trace_writer=None, checkpointer=None, resume_state=None):
     """
     Round Robin (RR) Scheduling Algorithm
     Preemptive: Each process gets a time slice (quantum), then goes to back of queue
     
     Args:
-        processes (list): List of Process objects
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
         time_quantum (int): Time slice for each process
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
+        checkpointer (Checkpointer): Optional periodic on-disk checkpoints (see src.checkpoint)
+        resume_state (dict): State from checkpointer.load() to continue an interrupted run
+                             (the same checkpointer must be passed)
     
     Returns:
         tuple: (gantt_chart, processes) where gantt_chart shows execution timeline
     """
-    # Make a copy to avoid modifying original list
-    processes = copy.deepcopy(processes)
+    workload = prepare_workload(processes)
     
-    # Sort by arrival time
-    processes.sort(key=lambda p: p.arrival_time)
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    processes = workload.copy_processes()
     
     # Initialize variables
     current_time = 0
@@ -208,8 +267,50 @@ def run_rr(processes, time_quantum):
     completed = []
     remaining = processes.copy()
     
+    # Checkpoints refer to processes by their position in arrival order
+    if checkpointer:
+        position = {id(p): index for index, p in enumerate(processes)}
+    
+    if resume_state:
+        # Continue exactly where the checkpointed run stopped: final slices and
+        # completions come from the journal, the live state from the checkpoint
+        for slices, finished in checkpointer.read_journal():
+            gantt_chart.extend(slices)
+            for index, start_time, finish_time in finished:
+                process = processes[index]
+                process.start_time = start_time
+                process.remaining_time = 0
+                process.finish_time = finish_time
+                process.turnaround_time = finish_time - process.arrival_time
+                process.waiting_time = process.turnaround_time - process.burst_time
+                completed.append(process)
+        for index, remaining_time, start_time in resume_state['ready_queue']:
+            process = processes[index]
+            process.remaining_time = remaining_time
+            process.start_time = start_time
+            ready_queue.append(process)
+        # Arrivals are taken in arrival order, so the pending ones are a suffix
+        remaining = processes[resume_state['arrived']:]
+        current_time = resume_state['current_time']
+    journaled_slices = len(gantt_chart)
+    journaled_completed = len(completed)
+    log_slices = logger.isEnabledFor(logging.DEBUG)
+    
     # Continue until all processes are completed
     while remaining or ready_queue:
+        # Periodically save the live engine state; slices and completions since
+        # the last checkpoint go to its append-only journal
+        if checkpointer and checkpointer.due():
+            checkpointer.save({
+                'current_time': current_time,
+                'ready_queue': [(position[id(p)], p.remaining_time, p.start_time) for p in ready_queue],
+                'arrived': len(processes) - len(remaining),
+                'trace': trace_writer.checkpoint_state() if trace_writer else None,
+            }, journal=(gantt_chart[journaled_slices:],
+                        [(position[id(p)], p.start_time, p.finish_time) for p in completed[journaled_completed:]]))
+            journaled_slices = len(gantt_chart)
+            journaled_completed = len(completed)
+        
         # Add all processes that have arrived by current_time to ready queue
         arrived = [p for p in remaining if p.arrival_time <= current_time]
         for process in arrived:
@@ -220,8 +321,12 @@ def run_rr(processes, time_quantum):
         if not ready_queue:
             # CPU is idle, jump to next process arrival
             if remaining:
-                next_arrival = min(p.arrival_time for p in remaining)
+                next_arrival = workload.next_arrival(current_time)
                 gantt_chart.append(('IDLE', current_time, next_arrival))
+                if log_slices:
+                    _log_slice('RR', 'IDLE', current_time, next_arrival)
+                if trace_writer:
+                    trace_writer.idle(current_time, next_arrival)
                 current_time = next_arrival
             continue
         
@@ -242,6 +347,11 @@ def run_rr(processes, time_quantum):
         
         # Add to Gantt chart
         gantt_chart.append((current_process.process_id, start, current_time))
+        if log_slices:
+            _log_slice('RR', current_process.process_id, start, current_time)
+        if trace_writer:
+            trace_writer.record_slice(current_process.process_id, start, current_time,
+                                      current_process.remaining_time == 0)
         
         # Check if new processes arrived during execution
         arrived = [p for p in remaining if p.arrival_time <= current_time]
@@ -260,4 +370,487 @@ def run_rr(processes, time_quantum):
             # Process not finished, add back to end of ready queue
             ready_queue.append(current_process)
     
+    # The run is complete; its checkpoint is no longer needed
+    if checkpointer:
+        checkpointer.clear()
+    
+    return gantt_chart, completed
+
+
+# Gantt chart ID used by run_rr_fast for a block of skipped full rounds
+ROUND_SUMMARY_ID = 'ROUNDS'
+
+
+def run_rr_fast(processes, time_quantum, trace_writer=None):
+    """
+    Round Robin with round skipping
+    Same schedule and per-process metrics as run_rr, but while the ready set
+    cannot change (no arrival, no completion), k full rounds are applied in
+    one step. Cost depends on the number of processes and arrivals, not on
+    total burst time divided by the quantum.
+    
+    Gantt chart: a skipped block of a single process is one coalesced slice;
+    a skipped block of several processes is one (ROUND_SUMMARY_ID, start, end)
+    slice. Everything else matches run_rr slice for slice.
+    
+    Args:
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
+        time_quantum (int): Time slice for each process
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
+    
+    Returns:
+        tuple: (gantt_chart, processes) where gantt_chart shows execution timeline
+    """
+    if time_quantum <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    workload = prepare_workload(processes)
+    processes = workload.copy_processes()
+    
+    # Initialize variables
+    current_time = 0
+    gantt_chart = []
+    ready_queue = collections.deque()
+    completed = []
+    cursor = 0  # Next process (in arrival order) not yet in the ready queue
+    total = len(processes)
+    changed = True  # Ready set changed since the last round-skip attempt
+    since_attempt = 0  # Slices executed since the last round-skip attempt
+    log_slices = logger.isEnabledFor(logging.DEBUG)
+    
+    while cursor < total or ready_queue:
+        # Add all processes that have arrived by current_time to ready queue
+        while cursor < total and processes[cursor].arrival_time <= current_time:
+            ready_queue.append(processes[cursor])
+            cursor += 1
+            changed = True
+        
+        # Check if ready queue is empty
+        if not ready_queue:
+            # CPU is idle, jump to next process arrival
+            next_arrival = processes[cursor].arrival_time
+            gantt_chart.append(('IDLE', current_time, next_arrival))
+            if log_slices:
+                _log_slice('RR', 'IDLE', current_time, next_arrival)
+            if trace_writer:
+                trace_writer.idle(current_time, next_arrival)
+            current_time = next_arrival
+            continue
+        
+        # Round skipping: every process runs a full quantum per round, so with
+        # no completion (all remaining > quantum) and no arrival before the
+        # rounds end, the queue order is unchanged and only the clock and the
+        # remaining times move. Finding the minimum is O(k), so it is only
+        # tried once per k slices and when an arrival cannot interrupt a round.
+        k = len(ready_queue)
+        round_length = k * time_quantum
+        if changed and since_attempt >= k and (
+                cursor == total or processes[cursor].arrival_time - current_time > round_length):
+            changed = False
+            since_attempt = 0
+            rounds = (min(p.remaining_time for p in ready_queue) - 1) // time_quantum
+            if cursor < total:
+                rounds = min(rounds, (processes[cursor].arrival_time - current_time - 1) // round_length)
+            
+            if rounds > 0:
+                # First dispatch happens in the first skipped round
+                for position, process in enumerate(ready_queue):
+                    if process.start_time is None:
+                        process.start_time = current_time + position * time_quantum
+                    process.remaining_time -= rounds * time_quantum
+                
+                start = current_time
+                current_time += rounds * round_length
+                block_id = ready_queue[0].process_id if k == 1 else ROUND_SUMMARY_ID
+                gantt_chart.append((block_id, start, current_time))
+                if log_slices:
+                    _log_slice('RR', block_id, start, current_time)
+                if trace_writer:
+                    trace_writer.record_slice(block_id, start, current_time, False)
+                continue
+        
+        # Get the first process from ready queue
+        current_process = ready_queue.popleft()
+        since_attempt += 1
+        
+        # Record start time (only first time it gets CPU)
+        if current_process.start_time is None:
+            current_process.start_time = current_time
+        
+        # Execute the process for one quantum (or until it finishes)
+        execution_time = min(time_quantum, current_process.remaining_time)
+        start = current_time
+        current_time += execution_time
+        current_process.remaining_time -= execution_time
+        
+        gantt_chart.append((current_process.process_id, start, current_time))
+        if log_slices:
+            _log_slice('RR', current_process.process_id, start, current_time)
+        if trace_writer:
+            trace_writer.record_slice(current_process.process_id, start, current_time,
+                                      current_process.remaining_time == 0)
+        
+        # Check if new processes arrived during execution
+        while cursor < total and processes[cursor].arrival_time <= current_time:
+            ready_queue.append(processes[cursor])
+            cursor += 1
+            changed = True
+        
+        if current_process.remaining_time == 0:
+            # Process finished
+            current_process.finish_time = current_time
+            current_process.turnaround_time = current_process.finish_time - current_process.arrival_time
+            current_process.waiting_time = current_process.turnaround_time - current_process.burst_time
+            completed.append(current_process)
+            changed = True
+        else:
+            # Process not finished, add back to end of ready queue
+            ready_queue.append(current_process)
+    
+    return gantt_chart, completed
+
+
+
+# Stride numerator: a process with t tickets advances its pass by STRIDE1 // t per quantum
+STRIDE1 = 1 << 20
+
+
+def priority_tickets(priorities):
+    """
+    Ticket counts for proportional-share scheduling, from the priority column.
+    Lower number = higher priority = more tickets; the lowest priority in the
+    workload gets 1 ticket (e.g. priorities 1..5 get 5..1 tickets).
+    
+    Args:
+        priorities (sequence): Priority of each process
+    
+    Returns:
+        list: Tickets of each process (always at least 1)
+    """
+    if not priorities:
+        return []
+    lowest = max(priorities)
+    return [lowest - priority + 1 for priority in priorities]
+
+
+class _TicketTree:
+    """
+    Fenwick (binary indexed) tree over the tickets of ready processes, by
+    arrival position: adding/removing tickets and finding the holder of a
+    ticket number are O(log n) instead of a walk over the ready list.
+    """
+    
+    def __init__(self, size):
+        """
+        Initialize an empty tree.
+        
+        Args:
+            size (int): Number of positions (processes)
+        """
+        self.tree = [0] * (size + 1)
+        self.total = 0  # Tickets currently in the draw
+        self.top = 1 << (size.bit_length() - 1) if size else 0  # Largest power of two <= size
+    
+    def add(self, position, tickets):
+        """
+        Add (or, with a negative count, remove) tickets at a position.
+        
+        Args:
+            position (int): Arrival position of the process
+            tickets (int): Ticket change
+        """
+        self.total += tickets
+        tree = self.tree
+        index = position + 1
+        while index < len(tree):
+            tree[index] += tickets
+            index += index & -index
+    
+    def find(self, ticket):
+        """
+        Position of the process holding a ticket number.
+        
+        Args:
+            ticket (int): Ticket number, 0 <= ticket < total
+        
+        Returns:
+            int: Arrival position whose ticket range contains the number
+        """
+        tree = self.tree
+        position = 0
+        step = self.top
+        while step:
+            index = position + step
+            if index < len(tree) and tree[index] <= ticket:
+                position = index
+                ticket -= tree[index]
+            step >>= 1
+        return position
+
+
+def _finish(process, current_time, completed):
+    """
+    Record a completed process.
+    
+    Args:
+        process (Process): Process that just finished
+        current_time (int): Finish time
+        completed (list): Completed processes, appended to
+    """
+    process.finish_time = current_time
+    process.turnaround_time = process.finish_time - process.arrival_time
+    process.waiting_time = process.turnaround_time - process.burst_time
+    completed.append(process)
+
+
+def run_lottery(processes, time_quantum, trace_writer=None, seed=0):
+    """
+    Lottery Scheduling
+    Preemptive, proportional share: every quantum a ticket is drawn at random
+    among the ready processes, so a process runs in proportion to its tickets.
+    The draw is a Fenwick tree descent, O(log n) per decision.
+    
+    Args:
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
+        time_quantum (int): Time slice for each draw
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
+        seed (int): Random seed; the same seed gives the same schedule (default: 0)
+    
+    Returns:
+        tuple: (gantt_chart, processes) where gantt_chart shows execution timeline
+    """
+    if time_quantum <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    workload = prepare_workload(processes)
+    processes = workload.copy_processes()
+    tickets = priority_tickets(workload.priorities)
+    # Only Lottery needs random; other runs do not pay for importing it
+    import random
+    draw = random.Random(seed).randrange
+    
+    # Initialize variables
+    current_time = 0
+    gantt_chart = []
+    completed = []
+    ready = _TicketTree(len(processes))
+    cursor = 0  # Next process (in arrival order) not yet in the draw
+    total = len(processes)
+    log_slices = logger.isEnabledFor(logging.DEBUG)
+    
+    while cursor < total or ready.total:
+        # Add all processes that have arrived by current_time to the draw
+        while cursor < total and processes[cursor].arrival_time <= current_time:
+            ready.add(cursor, tickets[cursor])
+            cursor += 1
+        
+        # Check if nothing is ready
+        if not ready.total:
+            # CPU is idle, jump to next process arrival
+            next_arrival = processes[cursor].arrival_time
+            gantt_chart.append(('IDLE', current_time, next_arrival))
+            if log_slices:
+                _log_slice('Lottery', 'IDLE', current_time, next_arrival)
+            if trace_writer:
+                trace_writer.idle(current_time, next_arrival)
+            current_time = next_arrival
+            continue
+        
+        # Draw the winning ticket
+        position = ready.find(draw(ready.total))
+        current_process = processes[position]
+        if current_process.start_time is None:
+            current_process.start_time = current_time
+        
+        # Run the winner for one quantum (or less if it finishes)
+        start = current_time
+        execution_time = min(time_quantum, current_process.remaining_time)
+        current_time += execution_time
+        current_process.remaining_time -= execution_time
+        
+        gantt_chart.append((current_process.process_id, start, current_time))
+        if log_slices:
+            _log_slice('Lottery', current_process.process_id, start, current_time)
+        if trace_writer:
+            trace_writer.record_slice(current_process.process_id, start, current_time,
+                                      current_process.remaining_time == 0)
+        
+        # A finished process leaves the draw with all its tickets
+        if current_process.remaining_time == 0:
+            ready.add(position, -tickets[position])
+            _finish(current_process, current_time, completed)
+    
+    return gantt_chart, completed
+
+
+def run_stride(processes, time_quantum, trace_writer=None):
+    """
+    Stride Scheduling
+    Preemptive, deterministic proportional share: each process has a pass value
+    that advances by its stride (STRIDE1 // tickets) per quantum, and the ready
+    process with the lowest pass runs next. The ready set is a heap of pass
+    values, O(log n) per decision; ties go to the earlier arrival.
+    
+    Args:
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
+        time_quantum (int): Time slice for each decision
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
+    
+    Returns:
+        tuple: (gantt_chart, processes) where gantt_chart shows execution timeline
+    """
+    if time_quantum <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    workload = prepare_workload(processes)
+    processes = workload.copy_processes()
+    strides = [max(1, STRIDE1 // tickets) for tickets in priority_tickets(workload.priorities)]
+    
+    # Initialize variables
+    current_time = 0
+    gantt_chart = []
+    completed = []
+    ready = []  # Heap of (pass value, arrival position)
+    global_pass = 0  # Pass value of the last dispatch; arrivals join one stride after it
+    cursor = 0  # Next process (in arrival order) not yet in the heap
+    total = len(processes)
+    log_slices = logger.isEnabledFor(logging.DEBUG)
+    
+    while cursor < total or ready:
+        # Add all processes that have arrived by current_time to the heap
+        while cursor < total and processes[cursor].arrival_time <= current_time:
+            heapq.heappush(ready, (global_pass + strides[cursor], cursor))
+            cursor += 1
+        
+        # Check if nothing is ready
+        if not ready:
+            # CPU is idle, jump to next process arrival
+            next_arrival = processes[cursor].arrival_time
+            gantt_chart.append(('IDLE', current_time, next_arrival))
+            if log_slices:
+                _log_slice('Stride', 'IDLE', current_time, next_arrival)
+            if trace_writer:
+                trace_writer.idle(current_time, next_arrival)
+            current_time = next_arrival
+            continue
+        
+        # Lowest pass value runs next
+        global_pass, position = heapq.heappop(ready)
+        current_process = processes[position]
+        if current_process.start_time is None:
+            current_process.start_time = current_time
+        
+        # Run it for one quantum (or less if it finishes)
+        start = current_time
+        execution_time = min(time_quantum, current_process.remaining_time)
+        current_time += execution_time
+        current_process.remaining_time -= execution_time
+        
+        gantt_chart.append((current_process.process_id, start, current_time))
+        if log_slices:
+            _log_slice('Stride', current_process.process_id, start, current_time)
+        if trace_writer:
+            trace_writer.record_slice(current_process.process_id, start, current_time,
+                                      current_process.remaining_time == 0)
+        
+        if current_process.remaining_time == 0:
+            _finish(current_process, current_time, completed)
+        else:
+            heapq.heappush(ready, (global_pass + strides[position], position))
+    
+    return gantt_chart, completed
+
+
+
+def run_edf(processes, trace_writer=None):
+    """
+    Earliest Deadline First (EDF) Scheduling Algorithm
+    Preemptive: the ready process with the earliest deadline runs; an arrival
+    with an earlier deadline preempts it. Processes without a deadline run
+    only when no process with one is ready (FCFS among themselves). The ready
+    queue is a heap keyed by (deadline, arrival order), so the run is
+    O(n log n): a process is only switched out when a new arrival preempts it.
+    
+    Args:
+        processes (list | PreparedWorkload): List of Process objects, or a workload
+                                             prepared once and shared by several runs
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
+    
+    Returns:
+        tuple: (gantt_chart, processes) where gantt_chart shows execution timeline
+    """
+    # Fresh copies in arrival order (the workload is sorted once and shared, see src.workload)
+    workload = prepare_workload(processes)
+    processes = workload.copy_processes()
+    
+    # Initialize variables
+    current_time = 0
+    gantt_chart = []
+    completed = []
+    ready = []  # Heap of (deadline, arrival position)
+    running = None  # Arrival position of the process on the CPU
+    slice_start = 0
+    cursor = 0  # Next process (in arrival order) not yet in the heap
+    total = len(processes)
+    log_slices = logger.isEnabledFor(logging.DEBUG)
+    
+    while cursor < total or ready:
+        # Add all processes that have arrived by current_time to the heap
+        while cursor < total and processes[cursor].arrival_time <= current_time:
+            deadline = processes[cursor].deadline
+            heapq.heappush(ready, (math.inf if deadline is None else deadline, cursor))
+            cursor += 1
+        
+        # Check if nothing is ready
+        if not ready:
+            # CPU is idle, jump to next process arrival
+            next_arrival = processes[cursor].arrival_time
+            gantt_chart.append(('IDLE', current_time, next_arrival))
+            if log_slices:
+                _log_slice('EDF', 'IDLE', current_time, next_arrival)
+            if trace_writer:
+                trace_writer.idle(current_time, next_arrival)
+            current_time = next_arrival
+            continue
+        
+        # Earliest deadline first; a new arrival may have taken over the top of the heap
+        position = ready[0][1]
+        if running is not None and position != running:
+            preempted = processes[running]
+            gantt_chart.append((preempted.process_id, slice_start, current_time))
+            if log_slices:
+                _log_slice('EDF', preempted.process_id, slice_start, current_time)
+            if trace_writer:
+                trace_writer.record_slice(preempted.process_id, slice_start, current_time, False)
+            running = None
+        current_process = processes[position]
+        if running is None:
+            running = position
+            slice_start = current_time
+            if current_process.start_time is None:
+                current_process.start_time = current_time
+        
+        # Run until the process finishes or the next arrival (which may preempt it)
+        run_until = current_time + current_process.remaining_time
+        if cursor < total and processes[cursor].arrival_time < run_until:
+            run_until = processes[cursor].arrival_time
+        current_process.remaining_time -= run_until - current_time
+        current_time = run_until
+        
+        if current_process.remaining_time == 0:
+            heapq.heappop(ready)
+            gantt_chart.append((current_process.process_id, slice_start, current_time))
+            if log_slices:
+                _log_slice('EDF', current_process.process_id, slice_start, current_time)
+            if trace_writer:
+                trace_writer.record_slice(current_process.process_id, slice_start, current_time, True)
+            _finish(current_process, current_time, completed)
+            running = None
+    
     return gantt_chart, completed
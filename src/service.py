@@ -0,0 +1,423 @@
+# Local HTTP simulation service
+# Lets other tools run simulations without main.py or the GUI. Requests are
+# handled on threads (so many can be in flight at once), simulations run in
+# a shared process pool, finished results are kept in an LRU cache, and
+# responses are streamed back with chunked transfer encoding.
+#
+# Endpoints:
+#   GET  /health    -> {"status": "ok", ...}
+#   POST /simulate  -> newline-delimited JSON, one line per algorithm as it
+#                      finishes, then a final {"done": true, ...} line
+#
+# POST /simulate accepts either
+#   - application/json: {"processes": [[id, arrival, burst, priority(, deadline)], ...]
+#                        or [{"id", "arrival", "burst", "priority"(, "deadline")}, ...],
+#                        or "workload": "<input file text>",
+#                        "algorithms": "rr,sjf" or ["rr", "sjf"],
+#                        "quantum": 3, "gantt": true}
+#   - any other content type: the raw bytes of an input file, with the
+#     parameters in the query string (?algorithms=rr,sjf&quantum=3&gantt=0)
+
+import collections
+import concurrent.futures
+import http.server
+import json
+import logging
+import os
+import threading
+import urllib.parse
+
+from src.checkpoint import workload_fingerprint
+from src.cli_view import get_deadline_metrics
+from src.guardrails import check_limits, estimate_cost
+from src.log_config import worker_logging_kwargs
+from src.model import Process
+from src.parser import iter_rows
+from src.simulator import (ALGORITHM_NAMES, OPTIONAL_ALGORITHM_NAMES, QUANTUM_ALGORITHMS,
+                           parse_algorithms, run_algorithm, summarize_run)
+from src.workload import prepare_workload
+
+# Default listen address (local only)
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8305
+
+# Largest accepted request body
+MAX_UPLOAD_BYTES = 64 * 1024 * 1024
+
+# Size of each chunk in a streamed response
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# Cached algorithm results kept by default
+DEFAULT_CACHE_SIZE = 256
+
+
+class RequestError(Exception):
+    """
+    Invalid request; reported to the client with an HTTP status code.
+    """
+    
+    def __init__(self, message, status=400):
+        """
+        Initialize the error.
+        
+        Args:
+            message (str): Error message sent to the client
+            status (int): HTTP status code (default: 400)
+        """
+        super().__init__(message)
+        self.status = status
+
+
+def simulate_job(processes, algorithm, time_quantum, include_gantt):
+    """
+    Run one algorithm and convert the result to JSON-ready data (worker process).
+    
+    Args:
+        processes (list | PreparedWorkload): List of Process objects or a prepared workload
+        algorithm (str): One of ALGORITHM_NAMES
+        time_quantum (int): Time Quantum for Round Robin
+        include_gantt (bool): Include the Gantt chart in the result
+    
+    Returns:
+        dict: algorithm, metrics, per-process rows, deadline misses (if any process
+              has a deadline) and (optionally) the Gantt chart
+    """
+    gantt_chart, completed = run_algorithm(algorithm, processes, time_quantum)
+    result = {
+        'algorithm': algorithm,
+        'metrics': summarize_run(gantt_chart, completed),
+        'processes': [{'id': p.process_id, 'arrival': p.arrival_time, 'burst': p.burst_time,
+                       'priority': p.priority, 'start': p.start_time, 'finish': p.finish_time,
+                       'turnaround': p.turnaround_time, 'waiting': p.waiting_time}
+                      for p in completed],
+    }
+    if algorithm in QUANTUM_ALGORITHMS:
+        result['time_quantum'] = time_quantum
+    if any(p.deadline is not None for p in completed):
+        result['deadlines'] = get_deadline_metrics(completed)
+    if include_gantt:
+        result['gantt'] = [list(entry) for entry in gantt_chart]
+    return result
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of algorithm results.
+    """
+    
+    def __init__(self, max_entries=DEFAULT_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries (int): Results kept before the least recently used is dropped
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """
+        Look up a result.
+        
+        Args:
+            key (tuple): Cache key
+        
+        Returns:
+            dict: Cached result, or None
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+    
+    def put(self, key, result):
+        """
+        Store a result, evicting the least recently used one if full.
+        
+        Args:
+            key (tuple): Cache key
+            result (dict): Result of simulate_job()
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+def _rows_from_json(payload):
+    """
+    Extract process rows from a JSON request body.
+    
+    Args:
+        payload (dict): Decoded JSON body
+    
+    Returns:
+        list: (process_id, arrival_time, burst_time, priority) tuples, plus
+              (bursts, deadline) for entries with a deadline
+    
+    Raises:
+        RequestError: If the workload is missing or malformed
+    """
+    if 'workload' in payload:
+        if not isinstance(payload['workload'], str):
+            raise RequestError("'workload' must be the text of an input file")
+        return list(iter_rows(payload['workload'].splitlines()))
+    
+    entries = payload.get('processes')
+    if not isinstance(entries, list):
+        raise RequestError("Request needs 'processes' (a list) or 'workload' (input file text)")
+    
+    rows = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            entry = [entry.get('id'), entry.get('arrival'), entry.get('burst'), entry.get('priority'),
+                     entry.get('deadline')]
+        if not isinstance(entry, list) or len(entry) not in (4, 5):
+            raise RequestError(f"Invalid process entry: {entry!r}")
+        row = (str(entry[0]), int(entry[1]), int(entry[2]), int(entry[3]))
+        if len(entry) == 5 and entry[4] is not None:
+            row += (None, int(entry[4]))  # No CPU/I-O bursts, then the deadline
+        rows.append(row)
+    return rows
+
+
+def _parse_flag(value):
+    """Interpret a query-string or JSON boolean ("0", "false", False -> False)."""
+    if isinstance(value, str):
+        return value.strip().lower() not in ('0', 'false', 'no', 'off', '')
+    return bool(value)
+
+
+class SimulationHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Request handler; one instance per request, on its own thread.
+    """
+    
+    # Chunked transfer encoding needs HTTP/1.1
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, format, *args):
+        """Send access logs to the application log instead of stderr."""
+        logging.info(f"Service {self.address_string()} - {format % args}")
+    
+    def do_GET(self):
+        """Health check."""
+        if urllib.parse.urlsplit(self.path).path != '/health':
+            self._send_error(RequestError("Not found", 404))
+            return
+        
+        cache = self.server.cache
+        self._send_json(200, {'status': 'ok', 'algorithms': list(ALGORITHM_NAMES + OPTIONAL_ALGORITHM_NAMES),
+                              'cache_entries': len(cache), 'cache_hits': cache.hits,
+                              'cache_misses': cache.misses})
+    
+    def do_POST(self):
+        """Run a simulation request and stream the results."""
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != '/simulate':
+            self._send_error(RequestError("Not found", 404))
+            return
+        
+        try:
+            processes, algorithms, time_quantum, include_gantt = self._read_request(url.query)
+        except RequestError as e:
+            self._send_error(e)
+            return
+        
+        logging.info(f"Service request: {len(processes)} processes, {', '.join(algorithms)}, TQ={time_quantum}")
+        self._stream_results(processes, algorithms, time_quantum, include_gantt)
+    
+    def _read_request(self, query):
+        """
+        Decode the request body and parameters.
+        
+        Args:
+            query (str): URL query string
+        
+        Returns:
+            tuple: (processes, algorithms, time_quantum, include_gantt)
+        
+        Raises:
+            RequestError: If the request is invalid
+        """
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_UPLOAD_BYTES:
+            raise RequestError(f"Upload larger than {MAX_UPLOAD_BYTES} bytes", 413)
+        body = self.rfile.read(length)
+        params = {key: values[-1] for key, values in urllib.parse.parse_qs(query).items()}
+        
+        try:
+            if self.headers.get_content_type() == 'application/json':
+                payload = json.loads(body or b'{}')
+                if not isinstance(payload, dict):
+                    raise RequestError("JSON body must be an object")
+                params.update({key: payload[key] for key in ('algorithms', 'quantum', 'gantt')
+                               if key in payload})
+                rows = _rows_from_json(payload)
+            else:
+                # Binary upload: the bytes of an input file
+                rows = list(iter_rows(body.decode('utf-8').splitlines()))
+            
+            algorithms = params.get('algorithms', 'all')
+            if isinstance(algorithms, list):
+                algorithms = ','.join(algorithms)
+            algorithms = parse_algorithms(str(algorithms))
+            time_quantum = int(params.get('quantum', 3))
+        except (ValueError, TypeError, UnicodeDecodeError) as e:
+            # json.JSONDecodeError is a ValueError
+            raise RequestError(str(e))
+        
+        if time_quantum <= 0:
+            raise RequestError("Time quantum must be greater than 0")
+        if not rows:
+            raise RequestError("No processes in the workload")
+        
+        processes = [Process(*row) for row in rows]
+        return processes, algorithms, time_quantum, _parse_flag(params.get('gantt', True))
+    
+    def _stream_results(self, processes, algorithms, time_quantum, include_gantt):
+        """
+        Run the algorithms (cache first, then the pool) and stream one JSON
+        line per algorithm as each finishes.
+        
+        Args:
+            processes (list): List of Process objects
+            algorithms (list): Algorithm names
+            time_quantum (int): Time Quantum for Round Robin
+            include_gantt (bool): Include Gantt charts in the results
+        """
+        cache = self.server.cache
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        
+        avg_waiting = {}
+        futures = {}
+        workload = None  # Prepared on the first cache miss, then shared by every job
+        for algorithm in algorithms:
+            # Only the quantum-based algorithms depend on the quantum
+            quantum_key = time_quantum if algorithm in QUANTUM_ALGORITHMS else None
+            key = (workload_fingerprint(processes, algorithm, quantum_key), include_gantt)
+            result = cache.get(key)
+            if result is not None:
+                avg_waiting[algorithm] = result['metrics']['avg_waiting_time']
+                self._write_line(dict(result, cached=True))
+            else:
+                if workload is None:
+                    workload = prepare_workload(processes)
+                # Pre-flight: a run over the limits (e.g. quantum 1 on huge bursts) would pin a worker
+                reasons = check_limits(estimate_cost(workload, algorithm, time_quantum))
+                if reasons:
+                    logging.warning(f"Service refused {algorithm}: {', '.join(reasons)}")
+                    self._write_line({'algorithm': algorithm, 'error': f"Over limits: {', '.join(reasons)}"})
+                    continue
+                future = self.server.executor.submit(simulate_job, workload, algorithm,
+                                                     time_quantum, include_gantt)
+                futures[future] = (algorithm, key)
+        
+        for future in concurrent.futures.as_completed(futures):
+            algorithm, key = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logging.error(f"Service run of {algorithm} failed: {type(e).__name__}: {e}")
+                self._write_line({'algorithm': algorithm, 'error': f"{type(e).__name__}: {e}"})
+                continue
+            cache.put(key, result)
+            avg_waiting[result['algorithm']] = result['metrics']['avg_waiting_time']
+            self._write_line(dict(result, cached=False))
+        
+        # Same rule as the smart recommendation: lowest average waiting time,
+        # ties go to the algorithm requested first
+        ranked = [name for name in algorithms if name in avg_waiting]
+        best = min(ranked, key=lambda name: avg_waiting[name]) if ranked else None
+        self._write_line({'done': True, 'best': best})
+        self.wfile.write(b'0\r\n\r\n')
+    
+    def _write_line(self, obj):
+        """Encode one JSON line and send it in chunks."""
+        data = (json.dumps(obj, separators=(',', ':')) + '\n').encode('utf-8')
+        for offset in range(0, len(data), RESPONSE_CHUNK_SIZE):
+            chunk = data[offset:offset + RESPONSE_CHUNK_SIZE]
+            self.wfile.write(f"{len(chunk):X}\r\n".encode('ascii') + chunk + b'\r\n')
+        self.wfile.flush()
+    
+    def _send_json(self, status, obj):
+        """Send a complete (non-streamed) JSON response."""
+        data = json.dumps(obj).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _send_error(self, error):
+        """Report a RequestError to the client."""
+        logging.error(f"Service request rejected: {error}")
+        # The body may be unread, so do not reuse the connection
+        self.close_connection = True
+        self._send_json(error.status, {'error': str(error)})
+
+
+class SimulationServer(http.server.ThreadingHTTPServer):
+    """
+    Threaded HTTP server owning the worker pool and the result cache.
+    """
+    
+    daemon_threads = True
+    
+    def __init__(self, address, workers=None, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        Bind the server and start the worker pool.
+        
+        Args:
+            address (tuple): (host, port) to listen on
+            workers (int): Worker processes (default: CPU count)
+            cache_size (int): Cached algorithm results to keep
+        """
+        super().__init__(address, SimulationHandler)
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1, **worker_logging_kwargs())
+        self.cache = ResultCache(cache_size)
+    
+    def server_close(self):
+        """Stop accepting requests and shut down the worker pool."""
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+def run_service(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Serve simulation requests until interrupted (Ctrl+C).
+    
+    Args:
+        host (str): Interface to listen on (default: localhost only)
+        port (int): TCP port
+        workers (int): Worker processes (default: CPU count)
+        cache_size (int): Cached algorithm results to keep
+    """
+    server = SimulationServer((host, port), workers=workers, cache_size=cache_size)
+    print(f"Simulation service listening on http://{host}:{server.server_address[1]} (Ctrl+C to stop)")
+    logging.info(f"Service started on {host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping service...")
+    finally:
+        server.server_close()
+        logging.info("Service stopped")
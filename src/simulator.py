@@ -0,0 +1,272 @@
+# Simulator facade - run scheduling algorithms by name
+# Shared by the CLI, batch mode and other non-GUI entry points, and the
+# library entry point: simulate() runs only the requested algorithms and
+# returns structured results without printing or exporting anything.
+
+import os
+
+from src.model import Process
+from src.parser import iter_input
+from src.scheduler import (run_fcfs, run_sjf, run_priority, run_rr, run_rr_fast, run_lottery, run_stride,
+                           run_edf)
+from src.priority_buckets import run_priority_buckets
+from src.io_scheduler import has_io_bursts, run_io_bursts
+from src.cli_view import calculate_cpu_utilization, get_average_waiting_time, get_average_turnaround_time
+from src.workload import prepare_workload
+
+
+# Algorithm display names, in the order the CLI runs them
+ALGORITHM_NAMES = ('FCFS', 'SJF', 'Priority', 'Round Robin')
+
+# Proportional-share algorithms (tickets from the priority column)
+PROPORTIONAL_SHARE_NAMES = ('Lottery', 'Stride')
+
+# Algorithms that run only when selected by name: "all" and the defaults keep
+# the four above. EDF schedules by the optional deadline column.
+OPTIONAL_ALGORITHM_NAMES = PROPORTIONAL_SHARE_NAMES + ('EDF',)
+
+# Algorithms whose result depends on the time quantum
+QUANTUM_ALGORITHMS = ('Round Robin',) + PROPORTIONAL_SHARE_NAMES
+
+# Short names accepted on the command line (e.g. --algorithms rr,sjf)
+ALGORITHM_ALIASES = {
+    'fcfs': 'FCFS',
+    'sjf': 'SJF',
+    'priority': 'Priority',
+    'rr': 'Round Robin',
+    'lottery': 'Lottery',
+    'stride': 'Stride',
+    'edf': 'EDF',
+}
+
+# Parts of a result simulate() can produce
+SIMULATION_OUTPUTS = ('metrics', 'gantt', 'processes')
+
+
+def parse_algorithms(spec):
+    """
+    Convert a comma-separated list of short names into algorithm names.
+    
+    Args:
+        spec (str): e.g. "rr,sjf" (case-insensitive, display names such as
+                    "Round Robin" also work); "all" selects every algorithm
+    
+    Returns:
+        list: Algorithm display names in the order given, without duplicates
+    
+    Raises:
+        ValueError: If a name is not a known algorithm
+    """
+    if spec.strip().lower() == 'all':
+        return list(ALGORITHM_NAMES)
+    
+    names = dict(ALGORITHM_ALIASES)
+    names.update({algorithm.lower(): algorithm for algorithm in ALGORITHM_NAMES + OPTIONAL_ALGORITHM_NAMES})
+    
+    algorithms = []
+    for name in spec.split(','):
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name not in names:
+            raise ValueError(f"Unknown algorithm '{name}' "
+                             f"(choose from: {', '.join(ALGORITHM_ALIASES)})")
+        if names[name] not in algorithms:
+            algorithms.append(names[name])
+    
+    if not algorithms:
+        raise ValueError("No algorithms selected")
+    return algorithms
+
+
+def run_algorithm(algorithm, processes, time_quantum=3, trace_writer=None, fast_rr=False,
+                  aging_interval=None):
+    """
+    Run one scheduling algorithm by its display name.
+    
+    Args:
+        algorithm (str): One of ALGORITHM_NAMES or OPTIONAL_ALGORITHM_NAMES
+        processes (list | PreparedWorkload): List of Process objects (not modified), or a
+                                             workload prepared once for several runs
+        time_quantum (int): Time Quantum for Round Robin, Lottery and Stride (default: 3)
+        trace_writer (TraceWriter): Optional binary trace recorder (see src.trace)
+        fast_rr (bool): Use the round-skipping Round Robin engine (same metrics,
+                        skipped rounds summarized in the Gantt chart)
+        aging_interval (int): Priority ages waiting processes by one level per
+                              this many time units (None: no aging)
+    
+    Returns:
+        tuple: (gantt_chart, completed) as returned by the run_* functions
+    
+    Raises:
+        ValueError: For an unknown algorithm, or an optional one on I/O bursts
+    """
+    if has_io_bursts(processes):
+        if algorithm in ALGORITHM_NAMES:
+            # Processes block during I/O: event-driven engine for every algorithm
+            return run_io_bursts(processes, algorithm, time_quantum, trace_writer)
+        if algorithm in OPTIONAL_ALGORITHM_NAMES:
+            raise ValueError(f"{algorithm} does not support CPU/I-O burst sequences")
+    if algorithm == 'FCFS':
+        return run_fcfs(processes, trace_writer)
+    if algorithm == 'SJF':
+        return run_sjf(processes, trace_writer)
+    if algorithm == 'Priority':
+        if aging_interval:
+            return run_priority_buckets(processes, aging_interval, trace_writer)
+        return run_priority(processes, trace_writer)
+    if algorithm == 'Round Robin':
+        if fast_rr:
+            return run_rr_fast(processes, time_quantum, trace_writer)
+        return run_rr(processes, time_quantum, trace_writer)
+    if algorithm == 'Lottery':
+        return run_lottery(processes, time_quantum, trace_writer)
+    if algorithm == 'Stride':
+        return run_stride(processes, time_quantum, trace_writer)
+    if algorithm == 'EDF':
+        return run_edf(processes, trace_writer)
+    raise ValueError(f"Unknown algorithm: {algorithm}")
+
+
+def summarize_run(gantt_chart, completed):
+    """
+    Reduce one algorithm run to its summary metrics.
+    
+    Args:
+        gantt_chart (list): List of tuples (process_id, start_time, end_time)
+        completed (list): List of completed Process objects
+    
+    Returns:
+        dict: avg_waiting_time, avg_turnaround_time and cpu_utilization
+    """
+    return {
+        'avg_waiting_time': get_average_waiting_time(completed),
+        'avg_turnaround_time': get_average_turnaround_time(completed),
+        'cpu_utilization': calculate_cpu_utilization(gantt_chart),
+    }
+
+
+class AlgorithmResult:
+    """
+    Structured result of one algorithm run, as returned by simulate().
+    """
+    
+    def __init__(self, algorithm, metrics, gantt_chart=None, processes=None, time_quantum=None):
+        """
+        Initialize the result.
+        
+        Args:
+            algorithm (str): Algorithm display name
+            metrics (dict): avg_waiting_time, avg_turnaround_time and cpu_utilization
+            gantt_chart (list): (process_id, start_time, end_time) tuples, if requested
+            processes (list): Completed Process objects, if requested
+            time_quantum (int): Time Quantum (quantum-based algorithms only)
+        """
+        self.algorithm = algorithm
+        self.metrics = metrics
+        self.gantt_chart = gantt_chart
+        self.processes = processes
+        self.time_quantum = time_quantum
+    
+    def __repr__(self):
+        """
+        String representation for debugging purposes.
+        
+        Returns:
+            str: Algorithm name and average waiting time
+        """
+        return f"AlgorithmResult({self.algorithm}, avg WT={self.metrics['avg_waiting_time']:.2f})"
+
+
+def simulate(workload, algorithms=ALGORITHM_NAMES, quantum=3, outputs=SIMULATION_OUTPUTS):
+    """
+    Run the requested algorithms on a workload and return structured results.
+    Results are never printed or exported. The one exception is the parser:
+    a line of an input file with the wrong number of fields is skipped with
+    a "Warning: Skipping invalid line" on stdout, as in every other mode.
+    
+    Example:
+        results = simulate("data/processes.txt", algorithms="rr,sjf", quantum=4,
+                           outputs=("metrics",))
+        results["SJF"].metrics["avg_waiting_time"]
+    
+    Args:
+        workload (str | list): Input file path, or a list of Process objects or
+                               (process_id, arrival_time, burst_time, priority[, bursts[, deadline]]) tuples
+        algorithms (str | sequence): Names or short names, e.g. "rr,sjf" or ["FCFS", "rr"]
+        quantum (int): Time Quantum for Round Robin (default: 3)
+        outputs (sequence): Any of SIMULATION_OUTPUTS. With only 'metrics', no
+                            Gantt chart or per-process results are built at all
+                            (unless processes have I/O bursts).
+    
+    Returns:
+        dict: Algorithm name -> AlgorithmResult, in the requested order
+    
+    Raises:
+        ValueError: For unknown algorithms or outputs, a bad quantum, an empty
+                    workload or a malformed input file
+        FileNotFoundError: If the input file does not exist
+    """
+    if isinstance(algorithms, str):
+        algorithms = parse_algorithms(algorithms)
+    else:
+        algorithms = parse_algorithms(','.join(algorithms))
+    
+    outputs = set(outputs)
+    unknown = outputs - set(SIMULATION_OUTPUTS)
+    if unknown:
+        raise ValueError(f"Unknown outputs: {', '.join(sorted(unknown))} "
+                         f"(choose from: {', '.join(SIMULATION_OUTPUTS)})")
+    if quantum <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    
+    processes = _load_workload(workload)
+    if not processes:
+        raise ValueError("No processes in the workload")
+    
+    # Sorted once, shared by every algorithm
+    prepared = prepare_workload(processes)
+    
+    results = {}
+    if outputs <= {'metrics'} and not prepared.has_io and set(algorithms) <= set(ALGORITHM_NAMES):
+        # Metrics only: stream rows (already in arrival order) through the aggregate engines
+        from src.metrics_only import run_metrics_only
+        rows = list(zip(prepared.ids, prepared.arrivals, prepared.bursts, prepared.priorities))
+        for algorithm in algorithms:
+            metrics = run_metrics_only(algorithm, rows, quantum).summary()
+            results[algorithm] = AlgorithmResult(
+                algorithm, metrics, time_quantum=quantum if algorithm in QUANTUM_ALGORITHMS else None)
+        return results
+    
+    for algorithm in algorithms:
+        gantt_chart, completed = run_algorithm(algorithm, prepared, quantum)
+        results[algorithm] = AlgorithmResult(
+            algorithm,
+            summarize_run(gantt_chart, completed),
+            gantt_chart=gantt_chart if 'gantt' in outputs else None,
+            processes=completed if 'processes' in outputs else None,
+            time_quantum=quantum if algorithm in QUANTUM_ALGORITHMS else None
+        )
+    return results
+
+
+def _load_workload(workload):
+    """
+    Turn a simulate() workload argument into a list of Process objects.
+    
+    Args:
+        workload (str | list): Input file path, Process objects or row tuples
+    
+    Returns:
+        list: List of Process objects
+    
+    Raises:
+        FileNotFoundError: If the input file does not exist
+        ValueError: If a line of the input file is malformed
+    """
+    if isinstance(workload, (str, os.PathLike)):
+        if not os.path.isfile(workload):
+            raise FileNotFoundError(f"Input file '{workload}' not found")
+        # iter_input raises on bad values; parse_input would print and return []
+        return [Process(*row) for row in iter_input(workload)]
+    return [p if isinstance(p, Process) else Process(*p) for p in workload]
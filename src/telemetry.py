@@ -0,0 +1,306 @@
+# Windowed time-series telemetry for a simulation run
+# A Telemetry object records the same slice / idle events as a TraceWriter,
+# so every engine can feed it through its trace_writer hook while it runs.
+# Time is split into equal windows; for each window it keeps
+#   in_flight     - processes arrived but not finished (time-averaged, and peak)
+#   ready_queue   - of those, the ones waiting for the CPU (not running, not in I/O)
+#   throughput    - completions in the window (a completion exactly on a
+#                   boundary counts for the window it ends)
+#   utilization   - share of the window the CPU was busy
+#
+# Series live in fixed-size arrays: when the run outgrows them, adjacent
+# windows are merged pairwise and the window width doubles, so memory stays
+# constant and the whole run is always covered. Events arrive in time order,
+# so everything is updated by a single forward sweep of the clock.
+
+import heapq
+from array import array
+
+# Windows kept per series (the width doubles when a run needs more)
+DEFAULT_CAPACITY = 512
+
+# Decimal places kept in the exported series
+EXPORT_DECIMALS = 3
+
+# Series names, in export order
+TELEMETRY_SERIES = ('ready_queue', 'in_flight', 'peak_in_flight', 'throughput', 'utilization')
+
+
+class Telemetry:
+    """
+    Incrementally maintained per-window series for one algorithm run.
+    Pass it (or a SliceTee containing it) as an engine's trace_writer.
+    """
+    
+    def __init__(self, processes, window=1, capacity=DEFAULT_CAPACITY):
+        """
+        Initialize empty series.
+        
+        Args:
+            processes (list): The workload being simulated (arrival times and
+                              I/O bursts are read from it)
+            window (int): Initial window width in time units (doubles as needed)
+            capacity (int): Number of windows kept (must be even)
+        """
+        if window <= 0:
+            raise ValueError("Telemetry window must be greater than 0")
+        if capacity < 2 or capacity % 2:
+            raise ValueError("Telemetry capacity must be an even number of at least 2")
+        
+        self.window = window
+        self.capacity = capacity
+        
+        # Time integrals per window (divide by the window width for averages)
+        self._in_flight = array('q', bytes(8 * capacity))
+        self._busy = array('q', bytes(8 * capacity))
+        self._blocked = array('q', bytes(8 * capacity))
+        # Counts per window
+        self._completions = array('q', bytes(8 * capacity))
+        self._peak = array('q', bytes(8 * capacity))
+        
+        self._arrivals = sorted(p.arrival_time for p in processes)
+        self._cursor = 0  # Next arrival not yet counted
+        self._wakeups = []  # Heap of I/O completion times of blocked processes
+        self._count = 0  # Processes in flight at the clock
+        self._clock = 0
+        
+        # CPU/I-O processes: [cpu time used, end of current CPU burst (cumulative), burst index, bursts]
+        self._io = {p.process_id: [0, p.bursts[0], 0, p.bursts] for p in processes if p.bursts}
+        
+        self._apply_events(0)
+    
+    def _merge(self):
+        """Halve the resolution: merge adjacent windows and double the width."""
+        half = self.capacity // 2
+        for series in (self._in_flight, self._busy, self._blocked, self._completions):
+            for i in range(half):
+                series[i] = series[2 * i] + series[2 * i + 1]
+            for i in range(half, self.capacity):
+                series[i] = 0
+        peak = self._peak
+        for i in range(half):
+            peak[i] = max(peak[2 * i], peak[2 * i + 1])
+        for i in range(half, self.capacity):
+            peak[i] = 0
+        self.window *= 2
+    
+    def _index(self, time):
+        """Window index of a time, merging windows until it fits."""
+        while time // self.window >= self.capacity:
+            self._merge()
+        return time // self.window
+    
+    def _apply_events(self, time):
+        """Count arrivals and I/O completions that happen at `time`."""
+        while self._cursor < len(self._arrivals) and self._arrivals[self._cursor] <= time:
+            self._count += 1
+            self._cursor += 1
+        while self._wakeups and self._wakeups[0] <= time:
+            heapq.heappop(self._wakeups)
+    
+    def _advance(self, until, running):
+        """
+        Sweep the clock forward, integrating the counters per window.
+        
+        Args:
+            until (int): Time to advance to
+            running (int): 1 if the CPU is busy over the whole span, else 0
+        """
+        while self._clock < until:
+            index = self._index(self._clock)
+            step_end = min(until, (index + 1) * self.window)
+            if self._cursor < len(self._arrivals):
+                step_end = min(step_end, self._arrivals[self._cursor])
+            if self._wakeups:
+                step_end = min(step_end, self._wakeups[0])
+            
+            span = step_end - self._clock
+            if self._count > self._peak[index]:
+                self._peak[index] = self._count
+            self._in_flight[index] += self._count * span
+            self._busy[index] += running * span
+            self._blocked[index] += len(self._wakeups) * span
+            
+            self._clock = step_end
+            self._apply_events(step_end)
+    
+    def idle(self, start, end):
+        """
+        Record an idle period.
+        
+        Args:
+            start (int): Idle start time
+            end (int): Idle end time
+        """
+        self._advance(end, 0)
+    
+    def record_slice(self, process_id, start, end, finished):
+        """
+        Record one execution slice.
+        
+        Args:
+            process_id (str): Process ID (or a round-summary ID)
+            start (int): Slice start time
+            end (int): Slice end time
+            finished (bool): True if the process completed at the end of the slice
+        """
+        self._advance(start, 0)
+        self._advance(end, 1)
+        
+        if finished:
+            # Counted in the window it ends, (start, end], so the last completion is kept
+            self._count -= 1
+            self._completions[self._index(max(end - 1, 0))] += 1
+            return
+        
+        # A CPU burst that ends here without finishing the process means I/O
+        state = self._io.get(process_id)
+        if state is not None:
+            state[0] += end - start
+            if state[0] == state[1]:
+                bursts = state[3]
+                heapq.heappush(self._wakeups, end + bursts[state[2] + 1])
+                state[2] += 2
+                state[1] += bursts[state[2]]
+    
+    def series(self):
+        """
+        The recorded series, one value per window up to the current time.
+        
+        Returns:
+            dict: 'window' (width), 'end' (last time recorded), plus a list per
+                  TELEMETRY_SERIES name; averages use the covered part of the
+                  last window
+        """
+        windows = -(-self._clock // self.window) if self._clock else 0
+        result = {'window': self.window, 'end': self._clock}
+        result.update({name: [] for name in TELEMETRY_SERIES})
+        
+        for i in range(windows):
+            length = min(self.window, self._clock - i * self.window)
+            result['in_flight'].append(self._in_flight[i] / length)
+            result['ready_queue'].append(
+                (self._in_flight[i] - self._busy[i] - self._blocked[i]) / length)
+            result['peak_in_flight'].append(self._peak[i])
+            result['throughput'].append(self._completions[i])
+            result['utilization'].append(self._busy[i] / length * 100)
+        return result
+    
+    def peak_window(self, name='ready_queue'):
+        """
+        The window where a series is highest (e.g. the worst overload).
+        
+        Args:
+            name (str): One of TELEMETRY_SERIES
+        
+        Returns:
+            tuple: (window start, window end, value), or None for an empty run
+        """
+        values = self.series()[name]
+        if not values:
+            return None
+        index = max(range(len(values)), key=values.__getitem__)
+        return index * self.window, min((index + 1) * self.window, self._clock), values[index]
+    
+    @classmethod
+    def from_run(cls, processes, gantt_chart, window=1, capacity=DEFAULT_CAPACITY):
+        """
+        Build telemetry from a finished run's Gantt chart.
+        
+        Args:
+            processes (list): Completed Process objects of the run
+            gantt_chart (list): List of tuples (process_id, start_time, end_time)
+            window (int): Initial window width in time units
+            capacity (int): Number of windows kept
+        
+        Returns:
+            Telemetry: Series for the run
+        """
+        telemetry = cls(processes, window, capacity)
+        last_slice = {process_id: i for i, (process_id, _, _) in enumerate(gantt_chart)}
+        finish_times = {p.process_id: p.finish_time for p in processes}
+        for i, (process_id, start, end) in enumerate(gantt_chart):
+            if process_id == 'IDLE':
+                telemetry.idle(start, end)
+            else:
+                finished = last_slice[process_id] == i and finish_times.get(process_id) == end
+                telemetry.record_slice(process_id, start, end, finished)
+        return telemetry
+
+
+class SliceTee:
+    """
+    Forwards slice and idle events to several recorders (e.g. a TraceWriter
+    and a Telemetry), so one engine run feeds them all.
+    """
+    
+    def __init__(self, *recorders):
+        """
+        Initialize the tee.
+        
+        Args:
+            *recorders: Objects with idle() and record_slice() methods
+        """
+        self.recorders = recorders
+    
+    def idle(self, start, end):
+        """Forward an idle period to every recorder."""
+        for recorder in self.recorders:
+            recorder.idle(start, end)
+    
+    def record_slice(self, process_id, start, end, finished):
+        """Forward an execution slice to every recorder."""
+        for recorder in self.recorders:
+            recorder.record_slice(process_id, start, end, finished)
+    
+    def checkpoint_state(self):
+        """
+        Capture the state of the recorder that keeps one (the trace writer).
+        
+        Returns:
+            dict: The first recorder's checkpoint state, or None if none keeps state
+        """
+        for recorder in self.recorders:
+            state = recorder.checkpoint_state() if hasattr(recorder, 'checkpoint_state') else None
+            if state is not None:
+                return state
+        return None
+
+
+def combine_recorders(*recorders):
+    """
+    Combine optional recorders into one trace_writer argument.
+    
+    Args:
+        *recorders: Recorders, any of which may be None
+    
+    Returns:
+        The single recorder, a SliceTee of several, or None
+    """
+    recorders = [recorder for recorder in recorders if recorder is not None]
+    if not recorders:
+        return None
+    if len(recorders) == 1:
+        return recorders[0]
+    return SliceTee(*recorders)
+
+
+def write_telemetry(runs, file_path):
+    """
+    Export the series of several runs as compact column-oriented JSON.
+    
+    Args:
+        runs (dict): Algorithm name -> Telemetry
+        file_path (str): Output file path
+    """
+    # Only needed for the export; runs without --telemetry never load it
+    import json
+    
+    data = {}
+    for algorithm, telemetry in runs.items():
+        series = telemetry.series()
+        for name in ('ready_queue', 'in_flight', 'utilization'):
+            series[name] = [round(value, EXPORT_DECIMALS) for value in series[name]]
+        data[algorithm] = series
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, separators=(',', ':'))
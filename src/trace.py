@@ -0,0 +1,447 @@
+# Compact binary execution traces
+# Schedulers stream dispatch / preempt / complete / idle events to a trace
+# file while they run; the CLI and GUI can re-render a run from the file
+# (read through mmap) without simulating it again.
+#
+# File layout:
+#   header : MAGIC, version byte, varint length + UTF-8 algorithm label
+#   records: varint tag = (argument << 3) | opcode, then opcode-specific varints
+#
+#   DEFINE   arg = byte length, then the UTF-8 process ID (gets the next index)
+#   DISPATCH arg = process index, then varint time delta
+#   PREEMPT  arg = time delta (running process goes back to the ready queue)
+#   COMPLETE arg = time delta (running process finished)
+#   IDLE     arg = time delta to idle start, then varint idle duration
+#
+# Time deltas are relative to the previous event, so long runs with small
+# slices encode in two or three bytes per event.
+
+import contextlib
+import mmap
+import os
+
+MAGIC = b'SCHT'
+VERSION = 1
+
+# Record opcodes (3 bits)
+OP_DEFINE = 0
+OP_DISPATCH = 1
+OP_PREEMPT = 2
+OP_COMPLETE = 3
+OP_IDLE = 4
+
+# Flush the write buffer once it grows past this many bytes
+FLUSH_THRESHOLD = 1 << 16
+
+# Trace file extension
+TRACE_EXTENSION = '.sct'
+
+
+def encode_varint(value, buffer):
+    """
+    Append an unsigned LEB128 varint to a bytearray.
+    
+    Args:
+        value (int): Non-negative integer
+        buffer (bytearray): Destination buffer
+    """
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def decode_varint(data, offset):
+    """
+    Read an unsigned LEB128 varint.
+    
+    Args:
+        data (bytes-like): Source buffer (bytes or mmap)
+        offset (int): Position of the first byte
+    
+    Returns:
+        tuple: (value, offset after the varint)
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class TraceWriter:
+    """
+    Streaming writer for scheduling event traces.
+    Events are encoded into an in-memory buffer that is flushed to disk in
+    large blocks, so recording adds little to the simulation loop.
+    """
+    
+    def __init__(self, file_path, algorithm=''):
+        """
+        Open a trace file and write its header.
+        
+        Args:
+            file_path (str): Output path (overwritten)
+            algorithm (str): Label stored in the header (e.g. "Round Robin (Q=3)")
+        """
+        self.file_path = file_path
+        self._file = open(file_path, 'wb')
+        self._buffer = bytearray(MAGIC)
+        self._buffer.append(VERSION)
+        label = algorithm.encode('utf-8')
+        encode_varint(len(label), self._buffer)
+        self._buffer += label
+        
+        self._ids = {}  # process ID -> interned index
+        self._last_time = 0
+        self.events = 0
+    
+    def _delta(self, time):
+        """Return time since the previous event and advance the clock."""
+        delta = time - self._last_time
+        if delta < 0:
+            raise ValueError(f"Trace events must be in time order ({time} < {self._last_time})")
+        self._last_time = time
+        return delta
+    
+    def _intern(self, process_id):
+        """Return the index of a process ID, emitting a DEFINE record on first use."""
+        index = self._ids.get(process_id)
+        if index is None:
+            index = len(self._ids)
+            self._ids[process_id] = index
+            encoded = process_id.encode('utf-8')
+            encode_varint((len(encoded) << 3) | OP_DEFINE, self._buffer)
+            self._buffer += encoded
+        return index
+    
+    def _emit(self):
+        """Count an event and flush the buffer if it is large enough."""
+        self.events += 1
+        if len(self._buffer) >= FLUSH_THRESHOLD:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+    
+    def dispatch(self, process_id, time):
+        """
+        Record that a process got the CPU.
+        
+        Args:
+            process_id (str): Process ID
+            time (int): Dispatch time
+        """
+        index = self._intern(process_id)
+        encode_varint((index << 3) | OP_DISPATCH, self._buffer)
+        encode_varint(self._delta(time), self._buffer)
+        self._emit()
+    
+    def preempt(self, time):
+        """
+        Record that the running process was preempted.
+        
+        Args:
+            time (int): Preemption time
+        """
+        encode_varint((self._delta(time) << 3) | OP_PREEMPT, self._buffer)
+        self._emit()
+    
+    def complete(self, time):
+        """
+        Record that the running process finished.
+        
+        Args:
+            time (int): Completion time
+        """
+        encode_varint((self._delta(time) << 3) | OP_COMPLETE, self._buffer)
+        self._emit()
+    
+    def idle(self, start, end):
+        """
+        Record a CPU idle period.
+        
+        Args:
+            start (int): Idle start time
+            end (int): Idle end time
+        """
+        encode_varint((self._delta(start) << 3) | OP_IDLE, self._buffer)
+        encode_varint(self._delta(end), self._buffer)
+        self._emit()
+    
+    def record_slice(self, process_id, start, end, finished):
+        """
+        Record one Gantt chart slice as dispatch + preempt/complete events.
+        
+        Args:
+            process_id (str): Process ID (or 'IDLE')
+            start (int): Slice start time
+            end (int): Slice end time
+            finished (bool): True if the process completed at `end`
+        """
+        if process_id == 'IDLE':
+            self.idle(start, end)
+            return
+        self.dispatch(process_id, start)
+        if finished:
+            self.complete(end)
+        else:
+            self.preempt(end)
+    
+    def checkpoint_state(self):
+        """
+        Flush buffered events and capture the writer state for a checkpoint.
+        
+        Returns:
+            dict: File offset, interned IDs, clock and event count
+        """
+        self._file.write(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+        return {'offset': self._file.tell(), 'ids': dict(self._ids),
+                'last_time': self._last_time, 'events': self.events}
+    
+    @classmethod
+    def resume(cls, file_path, state):
+        """
+        Reopen a trace at a checkpointed offset, discarding anything after it.
+        
+        Args:
+            file_path (str): Trace file being resumed
+            state (dict): Result of checkpoint_state()
+        
+        Returns:
+            TraceWriter: Writer positioned to append the next event
+        """
+        writer = cls.__new__(cls)
+        writer.file_path = file_path
+        writer._file = open(file_path, 'r+b')
+        writer._file.truncate(state['offset'])
+        writer._file.seek(state['offset'])
+        writer._buffer = bytearray()
+        writer._ids = dict(state['ids'])
+        writer._last_time = state['last_time']
+        writer.events = state['events']
+        return writer
+    
+    def close(self):
+        """Flush remaining events and close the file."""
+        if self._file.closed:
+            return
+        self._file.write(self._buffer)
+        self._buffer.clear()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class TraceReader:
+    """
+    Memory-mapped reader for trace files written by TraceWriter.
+    Iteration decodes events lazily, so huge traces are never fully loaded.
+    """
+    
+    def __init__(self, file_path):
+        """
+        Open and validate a trace file.
+        
+        Args:
+            file_path (str): Trace file path
+        
+        Raises:
+            ValueError: If the file is not a supported trace
+        """
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"'{file_path}' is empty, not a trace file")
+        
+        if self._data[:4] != MAGIC or len(self._data) < 6:
+            self.close()
+            raise ValueError(f"'{file_path}' is not a scheduling trace file")
+        if self._data[4] != VERSION:
+            version = self._data[4]
+            self.close()
+            raise ValueError(f"Unsupported trace version {version}")
+        
+        length, offset = decode_varint(self._data, 5)
+        self.algorithm = self._data[offset:offset + length].decode('utf-8')
+        self._records_offset = offset + length
+    
+    def iter_events(self):
+        """
+        Decode events in file order.
+        
+        Yields:
+            tuple: (event, process_id, time) for 'dispatch', 'preempt' and
+                   'complete'; ('idle', 'IDLE', start, end) for idle periods
+        """
+        data = self._data
+        size = len(data)
+        offset = self._records_offset
+        names = []
+        running = None
+        time = 0
+        
+        while offset < size:
+            tag, offset = decode_varint(data, offset)
+            opcode = tag & 0x7
+            arg = tag >> 3
+            
+            if opcode == OP_DEFINE:
+                names.append(data[offset:offset + arg].decode('utf-8'))
+                offset += arg
+            elif opcode == OP_DISPATCH:
+                delta, offset = decode_varint(data, offset)
+                time += delta
+                running = names[arg]
+                yield ('dispatch', running, time)
+            elif opcode == OP_PREEMPT:
+                time += arg
+                yield ('preempt', running, time)
+            elif opcode == OP_COMPLETE:
+                time += arg
+                yield ('complete', running, time)
+            elif opcode == OP_IDLE:
+                start = time + arg
+                duration, offset = decode_varint(data, offset)
+                time = start + duration
+                yield ('idle', 'IDLE', start, time)
+            else:
+                raise ValueError(f"Corrupt trace: unknown opcode {opcode} at byte {offset}")
+    
+    def iter_gantt(self):
+        """
+        Rebuild the Gantt chart from the events.
+        
+        Yields:
+            tuple: (process_id, start_time, end_time), as in the run_* Gantt charts
+        """
+        start = None
+        for event in self.iter_events():
+            kind = event[0]
+            if kind == 'dispatch':
+                start = event[2]
+            elif kind == 'idle':
+                yield ('IDLE', event[2], event[3])
+            else:
+                yield (event[1], start, event[2])
+    
+    def summary(self):
+        """
+        Compute run statistics in one pass over the trace.
+        
+        Returns:
+            dict: slices, completed, makespan, busy_time and cpu_utilization (%)
+        """
+        slices = completed = busy = 0
+        first_start = last_end = None
+        for process_id, start, end in self.iter_gantt():
+            slices += 1
+            if first_start is None:
+                first_start = start
+            last_end = end
+            if process_id != 'IDLE':
+                busy += end - start
+        
+        for event in self.iter_events():
+            if event[0] == 'complete':
+                completed += 1
+        
+        total = (last_end - first_start) if slices else 0
+        return {
+            'slices': slices,
+            'completed': completed,
+            'makespan': last_end or 0,
+            'busy_time': busy,
+            'cpu_utilization': (busy / total * 100) if total else 0.0,
+        }
+    
+    def close(self):
+        """Release the memory map and the file."""
+        self._data.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def trace_path(trace_dir, input_path, algorithm_key):
+    """
+    Path of the trace written for one algorithm run.
+    
+    Args:
+        trace_dir (str): Output directory
+        input_path (str): Workload file the run is based on
+        algorithm_key (str): Short algorithm name, e.g. "rr"
+    
+    Returns:
+        str: Trace file path
+    """
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(trace_dir, f"{stem}_{algorithm_key}{TRACE_EXTENSION}")
+
+
+def can_resume_trace(trace_dir, input_path, algorithm_key, resume_state):
+    """
+    Check that a checkpointed run can continue its trace.
+    A run resumed with tracing needs the writer state saved in the checkpoint
+    and the trace file it refers to; otherwise the events before the
+    checkpoint are missing and the run has to start over.
+    
+    Args:
+        trace_dir (str): Output directory; None means no trace is written
+        input_path (str): Workload file the run is based on
+        algorithm_key (str): Short algorithm name, e.g. "rr"
+        resume_state (dict): Writer state from the checkpoint, or None
+    
+    Returns:
+        bool: True if the trace can be resumed (or no trace is written)
+    """
+    if not trace_dir:
+        return True
+    if not resume_state:
+        return False
+    file_path = trace_path(trace_dir, input_path, algorithm_key)
+    return os.path.isfile(file_path) and os.path.getsize(file_path) >= resume_state['offset']
+
+
+def trace_writer_for(trace_dir, input_path, algorithm_key, label, resume_state=None):
+    """
+    Context manager yielding a TraceWriter for one algorithm run, or None.
+    
+    Args:
+        trace_dir (str): Output directory; None disables tracing
+        input_path (str): Workload file the run is based on (names the trace)
+        algorithm_key (str): Short algorithm name, e.g. "rr"
+        label (str): Algorithm label stored in the trace header
+        resume_state (dict): Writer state from a run checkpoint; appends to the
+                             existing trace instead of starting a new one
+                             (check it first with can_resume_trace())
+    
+    Returns:
+        Context manager: yields a TraceWriter (closed on exit) or None
+    
+    Raises:
+        FileNotFoundError: If resume_state is given but the trace file is missing
+    """
+    if not trace_dir:
+        return contextlib.nullcontext(None)
+    
+    os.makedirs(trace_dir, exist_ok=True)
+    file_path = trace_path(trace_dir, input_path, algorithm_key)
+    if resume_state:
+        return TraceWriter.resume(file_path, resume_state)
+    return TraceWriter(file_path, label)
@@ -0,0 +1,130 @@
+# Prepared workloads shared by every engine of a run
+# Each run_* function used to deep-copy the input and sort it by arrival
+# time, so comparing four algorithms (or one algorithm at several quanta)
+# repeated the same O(n log n) preparation each time. A PreparedWorkload
+# does it once: it snapshots the processes into arrival-ordered columns
+# and precomputes what the engines look up repeatedly. It is never
+# modified after construction, so any number of engines can share it.
+#
+# Engines still need their own mutable Process objects (they record start,
+# finish and remaining times on them); copy_processes() builds fresh ones
+# from the columns, which is several times cheaper than copy.deepcopy.
+
+import bisect
+import itertools
+import sys
+
+from src.model import Process
+
+
+class PreparedWorkload:
+    """
+    Read-only, arrival-ordered snapshot of a workload.
+    
+    Attributes:
+        order (tuple): Input position of each process, in arrival order
+                       (stable: equal arrival times keep their input order)
+        ids (tuple): Interned process IDs, in arrival order
+        arrivals (tuple): Arrival times, ascending
+        bursts (tuple): Burst times, in arrival order
+        priorities (tuple): Priorities, in arrival order
+        io_bursts (tuple): CPU/I-O burst sequences (None for single-burst processes)
+        deadlines (tuple): Absolute deadlines (None for processes without one)
+        burst_prefix (tuple): burst_prefix[i] is the total burst time of the first i processes
+        distinct_arrivals (tuple): Distinct arrival times, ascending
+        index_of (dict): Process ID -> position in arrival order (the ID intern table)
+        has_io (bool): True if any process has I/O bursts
+        has_deadlines (bool): True if any process has a deadline
+    """
+    
+    def __init__(self, processes):
+        """
+        Prepare a workload.
+        
+        Args:
+            processes (iterable): Process objects (read, not modified or kept)
+        """
+        processes = list(processes)
+        self.order = tuple(sorted(range(len(processes)), key=lambda i: processes[i].arrival_time))
+        ordered = [processes[i] for i in self.order]
+        
+        # Interned IDs make the dict lookups of trace writers and engines pointer comparisons
+        self.ids = tuple(sys.intern(p.process_id) for p in ordered)
+        self.arrivals = tuple(p.arrival_time for p in ordered)
+        self.bursts = tuple(p.burst_time for p in ordered)
+        self.priorities = tuple(p.priority for p in ordered)
+        self.io_bursts = tuple(p.bursts for p in ordered)
+        self.has_io = any(self.io_bursts)
+        self.deadlines = tuple(p.deadline for p in ordered)
+        self.has_deadlines = any(deadline is not None for deadline in self.deadlines)
+        
+        self.burst_prefix = tuple(itertools.accumulate(self.bursts, initial=0))
+        self.distinct_arrivals = tuple(arrival for arrival, _ in itertools.groupby(self.arrivals))
+        self.index_of = {}
+        for position, process_id in enumerate(self.ids):
+            self.index_of.setdefault(process_id, position)
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def copy_processes(self):
+        """
+        Build mutable Process objects for one engine run.
+        
+        Returns:
+            list: New Process objects in arrival order
+        """
+        return list(map(Process, self.ids, self.arrivals, self.bursts, self.priorities, self.io_bursts,
+                        self.deadlines))
+    
+    def next_arrival(self, time):
+        """
+        First arrival strictly after a time.
+        
+        Args:
+            time (int): Current time
+        
+        Returns:
+            int: Next arrival time, or None if every process has arrived
+        """
+        index = bisect.bisect_right(self.distinct_arrivals, time)
+        return self.distinct_arrivals[index] if index < len(self.distinct_arrivals) else None
+    
+    def arrived_by(self, time):
+        """
+        Number of processes that have arrived at a time (arrival <= time).
+        
+        Args:
+            time (int): Time
+        
+        Returns:
+            int: Count, which is also the arrival-order position of the next arrival
+        """
+        return bisect.bisect_right(self.arrivals, time)
+    
+    def work_arrived_by(self, time):
+        """
+        Total burst time of the processes that have arrived at a time.
+        
+        Args:
+            time (int): Time
+        
+        Returns:
+            int: Sum of burst times with arrival <= time
+        """
+        return self.burst_prefix[self.arrived_by(time)]
+
+
+def prepare_workload(processes):
+    """
+    Prepare a workload, or pass an already prepared one through.
+    
+    Args:
+        processes (list | PreparedWorkload): Process objects or a prepared workload
+    
+    Returns:
+        PreparedWorkload: Workload ready to share between engines
+    """
+    if isinstance(processes, PreparedWorkload):
+        return processes
+    return PreparedWorkload(processes)